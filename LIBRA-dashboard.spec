@@ -1,19 +1,30 @@
 # -*- mode: python ; coding: utf-8 -*-
-
+#
+# By default, the dashboard is built as a directory (onedir), which starts without unpacking the
+# bundle to a temporary directory on every launch. Set LIBRA_DASHBOARD_ONEFILE=1 to build the single
+# executable instead.
+import os
 
 block_cipher = None
+onefile = os.environ.get("LIBRA_DASHBOARD_ONEFILE") == "1"
+name = 'LIBRA-dashboard_0.0.5'
 
+# Packages which are installed in development environments but not used by the dashboard.
+excludes = [
+    'tkinter', 'matplotlib', 'IPython', 'ipykernel', 'jupyter_client', 'jupyter_core', 'notebook',
+    'nbformat', 'jedi', 'pytest', 'sphinx', 'docutils', 'scipy', 'PyQt5', 'PySide2', 'PySide6',
+]
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('./src/components/*', 'src/components'), ('./src/data/*', 'src/data'), ('./src/plotting_functions/*', 'src/plotting_functions'), ('./environment/*', 'environment'), ('./assets/*', 'assets')],
+    datas=[('./assets/*', 'assets')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -21,20 +32,13 @@ a = Analysis(
 )
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='LIBRA-dashboard_0.0.5',
+exe_options = dict(
+    name=name,
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
     upx_exclude=[],
-    runtime_tmpdir=None,
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -43,3 +47,33 @@ exe = EXE(
     entitlements_file=None,
     icon='assets/icons.ico',
 )
+
+if onefile:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        [],
+        runtime_tmpdir=None,
+        **exe_options,
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        **exe_options,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        name=name,
+    )
@@ -0,0 +1,5 @@
+"""
+Benchmarks for the LIBRA dashboard. Run individual benchmarks from the repository root, e.g.
+`python -m benchmarks.bench_arrayval_dropdowns`, or the whole suite with
+`python -m benchmarks.bench_suite --output results.json`.
+"""
@@ -0,0 +1,127 @@
+"""
+Micro-benchmark of the array value dropdown path (`selection_state.create_options_and_value`).
+
+Compares the current implementation, which reads the members observed in the uploaded data from
+the name index, against a reference copy of the original implementation, which classified array
+values with a `match` statement and rebuilt and sorted the array type members twice per dropdown.
+"""
+import timeit
+
+from src.components.selection_state import create_options_and_value
+from src.data.LIBRAOutputNamesParser import natural_sort_key
+from src.data.dimension_aggregates import ALL_MEMBERS
+from src.plotting_functions.basedatatypes import ArrayType, InvalidArrayTypeError
+
+NUM_DROPDOWNS = 3
+NUM_PANELS = 2
+
+
+def _legacy_assign_data_type(value: str) -> ArrayType:
+    match value:
+        case "US" | "ROW" | "region":
+            return ArrayType.REGION
+        case "BEV" | "PHEV" | "VBattType":
+            return ArrayType.V_BATT_TYPE
+        case "Co" | "Li" | "Ni" | "mineral":
+            return ArrayType.MINERAL
+        case "Hydro" | "Pyro" | "process":
+            return ArrayType.PROCESS
+        case "LFP" | "LCO" | "NCA" | "LMO" | "NMC111" | "NMC442" | "NMC532" | "NMC622" | "NMC811" | "NMC955" | "chemistry":
+            return ArrayType.BATTERY_CHEMISTRY
+        case "Grid" | "storage_batt_type":
+            return ArrayType.STORAGE_BATT_TYPE
+        case "Price" | "Feedstock" | "FCI" | "Loan" | "ConversionPolicy":
+            return ArrayType.CONVERSION_POLICY
+        case "ProcessYield" | "PSuccess" | "InputCap" | "CapitalCost" | "Risk" | "DebtFrac" | "techattribute":
+            return ArrayType.TECH_ATTRIBUTE
+        case "TrainRail" | "Road" | "transport":
+            return ArrayType.TRANSPORT
+        case 'D&C1' | 'D&C2' | 'D&C3' | 'Yr1' | 'Yr2' | 'Yr3' | 'Yr4' | 'Yr5' | 'Yr6' | 'Yr7' | 'Yr8' | 'Yr9' | 'Yr10' | 'Yr11' | 'Yr12' | 'Yr13' | 'Yr14' | 'Yr15' | 'Yr16' | 'Yr17' | 'Yr18' | 'Yr19' | 'Yr20' | 'Yr21' | 'Yr22' | 'Yr23' | 'Yr24' | 'Yr25' | 'Yr26' | 'Yr27' | 'Yr28' | 'Yr29' | 'Yr30' | "ProjectYear":
+            return ArrayType.PROJECT_YEAR
+        case _:
+            raise InvalidArrayTypeError(f"{value} is not a valid LIBRA array variable.")
+
+
+def _legacy_enumerate_array_type(input) -> list[str]:
+    match ArrayType(input):
+        case ArrayType.REGION:
+            return ["US", "ROW"]
+        case ArrayType.V_BATT_TYPE:
+            return ["BEV", "PHEV"]
+        case ArrayType.BATTERY_CHEMISTRY:
+            return ["LCO", "LFP", "LMO", "NCA", "NMC111", "NMC442", "NMC532", "NMC622", "NMC811", "NMC955"]
+        case ArrayType.MINERAL:
+            return ["Ni", "Co", "Li"]
+        case ArrayType.PROCESS:
+            return ["Hydro", "Pyro"]
+        case ArrayType.STORAGE_BATT_TYPE:
+            return ["Grid"]
+        case ArrayType.CONVERSION_POLICY:
+            return ["Price", "Feedstock", "FCI", "Loan"]
+        case ArrayType.TECH_ATTRIBUTE:
+            return ["ProcessYield", "PSuccess", "InputCap", "CapitalCost", "Risk", "DebtFrac"]
+        case ArrayType.TRANSPORT:
+            return ["TrainRail", "Road"]
+        case ArrayType.PROJECT_YEAR:
+            return [f"D&C{i+1}" for i in range(3)]+[f"Yr{j+1}" for j in range(30+1)]
+    return []
+
+
+def _legacy_create_options_and_value(
+        module: str,
+        variable: str,
+        array_val_dict: dict[str, list[str]],
+        i: int) -> tuple[list[dict[str, str]], str]:
+    if module == "None" or variable == "None":
+        return [dict(value="None", label="None")], "None"
+    try:
+        data_types = [_legacy_assign_data_type(val) for val in array_val_dict[f"{module}.{variable}"] if val]
+    except Exception:
+        return [dict(value="None", label="None")], "None"
+    if not data_types or i >= len(data_types):
+        return [dict(value="None", label="None")], "None"
+    options = [dict(label=val, value=val)
+               for val in sorted(_legacy_enumerate_array_type(data_types[i]))]
+    value = sorted(_legacy_enumerate_array_type(data_types[i]))[0]
+    return options, value
+
+
+def _variable_change(create_options_and_value, module, variable, array_val_dict) -> None:
+    """All array value dropdowns of all panels being updated after a variable change."""
+    for _ in range(NUM_PANELS):
+        for i in range(NUM_DROPDOWNS):
+            create_options_and_value(module, variable, array_val_dict, i)
+
+
+def main(number: int = 20_000) -> None:
+    array_val_dict = {
+        "Minerals Market.price": ["ROW", "Li"],
+        "RIRA.project cash flow": ["US", "Hydro", "Yr1"],
+        "Battery Market.demand": ["US", "BEV", "NMC811"],
+    }
+    # Name index with the same members as the hardcoded array types.
+    array_members_dict = {
+        variable: [sorted(_legacy_enumerate_array_type(_legacy_assign_data_type(val)), key=natural_sort_key)
+                   for val in array_vals]
+        for variable, array_vals in array_val_dict.items()
+    }
+    for variable in array_val_dict:
+        module, variable_name = variable.split(".")
+        legacy_options, _ = _legacy_create_options_and_value(module, variable_name, array_val_dict, 1)
+        options, _ = create_options_and_value(module, variable_name, array_members_dict, 1)
+        # The "All (sum)" and "All (mean)" options select aggregates, which the legacy dropdowns did not offer.
+        assert sorted(option["value"] for option in legacy_options) == sorted(
+            option["value"] for option in options if option["value"] not in ALL_MEMBERS)
+
+        legacy = min(timeit.repeat(
+            lambda: _variable_change(_legacy_create_options_and_value, module, variable_name, array_val_dict),
+            number=number, repeat=3))
+        current = min(timeit.repeat(
+            lambda: _variable_change(create_options_and_value, module, variable_name, array_members_dict),
+            number=number, repeat=3))
+        print(f"{variable:<32} legacy: {1e6*legacy/number:8.2f} us  "
+              f"name index: {1e6*current/number:8.2f} us  speedup: {legacy/current:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
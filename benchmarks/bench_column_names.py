@@ -0,0 +1,44 @@
+"""
+Benchmark of the column name normalization of `src.data.column_names` against the former
+`fix_col_names`, which renamed the STELLA-quoted columns one by one through `DataFrame.rename`, across
+column counts of synthetic LIBRA outputs with STELLA quoting. Before timing, checks that both give the
+same names for these outputs, which have no whitespace to normalize and no duplicate names.
+"""
+import timeit
+
+import pandas as pd
+
+from src.data.column_names import normalize_columns
+from .synthetic_data import SyntheticLIBRAOutputs
+
+VARIABLES_PER_MODULE = [10, 40, 160]
+NUM_RUNS = 4
+
+
+def fix_col_names(df: pd.DataFrame) -> None:
+    """The former normalization: removes "=" and " from the names starting with "="."""
+    col_names_to_change = df.columns[df.columns.str.startswith("=")].tolist()
+    changed_col_names = [col.replace("=", "") for col in col_names_to_change]
+    changed_col_names = [col.replace("\"", "") for col in changed_col_names]
+    df.rename(columns=dict(zip(col_names_to_change, changed_col_names)), inplace=True)
+
+
+def main() -> None:
+    for variables_per_module in VARIABLES_PER_MODULE:
+        outputs = SyntheticLIBRAOutputs(
+            num_runs=NUM_RUNS, variables_per_module=variables_per_module, stella_quoting=True)
+        df = outputs.make_dataframe()
+        expected = df.copy()
+        fix_col_names(expected)
+        pd.testing.assert_index_equal(normalize_columns(df.copy()).columns, expected.columns)
+
+        number = 5
+        former = timeit.timeit(lambda: fix_col_names(df.copy()), number=number) / number
+        vectorized = timeit.timeit(lambda: normalize_columns(df.copy()), number=number) / number
+        print(f"{len(df.columns)} columns:")
+        print(f"  fix_col_names:     {former * 1e3:8.2f} ms")
+        print(f"  normalize_columns: {vectorized * 1e3:8.2f} ms  ({former / vectorized:.1f}x, same names)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark of the CSV parse engines of `src.data.preprocess_data` across column counts, on synthetic
+LIBRA outputs. Before timing, checks that the Arrow engine returns exactly the frame of the pandas
+engine: same columns, index and dtypes, and bit-identical values. The Arrow engine requires pyarrow.
+"""
+import base64
+import timeit
+
+import pandas as pd
+
+from src.data.preprocess_data import HAS_PYARROW, read_csv
+from .synthetic_data import SyntheticLIBRAOutputs
+
+VARIABLES_PER_MODULE = [2, 10, 40]
+NUM_RUNS = 4
+
+
+def check_consistency(decoded: bytes) -> None:
+    """Raise AssertionError if the Arrow and pandas engines parse the CSV into different frames."""
+    pd.testing.assert_frame_equal(
+        read_csv(decoded, "arrow"), read_csv(decoded, "pandas"), check_exact=True, check_column_type=True)
+
+
+def main() -> None:
+    if not HAS_PYARROW:
+        print("pyarrow is not installed: timing the pandas engine only.")
+    for variables_per_module in VARIABLES_PER_MODULE:
+        for stella_quoting in (False, True):
+            outputs = SyntheticLIBRAOutputs(
+                num_runs=NUM_RUNS, variables_per_module=variables_per_module, stella_quoting=stella_quoting)
+            decoded = base64.b64decode(outputs.to_upload_contents().split(",")[1])
+            if HAS_PYARROW:
+                check_consistency(decoded)
+            if stella_quoting:
+                continue
+            number = 3
+            print(f"{len(outputs.column_names())} columns ({len(decoded) / 2**20:.1f} MiB):")
+            pandas_time = timeit.timeit(lambda: read_csv(decoded, "pandas"), number=number) / number
+            print(f"  pandas engine: {pandas_time * 1e3:9.2f} ms")
+            if HAS_PYARROW:
+                arrow_time = timeit.timeit(lambda: read_csv(decoded, "arrow"), number=number) / number
+                print(f"  arrow engine:  {arrow_time * 1e3:9.2f} ms  ({pandas_time / arrow_time:.1f}x, identical frames)")
+
+
+if __name__ == "__main__":
+    main()
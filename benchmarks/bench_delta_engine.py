@@ -0,0 +1,49 @@
+"""
+Micro-benchmark of the delta engine (`src.data.delta_engine.compute_deltas`) against a per-column
+loop which looks up the baseline column of every variable, on a synthetic dataset.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from src.data.dataset_store import Dataset
+from src.data.delta_engine import DeltaMode, compute_deltas
+
+NUM_RUNS = 10
+NUM_VARIABLES = 1000
+
+
+def _make_dataframe() -> pd.DataFrame:
+    years = pd.Index(np.arange(2015, 2051), name="Years")
+    columns = [f"run {run}: Battery Market.demand[US, Yr{variable}]"
+               for run in range(NUM_RUNS) for variable in range(NUM_VARIABLES)]
+    return pd.DataFrame(np.random.rand(len(years), len(columns)), index=years, columns=columns)
+
+
+def _loop_deltas(df: pd.DataFrame, baseline: str) -> pd.DataFrame:
+    deltas = {}
+    for col in df.columns:
+        run_name, variable = col.split(": ", 1)
+        if run_name != baseline:
+            deltas[f"{run_name} - {baseline}: {variable}"] = df[col] - df[f"{baseline}: {variable}"]
+    return pd.DataFrame(deltas)
+
+
+def main() -> None:
+    df = _make_dataframe()
+    number = 5
+    loop = timeit.timeit(lambda: _loop_deltas(df, "run 0"), number=number) / number
+    vectorized = timeit.timeit(lambda: compute_deltas(df, "run 0", DeltaMode.DIFFERENCE), number=number) / number
+    dataset = Dataset(df=df)
+    dataset.get_deltas("run 0", DeltaMode.DIFFERENCE)
+    cached = timeit.timeit(lambda: dataset.get_deltas("run 0", DeltaMode.DIFFERENCE), number=1000) / 1000
+
+    print(f"{NUM_RUNS} runs x {NUM_VARIABLES} variables x {len(df)} years")
+    print(f"  per-column loop:   {loop * 1e3:9.2f} ms")
+    print(f"  compute_deltas:    {vectorized * 1e3:9.2f} ms  ({loop / vectorized:.1f}x)")
+    print(f"  cached get_deltas: {cached * 1e6:9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
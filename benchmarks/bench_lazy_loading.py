@@ -0,0 +1,49 @@
+"""
+Benchmark of lazy column loading (`src.data.lazy_columns`) against parsing the whole upload, across
+column counts of synthetic LIBRA outputs: the time until the dataset is stored and its names indexed
+(when the dropdowns can be filled), the time to the first selected columns and the time until the
+background parse has finished.
+"""
+import time
+
+import pandas as pd
+
+from src.data.dataset_store import Dataset
+from src.data.lazy_columns import LazyCSVColumns
+from src.data.preprocess_data import decode_contents, preprocess_data
+from .synthetic_data import SyntheticLIBRAOutputs
+
+VARIABLES_PER_MODULE = [5, 20, 80]
+NUM_RUNS = 4
+NUM_SELECTED = 4  # Columns selected by a plot: one variable of every run
+
+
+def main() -> None:
+    for variables_per_module in VARIABLES_PER_MODULE:
+        outputs = SyntheticLIBRAOutputs(num_runs=NUM_RUNS, variables_per_module=variables_per_module)
+        contents = outputs.to_upload_contents()
+        columns = outputs.column_names()
+        selected = columns[len(columns) // 2::len(columns) // NUM_SELECTED][:NUM_SELECTED]
+
+        start = time.perf_counter()
+        eager = Dataset(df=preprocess_data(contents))
+        eager_ready = time.perf_counter() - start
+        expected = eager.get_columns(selected)
+
+        start = time.perf_counter()
+        lazy = Dataset(lazy_columns=LazyCSVColumns.from_csv(decode_contents(contents)))
+        lazy_ready = time.perf_counter() - start
+        selection = lazy.get_columns(selected)
+        first_columns = time.perf_counter() - start
+        lazy.frame()
+        parsed = time.perf_counter() - start
+        pd.testing.assert_frame_equal(selection, expected, check_exact=True)
+
+        print(f"{len(columns)} columns:")
+        print(f"  eager: names indexed after {eager_ready * 1e3:8.1f} ms")
+        print(f"  lazy:  names indexed after {lazy_ready * 1e3:8.1f} ms, first {NUM_SELECTED} columns after "
+              f"{first_columns * 1e3:8.1f} ms, whole file parsed after {parsed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
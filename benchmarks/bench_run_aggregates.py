@@ -0,0 +1,45 @@
+"""
+Compares the figure payload and build time of the line plot of every run against the aggregate
+band plot (`make_aggregate_lineplot`) for an increasing number of runs of one variable.
+"""
+import json
+import timeit
+
+import numpy as np
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+from src.data.dataset_store import Dataset
+from src.plotting_functions.plot_parameters import LinePlotParameters, StyleParameters
+from src.plotting_functions.plotting_functions_plotly import make_aggregate_lineplot, make_lineplot
+
+VARIABLE = "Minerals Market.price[Li]"
+
+
+def _payload_kb(fig) -> float:
+    return len(json.dumps(fig.to_plotly_json(), cls=PlotlyJSONEncoder)) / 1024
+
+
+def main() -> None:
+    years = pd.Index(np.arange(2015, 2051), name="Years")
+    plot_params = LinePlotParameters(
+        module="Minerals Market", variable="price", array_vals=["Li"], title=VARIABLE, y_label="price")
+    print(f"{'runs':>6} {'lines [ms]':>11} {'lines [kB]':>11} {'bands [ms]':>11} {'bands [kB]':>11}")
+    for num_runs in [10, 100, 500]:
+        run_names = [f"run {i}" for i in range(num_runs)]
+        col_names = [f"{run_name}: {VARIABLE}" for run_name in run_names]
+        dataset = Dataset(df=pd.DataFrame(np.random.rand(len(years), num_runs), index=years, columns=col_names))
+        style_params = StyleParameters(stella_run_names=run_names, compare=False)
+
+        lines = make_lineplot(dataset.df, plot_params, style_params)
+        bands = make_aggregate_lineplot(dataset.get_run_aggregates(col_names), plot_params, num_runs=num_runs)
+        lines_time = timeit.timeit(lambda: make_lineplot(dataset.df, plot_params, style_params), number=3) / 3
+        bands_time = timeit.timeit(
+            lambda: make_aggregate_lineplot(dataset.get_run_aggregates(col_names), plot_params, num_runs=num_runs),
+            number=3) / 3
+        print(f"{num_runs:>6} {lines_time * 1e3:>11.1f} {_payload_kb(lines):>11.1f} "
+              f"{bands_time * 1e3:>11.1f} {_payload_kb(bands):>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Counts plot rebuilds per user action in the variable selection chain (variable search, module,
+variable and array value dropdowns) and on tab switches, using the render counters in
+`src.components.render_stats`. Plots of hidden tabs are only rebuilt when their tab is opened.
+"""
+import base64
+
+import numpy as np
+import pandas as pd
+from dash import Dash
+
+from src.components import ids, render_stats
+from src.components.layout import create_layout
+from .dash_driver import DashDriver
+
+
+def _make_contents() -> str:
+    years = np.arange(2015, 2051)
+    cols = {}
+    for run_name in ["baseline", "high demand"]:
+        for region in ["US", "ROW"]:
+            for chemistry in ["LFP", "NCA", "NMC811"]:
+                cols[f"{run_name}: Battery Market.demand[{region}, {chemistry}]"] = np.random.rand(len(years))
+        cols[f"{run_name}: Minerals Market.price[Li]"] = np.random.rand(len(years))
+        for project_year in ["D&C1", "Yr1", "Yr2"]:
+            # RIRA has two variables, so that the variable change selects another than the module change
+            for variable in ["operating cost", "project cash flow"]:
+                cols[f"{run_name}: RIRA.{variable}[US, Hydro, {project_year}]"] = np.random.rand(len(years))
+    csv = pd.DataFrame(cols, index=pd.Index(years, name="Years")).to_csv()
+    return "data:text/csv;base64," + base64.b64encode(csv.encode()).decode()
+
+
+def main() -> None:
+    actions = [
+        ("module change", dict(type=ids.MODULE_DROPDOWN, index=0), "value", "RIRA"),
+        ("variable change", dict(type=ids.VARIABLE_DROPDOWN, index=0), "value", "project cash flow"),
+        ("array value change", dict(type=ids.ARRAYVAL_DROPDOWN_3, index=0), "value", "Yr2"),
+        ("variable search", dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=0), "value",
+         "Battery Market.demand[ROW, NCA]"),
+        ("open comparative tab", ids.TABS, "value", ids.COMPARATIVE_LINEPLOT_TAB),
+        ("open plotted tab", ids.TABS, "value", ids.PLOTTED_DATA_TAB),
+    ]
+    for defer_dependent in [True, False]:
+        app = Dash(__name__)
+        app.layout = create_layout(app)
+        driver = DashDriver(app, defer_dependent=defer_dependent)
+        driver.set_prop(ids.FILE_UPLOADER, "contents", [_make_contents()])
+        driver.set_prop(ids.FILE_UPLOAD_BUTTON, "n_clicks", 1)
+
+        print(f"Renderer {'deferring' if defer_dependent else 'not deferring'} dependent callbacks:")
+        for name, component_id, prop, value in actions:
+            render_stats.plot_rebuilds.clear()
+            calls = driver.set_prop(component_id, prop, value)
+            print(f"  {name:<20} callbacks: {sum(calls.values()):3d}  plot rebuilds: "
+                  + ", ".join(f"{plot_id}[{index}]={count}" for (plot_id, index), count in sorted(render_stats.plot_rebuilds.items())))
+
+
+if __name__ == "__main__":
+    main()
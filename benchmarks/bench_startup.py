@@ -0,0 +1,59 @@
+"""
+Measures the cold start of the dashboard: the time from launching it to the first response of the
+layout endpoint, which is when the browser can render the page.
+
+    python -m benchmarks.bench_startup                      # runs main.py with this interpreter
+    python -m benchmarks.bench_startup dist/LIBRA-dashboard_0.0.5/LIBRA-dashboard_0.0.5
+
+The second form times a PyInstaller build (see LIBRA-dashboard.spec).
+"""
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+URL = "http://127.0.0.1:8050/_dash-layout"
+REPEATS = 3
+TIMEOUT = 120.0
+
+
+def _time_to_first_response(command: list[str]) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command, cwd=Path(__file__).resolve().parents[1], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < TIMEOUT:
+            if process.poll() is not None:
+                raise RuntimeError(f"{' '.join(command)} exited with code {process.returncode}.")
+            try:
+                with urllib.request.urlopen(URL, timeout=1.0) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.02)
+        raise TimeoutError(f"No response from {URL} within {TIMEOUT} s.")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def _import_time(module: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"],
+        cwd=Path(__file__).resolve().parents[1], capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+def main() -> None:
+    command = sys.argv[1:] or [sys.executable, "main.py"]
+    if not sys.argv[1:]:
+        print(f"import src.components.layout: {_import_time('src.components.layout'):6.2f} s")
+    times = [_time_to_first_response(command) for _ in range(REPEATS)]
+    print(f"time to first response ({' '.join(command)}): "
+          f"min {min(times):.2f} s, mean {sum(times) / len(times):.2f} s over {REPEATS} launches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Timed benchmarks of the data loading, name parsing and plotting functions and of callback round
+trips, on synthetic LIBRA outputs (see `benchmarks.synthetic_data`). Results are written as JSON so
+that they can be compared across commits:
+
+    python -m benchmarks.bench_suite --output before.json
+    python -m benchmarks.bench_suite --output after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from dash import Dash
+
+from src.components import ids
+from src.components.layout import create_layout
+from src.data.LIBRAOutputNamesParser import LIBRAOutputNamesParser
+from src.data.preprocess_data import preprocess_data
+from src.plotting_functions.plot_parameters import LinePlotParameters, StackPlotParameters, StyleParameters
+from src.plotting_functions.plotting_functions_plotly import (
+    make_comparative_lineplots, make_lineplot, make_stackplot)
+from .dash_driver import DashDriver
+from .synthetic_data import SyntheticLIBRAOutputs
+
+SIZES = dict(
+    small=SyntheticLIBRAOutputs(num_runs=2, variables_per_module=5),
+    medium=SyntheticLIBRAOutputs(num_runs=6, variables_per_module=15),
+    large=SyntheticLIBRAOutputs(num_runs=12, variables_per_module=30),
+)
+
+
+def _time(function: Callable[[], object], repeats: int) -> dict[str, float]:
+    """Wall times of the function in seconds: minimum and median over the repeats."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return dict(min=min(times), median=statistics.median(times))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=Path(__file__).resolve().parents[1]).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _bench_size(outputs: SyntheticLIBRAOutputs, repeats: int) -> dict[str, dict[str, float]]:
+    contents = outputs.to_upload_contents()
+    df = preprocess_data(contents)
+    names_parser = LIBRAOutputNamesParser()
+    names_parser.parse_names_from_dataframe(df)
+
+    variable_name = next(name for name, members in names_parser.array_members_dict.items() if len(members) >= 2)
+    module, variable = variable_name.split(".", 1)
+    array_vals = [members[0] for members in names_parser.array_members_dict[variable_name]]
+    run_names = sorted(set(col.split(":")[0] for col in df.columns))
+    line_params = LinePlotParameters(
+        module=module, variable=variable, array_vals=array_vals, title=variable_name, y_label=variable_name)
+    stack_params = StackPlotParameters(
+        module=module, variable=variable, array_vals=array_vals, title=variable_name, y_label=variable_name,
+        stack_members=names_parser.array_members_dict[variable_name][len(array_vals) - 1])
+    style_params = StyleParameters(stella_run_names=run_names, compare=False)
+
+    results = dict(
+        preprocess_data=_time(lambda: preprocess_data(contents), repeats),
+        parse_names_from_dataframe=_time(
+            lambda: LIBRAOutputNamesParser().parse_names_from_dataframe(df), repeats),
+        make_lineplot=_time(lambda: make_lineplot(df, line_params, style_params), repeats),
+        make_comparative_lineplots=_time(
+            lambda: make_comparative_lineplots(df, line_params, style_params), repeats),
+        make_stackplot=_time(lambda: make_stackplot(df, stack_params, run_names[0]), repeats),
+    )
+
+    app = Dash(__name__)
+    app.layout = create_layout(app)
+    driver = DashDriver(app)
+    results["callbacks_upload"] = _time(lambda: (
+        driver.set_prop(ids.FILE_UPLOADER, "contents", [contents]),
+        driver.set_prop(ids.FILE_UPLOAD_BUTTON, "n_clicks", (driver.get_prop(ids.FILE_UPLOAD_BUTTON, "n_clicks") or 0) + 1)),
+        repeats)
+    modules = [option["value"] for option in driver.get_prop(dict(type=ids.MODULE_DROPDOWN, index=0), "options")]
+    results["callbacks_module_change"] = _time(
+        lambda: [driver.set_prop(dict(type=ids.MODULE_DROPDOWN, index=0), "value", module) for module in modules[:2]],
+        repeats)
+    results["callbacks_tab_switch"] = _time(lambda: [
+        driver.set_prop(ids.TABS, "value", tab) for tab in [ids.COMPARATIVE_LINEPLOT_TAB, ids.PLOTTED_DATA_TAB]],
+        repeats)
+    return results
+
+
+def _compare(results: dict, baseline: dict) -> None:
+    print(f"\nComparison against {baseline.get('commit')} (median time, new / old):")
+    for size, benchmarks in results["benchmarks"].items():
+        for name, timing in benchmarks.items():
+            old = baseline.get("benchmarks", {}).get(size, {}).get(name)
+            if old:
+                print(f"  {size:<7} {name:<28} {timing['median'] / old['median']:6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the LIBRA dashboard benchmark suite.")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--compare", type=Path, help="JSON results of an earlier run to compare against.")
+    args = parser.parse_args()
+
+    results = dict(
+        commit=_git_commit(),
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        repeats=args.repeats,
+        datasets={},
+        benchmarks={},
+    )
+    for size in args.sizes:
+        outputs = SIZES[size]
+        results["datasets"][size] = dict(columns=len(outputs.column_names()), runs=outputs.num_runs,
+                                         years=outputs.end_year - outputs.start_year + 1)
+        results["benchmarks"][size] = _bench_size(outputs, args.repeats)
+        print(f"{size} ({results['datasets'][size]['columns']} columns):")
+        for name, timing in results["benchmarks"][size].items():
+            print(f"  {name:<28} min {timing['min'] * 1e3:9.2f} ms  median {timing['median'] * 1e3:9.2f} ms")
+
+    args.output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {args.output}.")
+    if args.compare:
+        _compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Times building and querying the variable search index (`src.data.variable_search_index`) for an
+increasing number of full variable names, against a linear substring scan of all names.
+"""
+import random
+import timeit
+
+from src.data.variable_search_index import VariableSearchIndex
+
+MODULES = ["Battery Market", "Minerals Market", "RIRA", "Vehicle Market", "Recycling", "Cathode"]
+VARIABLES = ["demand", "price", "capacity", "project cash flow", "production"]
+QUERIES = ["cash flo", "minrals price", "var123", "recycling capacity us"]
+
+
+def _make_names(num_names: int) -> list[str]:
+    rng = random.Random(0)
+    return [f"{rng.choice(MODULES)}.{rng.choice(VARIABLES)} {i}[{rng.choice(['US', 'ROW'])}, Yr{i % 31}]"
+            for i in range(num_names)]
+
+
+def main() -> None:
+    print(f"{'names':>8} {'build [s]':>10} {'search [ms]':>12} {'scan [ms]':>10}")
+    for num_names in [1_000, 10_000, 100_000]:
+        names = _make_names(num_names)
+        build = timeit.timeit(lambda: VariableSearchIndex(names), number=1)
+        index = VariableSearchIndex(names)
+        search = timeit.timeit(lambda: [index.search(query) for query in QUERIES], number=10) / (10 * len(QUERIES))
+        scan = timeit.timeit(
+            lambda: [[name for name in names if query in name.lower()] for query in QUERIES],
+            number=10) / (10 * len(QUERIES))
+        print(f"{num_names:>8} {build:>10.2f} {search * 1e3:>12.2f} {scan * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
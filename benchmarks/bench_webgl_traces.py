@@ -0,0 +1,52 @@
+"""
+Compares the figure payload and build time of the line plot and the comparative line plots drawn
+with SVG (`go.Scatter`) and with WebGL (`go.Scattergl`) traces, for an increasing number of runs of
+one variable. The browser rendering time, which is what WebGL improves, is not measured here.
+"""
+import json
+import timeit
+
+import numpy as np
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+from src.plotting_functions.plot_parameters import LinePlotParameters, StyleParameters
+from src.plotting_functions.plotting_functions_plotly import (
+    WEBGL_POINT_THRESHOLD, make_comparative_lineplots, make_lineplot)
+
+VARIABLE = "Minerals Market.price[Li]"
+NUM_RUNS = [10, 100, 500]
+SETTINGS = dict(svg=None, webgl=0)  # webgl_point_threshold of the builders
+
+
+def _payload_kb(fig) -> float:
+    return len(json.dumps(fig.to_plotly_json(), cls=PlotlyJSONEncoder)) / 1024
+
+
+def main() -> None:
+    years = pd.Index(np.arange(2015, 2051), name="Years")
+    plot_params = LinePlotParameters(
+        module="Minerals Market", variable="price", array_vals=["Li"], title=VARIABLE, y_label="price")
+    print(f"Line plots switch to WebGL above {WEBGL_POINT_THRESHOLD} points.")
+    print(f"{'runs':>6} {'plot':>12} {'traces':>7} {'build [ms]':>11} {'payload [kB]':>13}")
+    for num_runs in NUM_RUNS:
+        run_names = [f"run {i}" for i in range(num_runs)]
+        df = pd.DataFrame(np.random.rand(len(years), num_runs), index=years,
+                          columns=[f"{run_name}: {VARIABLE}" for run_name in run_names])
+        style_params = StyleParameters(stella_run_names=run_names, compare=False)
+        builders = dict(lines=make_lineplot, comparative=make_comparative_lineplots)
+        for plot, builder in builders.items():
+            if plot == "comparative" and num_runs > 100:
+                continue  # One subplot per run
+            for setting, threshold in SETTINGS.items():
+                def build():
+                    return builder(df, plot_params, style_params, webgl_point_threshold=threshold)
+
+                fig = build()
+                assert {trace.type for trace in fig.data} == {"scatter" if threshold is None else "scattergl"}
+                build_time = timeit.timeit(build, number=3) / 3
+                print(f"{num_runs:>6} {plot:>12} {setting:>7} {build_time * 1e3:>11.1f} {_payload_kb(fig):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
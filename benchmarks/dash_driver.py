@@ -0,0 +1,147 @@
+"""
+Minimal emulation of the Dash renderer, which drives the callbacks of an app through the Flask
+test client. Used by the benchmarks to count callback invocations per user action.
+
+With `defer_dependent=True`, a triggered callback waits while any of its inputs are outputs of
+other pending callbacks, like the Dash renderer does. With `defer_dependent=False`, every
+callback fires as soon as one of its inputs changes, which is the worst case of a callback chain.
+
+Pattern-matching callbacks using MATCH are expanded into one concrete callback per panel index
+found in the layout. Dict ids are keyed by their JSON string form, as in the Dash renderer.
+"""
+import json
+from collections import Counter
+from dash import Dash
+
+_MATCH = '["MATCH"]'
+
+
+def stringify_id(component_id) -> str:
+    """Returns the string form of a component id, which the renderer uses for dict ids."""
+    if isinstance(component_id, dict):
+        return json.dumps(component_id, sort_keys=True, separators=(",", ":"))
+    return component_id
+
+
+class DashDriver:
+    """Holds the component properties of an app and fires its callbacks when a property is set."""
+
+    def __init__(self, app: Dash, defer_dependent: bool = True) -> None:
+        self.app = app
+        self.defer_dependent = defer_dependent
+        self.client = app.server.test_client()
+        self.state: dict[tuple[str, str], object] = {}
+        self.calls: Counter = Counter()
+        self.indices: set[str] = set()
+        self._collect_layout_state(app.layout)
+        self.callbacks = []
+        for cb in app._callback_list:
+            if cb.get("clientside_function"):
+                continue
+            for concrete in self._expand_match(cb):
+                concrete["_outputs"] = self._split_output(concrete["output"])
+                self.callbacks.append(concrete)
+
+    def _collect_layout_state(self, layout) -> None:
+        for component in [layout, *layout._traverse()]:
+            component_id = getattr(component, "id", None)
+            if component_id is None:
+                continue
+            if isinstance(component_id, dict):
+                self.indices.add(json.dumps(component_id.get("index")))
+            component_id = stringify_id(component_id)
+            for prop, value in component.to_plotly_json()["props"].items():
+                if prop != "children":
+                    self.state[(component_id, prop)] = value
+
+    def _expand_match(self, cb: dict) -> list[dict]:
+        if _MATCH not in cb["output"]:
+            return [dict(cb, pattern_output=cb["output"])]
+        expanded = []
+        for index in sorted(self.indices):
+            def substitute(component_id: str) -> str:
+                return component_id.replace(_MATCH, index)
+            expanded.append(dict(
+                cb,
+                pattern_output=cb["output"],
+                output=substitute(cb["output"]),
+                inputs=[dict(i, id=substitute(i["id"])) for i in cb["inputs"]],
+                state=[dict(s, id=substitute(s["id"])) for s in cb["state"]],
+            ))
+        return expanded
+
+    @staticmethod
+    def _parse_id(component_id: str):
+        return json.loads(component_id) if component_id.startswith("{") else component_id
+
+    @staticmethod
+    def _split_output(output: str) -> list[tuple[str, str]]:
+        if output.startswith(".."):
+            parts = output.strip(".").split("...")
+        else:
+            parts = [output]
+        return [tuple(part.rsplit(".", 1)) for part in parts]
+
+    def _request_body(self, cb: dict, changed: set) -> dict:
+        outputs = [dict(id=self._parse_id(i), property=p) for i, p in cb["_outputs"]]
+        inputs = [dict(id=self._parse_id(i["id"]), property=i["property"],
+                       value=self.state.get((i["id"], i["property"])))
+                  for i in cb["inputs"]]
+        state = [dict(id=self._parse_id(s["id"]), property=s["property"],
+                      value=self.state.get((s["id"], s["property"])))
+                 for s in cb["state"]]
+        return dict(output=cb["pattern_output"], outputs=outputs if len(outputs) > 1 else outputs[0],
+                    inputs=inputs, state=state,
+                    changedPropIds=[f"{i['id']}.{i['property']}" for i in cb["inputs"]
+                                    if (i["id"], i["property"]) in changed])
+
+    def get_prop(self, component_id, prop: str):
+        """Returns the current value of a component property."""
+        return self.state.get((stringify_id(component_id), prop))
+
+    def _fire(self, cb: dict, changed: set) -> set:
+        self.calls[cb["output"]] += 1
+        response = self.client.post("/_dash-update-component", json=self._request_body(cb, changed))
+        if response.status_code == 204:
+            return set()
+        assert response.status_code == 200, response.data[:500]
+        updated = set()
+        for component_id, props in response.get_json()["response"].items():
+            for prop, value in props.items():
+                self.state[(component_id, prop)] = value
+                updated.add((component_id, prop))
+        return updated
+
+    def _triggered(self, changed: set) -> list[dict]:
+        return [cb for cb in self.callbacks
+                if any((i["id"], i["property"]) in changed for i in cb["inputs"])]
+
+    def _run(self, changed: set) -> None:
+        pending = {id(cb): (cb, set(changed)) for cb in self._triggered(changed)}
+        while pending:
+            pending_outputs = {out for cb, _ in pending.values() for out in cb["_outputs"]}
+            ready = []
+            for key, (cb, cb_changed) in pending.items():
+                blocked = self.defer_dependent and any(
+                    (i["id"], i["property"]) in pending_outputs and (i["id"], i["property"]) not in cb["_outputs"]
+                    for i in cb["inputs"])
+                if not blocked:
+                    ready.append(key)
+            if not ready:
+                ready = list(pending)
+            for key in ready:
+                cb, cb_changed = pending.pop(key)
+                updated = self._fire(cb, cb_changed)
+                for triggered in self._triggered(updated):
+                    if triggered is cb:
+                        continue
+                    entry = pending.setdefault(id(triggered), (triggered, set()))
+                    entry[1].update(updated)
+
+    def set_prop(self, component_id, prop: str, value) -> Counter:
+        """Set a property as if changed by the user and return the callback invocations it caused."""
+        component_id = stringify_id(component_id)
+        self.calls = Counter()
+        self.state[(component_id, prop)] = value
+        self._run({(component_id, prop)})
+        return self.calls
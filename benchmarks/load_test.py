@@ -0,0 +1,253 @@
+"""
+Load tester replaying recorded Dash callback requests against a running dashboard with concurrent
+simulated users, reporting throughput, latency percentiles and the memory (RSS) of the server over time.
+
+Record a session, either from a browser (start the dashboard with `--record-requests session.jsonl`,
+then use it) or as a scripted session of upload, module change, variable change and title typing on
+synthetic outputs:
+
+    python -m benchmarks.load_test record session.jsonl
+
+Replay it with K users against a dashboard started by the tool, or against one already running:
+
+    python -m benchmarks.load_test replay session.jsonl --users 8 --launch
+    python -m benchmarks.load_test replay session.jsonl --users 8 --server-pid <pid of main.py>
+
+Each user replays the whole session in order, with the recorded think times scaled by `1 / --speed`
+(`--speed 0` sends every request as soon as the previous one is answered). The dataset keys returned
+to a user by its uploads replace the recorded ones in its later requests. A response which is not a
+200 and whose status differs from the recorded one, e.g. 204 for a callback which found no dataset, is
+reported as failed. Updates the recording prevented but the replay made (204 -> 200) are counted apart.
+"""
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from dash import Dash
+
+from src.components import ids
+from src.components.layout import create_layout
+from src.monitoring.request_recorder import record_requests
+from .dash_driver import DashDriver
+from .synthetic_data import SyntheticLIBRAOutputs
+
+UPDATE_COMPONENT_PATH = "/_dash-update-component"
+RSS_SAMPLE_INTERVAL = 0.25  # Seconds
+LAUNCH_TIMEOUT = 120.0
+LOCAL_HOSTS = ("127.0.0.1", "localhost")
+
+
+def record_scripted_session(path: Path, outputs: SyntheticLIBRAOutputs) -> None:
+    """Record a session of upload, module and variable changes and title typing on synthetic outputs."""
+    path.unlink(missing_ok=True)
+    app = Dash(__name__)
+    app.layout = create_layout(app)
+    record_requests(app.server, path)
+    driver = DashDriver(app)
+    driver.set_prop(ids.FILE_UPLOADER, "contents", [outputs.to_upload_contents()])
+    driver.set_prop(ids.FILE_UPLOAD_BUTTON, "n_clicks", 1)
+    for panel_index in (0, 1):
+        modules = [option["value"] for option in driver.get_prop(dict(type=ids.MODULE_DROPDOWN, index=panel_index), "options")]
+        for module in modules[panel_index:panel_index + 2]:
+            driver.set_prop(dict(type=ids.MODULE_DROPDOWN, index=panel_index), "value", module)
+            variables = [option["value"] for option in driver.get_prop(dict(type=ids.VARIABLE_DROPDOWN, index=panel_index), "options")]
+            for variable in variables[:2]:
+                driver.set_prop(dict(type=ids.VARIABLE_DROPDOWN, index=panel_index), "value", variable)
+        title = ""
+        for character in "Demand by region":
+            title += character
+            driver.set_prop(dict(type=ids.TITLE_INPUT, index=panel_index), "value", title)
+    driver.set_prop(ids.TABS, "value", ids.COMPARATIVE_LINEPLOT_TAB)
+    driver.set_prop(ids.TABS, "value", ids.PLOTTED_DATA_TAB)
+    print(f"Recorded {sum(1 for _ in path.open())} requests to {path}.")
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, with psutil if it is installed, else from /proc (Linux)."""
+    if find_spec("psutil"):
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    try:
+        return int(Path(f"/proc/{pid}/statm").read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+@dataclass
+class ReplayResults:
+    latencies: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: Counter = field(default_factory=Counter)
+    # Responses whose status differs from the recorded one, by (recorded, replayed) status
+    mismatches: Counter = field(default_factory=Counter)
+    rss: list[tuple[float, int]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _replay_user(records: list[dict], url: str, speed: float, results: ReplayResults) -> None:
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=300)
+    keys: dict[str, str] = {}
+    start = time.perf_counter()
+    for record in records:
+        if speed > 0:
+            time.sleep(max(0.0, start + record["time"] / speed - time.perf_counter()))
+        body = json.dumps(record["body"])
+        for recorded_key, key in keys.items():
+            body = body.replace(recorded_key, key)
+        request_start = time.perf_counter()
+        connection.request("POST", UPDATE_COMPONENT_PATH, body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        payload = response.read()
+        latency = time.perf_counter() - request_start
+        if response.status == 200 and (record.get("data_storage") or {}).get("key"):
+            data = json.loads(payload)["response"].get(ids.DATA_STORAGE, {}).get("data") or {}
+            if data.get("key"):
+                keys[record["data_storage"]["key"]] = data["key"]
+        # Recordings without statuses expect 200, so that prevented updates (204) count as failures.
+        expected = record.get("status", 200)
+        with results.lock:
+            results.latencies[record["body"]["output"]].append(latency)
+            results.statuses[response.status] += 1
+            if response.status != expected:
+                results.mismatches[(expected, response.status)] += 1
+    connection.close()
+
+
+def _sample_rss(pid: int, results: ReplayResults, done: threading.Event) -> None:
+    start = time.perf_counter()
+    while not done.is_set():
+        rss = _rss_bytes(pid)
+        if rss is not None:
+            results.rss.append((time.perf_counter() - start, rss))
+        done.wait(RSS_SAMPLE_INTERVAL)
+
+
+def _launch_server(url: str) -> subprocess.Popen:
+    parts = urlsplit(url)
+    if parts.hostname not in LOCAL_HOSTS or not parts.port:
+        raise ValueError(f"--launch starts the dashboard on 127.0.0.1, so --url must be local with a port, not {url}.")
+    process = subprocess.Popen([sys.executable, "main.py", "--port", str(parts.port)],
+                               cwd=Path(__file__).resolve().parents[1],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    start = time.perf_counter()
+    while time.perf_counter() - start < LAUNCH_TIMEOUT:
+        if process.poll() is not None:
+            raise RuntimeError(f"main.py exited with code {process.returncode}.")
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=1.0)
+            connection.request("GET", "/_dash-layout")
+            if connection.getresponse().status == 200:
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise TimeoutError(f"No response from {url} within {LAUNCH_TIMEOUT} s.")
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if len(latencies) < 2:
+        return dict(p50=latencies[0], p95=latencies[0], p99=latencies[0], max=latencies[0])
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return dict(p50=quantiles[49], p95=quantiles[94], p99=quantiles[98], max=max(latencies))
+
+
+def replay(records: list[dict], url: str, users: int, speed: float, server_pid: Optional[int]) -> dict:
+    """Replay the recorded requests with `users` concurrent users and return the report."""
+    results = ReplayResults()
+    done = threading.Event()
+    sampler = threading.Thread(target=_sample_rss, args=(server_pid, results, done), daemon=True)
+    if server_pid:
+        sampler.start()
+    threads = [threading.Thread(target=_replay_user, args=(records, url, speed, results)) for _ in range(users)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+    done.set()
+
+    all_latencies = [latency for latencies in results.latencies.values() for latency in latencies]
+    return dict(
+        users=users,
+        requests=len(all_latencies),
+        duration_s=duration,
+        throughput_rps=len(all_latencies) / duration,
+        latency_s=_percentiles(all_latencies),
+        latency_by_callback_s={output: _percentiles(latencies) for output, latencies in results.latencies.items()},
+        statuses={str(status): count for status, count in results.statuses.items()},
+        failed=sum(count for (_, status), count in results.mismatches.items() if status != 200),
+        mismatches={f"{expected} -> {status}": count for (expected, status), count in results.mismatches.items()},
+        rss_bytes=results.rss,
+    )
+
+
+def _print_report(report: dict) -> None:
+    latency = report["latency_s"]
+    print(f"{report['users']} users, {report['requests']} requests in {report['duration_s']:.1f} s: "
+          f"{report['throughput_rps']:.1f} requests/s")
+    print(f"latency p50 {latency['p50'] * 1e3:.0f} ms, p95 {latency['p95'] * 1e3:.0f} ms, "
+          f"p99 {latency['p99'] * 1e3:.0f} ms, max {latency['max'] * 1e3:.0f} ms")
+    print(f"status codes: {report['statuses']}")
+    print(f"failed: {report['failed']} requests ({report['failed'] / max(1, report['requests']):.1%}) "
+          f"without the recorded status; status changes: {report['mismatches'] or 'none'}")
+    print("slowest callbacks (p95):")
+    by_p95 = sorted(report["latency_by_callback_s"].items(), key=lambda item: -item[1]["p95"])
+    for output, callback_latency in by_p95[:5]:
+        print(f"  {callback_latency['p95'] * 1e3:8.0f} ms  {output[:100]}")
+    if report["rss_bytes"]:
+        step = max(1, len(report["rss_bytes"]) // 10)
+        print("server RSS: " + ", ".join(f"{t:.1f} s: {rss / 2**20:.0f} MiB" for t, rss in report["rss_bytes"][::step]))
+        print(f"server peak RSS: {max(rss for _, rss in report['rss_bytes']) / 2**20:.0f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record and replay Dash callback requests of the LIBRA dashboard.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    record_parser = subparsers.add_parser("record", help="Record a scripted session on synthetic outputs.")
+    record_parser.add_argument("path", type=Path)
+    record_parser.add_argument("--runs", type=int, default=4)
+    record_parser.add_argument("--variables-per-module", type=int, default=10)
+    replay_parser = subparsers.add_parser("replay", help="Replay a recorded session with concurrent users.")
+    replay_parser.add_argument("path", type=Path)
+    replay_parser.add_argument("--users", type=int, default=4)
+    replay_parser.add_argument("--url", default="http://127.0.0.1:8050")
+    replay_parser.add_argument("--speed", type=float, default=0.0,
+                               help="Think time scale: 1 replays at the recorded pace, 0 without think time.")
+    replay_parser.add_argument("--launch", action="store_true", help="Start main.py for the replay.")
+    replay_parser.add_argument("--server-pid", type=int, help="Process id of a running dashboard, to sample its RSS.")
+    replay_parser.add_argument("--output", type=Path, help="Write the report as JSON to this file.")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_scripted_session(args.path, SyntheticLIBRAOutputs(
+            num_runs=args.runs, variables_per_module=args.variables_per_module))
+        return
+
+    records = [json.loads(line) for line in args.path.open()]
+    process = _launch_server(args.url) if args.launch else None
+    try:
+        report = replay(records, args.url, args.users, args.speed, process.pid if process else args.server_pid)
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+    _print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Generator of synthetic LIBRA outputs in the vertical layout: a Years column followed by one column
+per run, module, variable and combination of array values, e.g.
+"baseline: Battery Market.demand[US, LFP]".
+
+Modules come from `basedatatypes.Module` and array values from the members of `basedatatypes.ArrayType`.
+Write a CSV file with e.g.
+
+    python -m benchmarks.synthetic_data libra_outputs.csv --runs 10 --variables-per-module 20
+"""
+import argparse
+import base64
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.plotting_functions.basedatatypes import ArrayType, Module
+
+VARIABLE_NAMES = [
+    "demand", "price", "capacity", "production", "cost", "project cash flow", "inventory",
+    "sales", "retirements", "recovered mass", "investment", "utilization",
+]
+
+
+@dataclass(kw_only=True)
+class SyntheticLIBRAOutputs:
+    """Shape of a synthetic LIBRA outputs dataset."""
+    num_runs: int = 4
+    num_modules: int = len(Module)
+    variables_per_module: int = 10
+    max_array_dimensions: int = 3
+    max_members_per_dimension: int = 4
+    start_year: int = 2015
+    end_year: int = 2050
+    stella_quoting: bool = False  # Write some names as ="..." like STELLA exports do
+    seed: int = 0
+
+    def column_names(self) -> list[str]:
+        """Column names of all runs, in the order STELLA writes them."""
+        rng = np.random.default_rng(self.seed)
+        array_types = list(ArrayType)
+        full_variable_names = []
+        for module in list(Module)[:self.num_modules]:
+            for i in range(self.variables_per_module):
+                variable = VARIABLE_NAMES[i % len(VARIABLE_NAMES)]
+                if i >= len(VARIABLE_NAMES):
+                    variable += f" {i // len(VARIABLE_NAMES) + 1}"
+                num_dimensions = rng.integers(0, self.max_array_dimensions + 1)
+                dimensions = rng.choice(len(array_types), size=num_dimensions, replace=False)
+                members = [ArrayType.enumerate_array_type(array_types[d])[:self.max_members_per_dimension]
+                           for d in dimensions]
+                if not members:
+                    full_variable_names.append(f"{module.value}.{variable}")
+                    continue
+                for combination in pd.MultiIndex.from_product(members):
+                    combination = combination if isinstance(combination, tuple) else (combination,)
+                    full_variable_names.append(f"{module.value}.{variable}[{', '.join(combination)}]")
+        run_names = ["baseline"] + [f"scenario {i}" for i in range(1, self.num_runs)]
+        return [f"{run_name}: {name}" for run_name in run_names for name in full_variable_names]
+
+    def make_dataframe(self) -> pd.DataFrame:
+        """Dataframe as read from a LIBRA outputs CSV, indexed by Years. Values are positive random walks."""
+        rng = np.random.default_rng(self.seed)
+        columns = self.column_names()
+        years = pd.Index(np.arange(self.start_year, self.end_year + 1), name="Years")
+        steps = rng.normal(0.02, 0.05, size=(len(years), len(columns)))
+        values = rng.uniform(1, 1000, size=len(columns)) * np.exp(np.cumsum(steps, axis=0))
+        if self.stella_quoting:
+            columns = [f"=\"{col}\"" if i % 7 == 0 else col for i, col in enumerate(columns)]
+        return pd.DataFrame(values, index=years, columns=columns)
+
+    def to_csv(self) -> str:
+        return self.make_dataframe().to_csv()
+
+    def to_upload_contents(self) -> str:
+        """The CSV as the `contents` of a dcc.Upload component."""
+        return "data:text/csv;base64," + base64.b64encode(self.to_csv().encode()).decode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic LIBRA outputs CSV file.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--runs", type=int, default=4)
+    parser.add_argument("--modules", type=int, default=len(Module))
+    parser.add_argument("--variables-per-module", type=int, default=10)
+    parser.add_argument("--max-array-dimensions", type=int, default=3)
+    parser.add_argument("--max-members-per-dimension", type=int, default=4)
+    parser.add_argument("--start-year", type=int, default=2015)
+    parser.add_argument("--end-year", type=int, default=2050)
+    parser.add_argument("--stella-quoting", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    outputs = SyntheticLIBRAOutputs(
+        num_runs=args.runs, num_modules=args.modules, variables_per_module=args.variables_per_module,
+        max_array_dimensions=args.max_array_dimensions, max_members_per_dimension=args.max_members_per_dimension,
+        start_year=args.start_year, end_year=args.end_year, stella_quoting=args.stella_quoting, seed=args.seed)
+    df = outputs.make_dataframe()
+    df.to_csv(args.path)
+    print(f"Wrote {len(df.columns)} columns x {len(df)} years to {args.path}.")
+
+
+if __name__ == "__main__":
+    main()
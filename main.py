@@ -1,15 +1,70 @@
 """
 Plotly Dash based LIBRA dashboard
 """
+import argparse
+import logging
+import os
 from dash import Dash
 from dash_bootstrap_components import themes
 from src.components.layout import create_layout
+from src.data.dataset_store import add_dataset
+from src.data.export import register_export_routes
+from src.data.multi_file_loader import load_directory
+from src.data.query_api import register_query_routes
+from src.monitoring.callback_metrics import instrument_callbacks, register_metrics_routes
+from src.monitoring.callback_profiler import DEFAULT_KEEP, profile_callbacks
+from src.monitoring.request_recorder import record_requests
+from src.plotting_functions.plotting_functions_plotly import WEBGL_POINT_THRESHOLD
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LIBRA dashboard")
+    parser.add_argument(
+        "--profile-dir", default=os.environ.get("LIBRA_DASHBOARD_PROFILE_DIR"),
+        help="Profile callbacks with cProfile and write the profiles of the slowest runs to this directory.")
+    parser.add_argument(
+        "--profile-callbacks", default=os.environ.get("LIBRA_DASHBOARD_PROFILE_CALLBACKS"),
+        help="Comma-separated callbacks to profile, e.g. line_plot.update_line_plot (default: all).")
+    parser.add_argument(
+        "--profile-keep", type=int, default=int(os.environ.get("LIBRA_DASHBOARD_PROFILE_KEEP", DEFAULT_KEEP)),
+        help="Number of slowest callback runs whose profiles are kept.")
+    parser.add_argument(
+        "--record-requests", default=os.environ.get("LIBRA_DASHBOARD_RECORD_REQUESTS"),
+        help="Append the callback requests to this JSON lines file, for replay with benchmarks.load_test.")
+    parser.add_argument(
+        "--lazy-loading", action="store_true", default=os.environ.get("LIBRA_DASHBOARD_LAZY_LOADING") == "1",
+        help="Parse only the header of uploaded files up front and load their columns on demand.")
+    parser.add_argument(
+        "--data-dir", default=os.environ.get("LIBRA_DASHBOARD_DATA_DIR"),
+        help="Load the LIBRA output CSV files of this directory at startup.")
+    parser.add_argument(
+        "--port", type=int, default=int(os.environ.get("LIBRA_DASHBOARD_PORT", 8050)),
+        help="Port of the dashboard on 127.0.0.1.")
+    parser.add_argument(
+        "--webgl-point-threshold", type=int,
+        default=int(os.environ.get("LIBRA_DASHBOARD_WEBGL_POINT_THRESHOLD", WEBGL_POINT_THRESHOLD)),
+        help="Draw line plots with more points than this (runs x years) with WebGL instead of SVG.")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    logging.basicConfig(level=os.environ.get("LIBRA_DASHBOARD_LOG_LEVEL", "INFO"),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = Dash(external_stylesheets=[themes.SPACELAB])
     app.title = "LIBRA Dashboard (based on LIBRA v2.2)"
-    app.layout = create_layout(app)
-    app.run_server(debug=False, host='127.0.0.1', port=8050)
+    instrument_callbacks(app)
+    if args.profile_dir:
+        callbacks = set(name.strip() for name in args.profile_callbacks.split(",")) if args.profile_callbacks else None
+        profile_callbacks(app, args.profile_dir, callbacks, args.profile_keep)
+    dataset_key = add_dataset(load_directory(args.data_dir), pinned=True) if args.data_dir else None
+    app.layout = create_layout(
+        app, admin=os.environ.get("LIBRA_DASHBOARD_ADMIN") == "1", lazy_loading=args.lazy_loading,
+        dataset_key=dataset_key, webgl_point_threshold=args.webgl_point_threshold)
+    register_export_routes(app.server)
+    register_query_routes(app.server)
+    register_metrics_routes(app.server)
+    if args.record_requests:
+        record_requests(app.server, args.record_requests)
+    app.run_server(debug=False, host='127.0.0.1', port=args.port)
 
 if __name__=="__main__":
     main()
@@ -0,0 +1,49 @@
+from dash import Dash, dcc, html, dash_table
+from dash.dependencies import Input, Output
+from dash.exceptions import PreventUpdate
+from typing import Any
+from src.monitoring.callback_metrics import METRICS_ROUTE, summarize_metrics
+from . import ids
+
+COLUMNS = [
+    ("callback", "Callback"), ("runs", "Runs"), ("mean_ms", "Mean (ms)"), ("p50_ms", "p50 (ms)"),
+    ("p95_ms", "p95 (ms)"), ("mean_request_kb", "Mean request (kB)"), ("mean_response_kb", "Mean response (kB)"),
+    ("prevented", "Prevented"), ("exceptions", "Exceptions"),
+]
+
+
+def render(app: Dash) -> dcc.Tab:
+
+    @app.callback(
+        Output(ids.CALLBACK_METRICS_TABLE, "data"),
+        Input(ids.TABS, "value"),
+        Input(ids.CALLBACK_METRICS_REFRESH_BUTTON, "n_clicks")
+    )
+    def update_callback_metrics_table(tab: str, n_clicks: int) -> list[dict[str, Any]]:
+        if tab != ids.ADMIN_TAB:
+            raise PreventUpdate
+        return summarize_metrics()
+
+    return dcc.Tab(
+        id=ids.ADMIN_TAB,
+        value=ids.ADMIN_TAB,
+        label="Admin",
+        children=[
+            html.H4("Callback metrics.", style=dict(
+                textAlign="center", fontWeight="bold", color="#047cc4")),
+            dcc.Markdown(
+                f"Latency quantiles are bucket upper bounds. The raw histograms are served at "
+                f"[{METRICS_ROUTE}]({METRICS_ROUTE}) in the Prometheus text format."),
+            html.Button(
+                id=ids.CALLBACK_METRICS_REFRESH_BUTTON,
+                children=["Refresh"],
+                n_clicks=0
+            ),
+            dash_table.DataTable(
+                id=ids.CALLBACK_METRICS_TABLE,
+                columns=[dict(name=name, id=column_id) for column_id, name in COLUMNS],
+                data=[],
+                sort_action="native"
+            ),
+        ]
+    )
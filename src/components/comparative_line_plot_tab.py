@@ -1,12 +1,14 @@
+from typing import Optional
 from dash import Dash, dcc, html
 from . import ids
 
-from . import comparative_line_plot, comparative_line_plot_2
+from . import comparative_line_plot
 
 
-def render(app: Dash) -> dcc.Tab:
+def render(app: Dash, num_panels: int, webgl_point_threshold: Optional[int]) -> dcc.Tab:
     return dcc.Tab(
         id=ids.COMPARATIVE_LINEPLOT_TAB,
+        value=ids.COMPARATIVE_LINEPLOT_TAB,
         label="Comparative line plots",
         children=[
             html.Div(
@@ -19,10 +21,7 @@ def render(app: Dash) -> dcc.Tab:
             ),
             html.Div(
                 className="comparative-line-plot-container",
-                children=[
-                    comparative_line_plot.render(app),
-                    comparative_line_plot_2.render(app)
-                ]
+                children=comparative_line_plot.render(app, num_panels, webgl_point_threshold)
             ),
         ]
     )
@@ -1,53 +1,86 @@
 
 from . import ids
-from dash.dependencies import Input, Output, State
+from dash.dependencies import Input, Output, State, ALL
 from dash.exceptions import PreventUpdate
 from dash import Dash, dcc, html
-from src.data.LIBRAOutputNamesParser import LIBRAOutputNamesParser
-from src.data.preprocess_data import preprocess_data
-from typing import Any
-import pandas as pd
+from typing import Any, Optional
+import logging
+from src.data.dataset_store import add_dataset, append_to_dataset, is_expired
+from src.data.lazy_columns import LazyCSVColumns
+from src.data.multi_file_loader import load_uploads
+from src.data.preprocess_data import decode_contents
+from src.data.stella_formats import is_xlsx
 
-def render(app: Dash) -> html.Div:
+logger = logging.getLogger(__name__)
+
+EXPIRED_MESSAGE = "The uploaded data has expired on the server. Please upload the files again."
+
+def render(app: Dash, lazy_loading: bool = False, dataset_key: Optional[str] = None) -> html.Div:
+    """
+    Creates the file uploader, which accepts several CSV or XLSX files at once (e.g. one per run or module). With
+    `lazy_loading`, a single new file is available as soon as its header is parsed, and its columns are
+    loaded when they are first plotted (see `src.data.lazy_columns`). `dataset_key` is the key of a
+    dataset loaded at startup, which is selected until a file is uploaded. A new upload replaces the
+    previous dataset of the session on the server.
+    """
 
     @app.callback(
+        Output(ids.DATA_STORAGE, "data"),
         Output(ids.FILE_UPLOAD_BUTTON, "disabled"),
-        Input(ids.FILE_UPLOADER, "contents")
+        Input(ids.FILE_UPLOADER, "contents"),
+        State(ids.FILE_UPLOADER, "filename"),
+        State(ids.APPEND_UPLOAD_CHECKLIST, "value"),
+        State(ids.DATA_STORAGE, "data")
     )
-    def update_upload_button(contents: bytes) -> bool:
+    def update_data_storage(
+            contents: Optional[list[str]],
+            filenames: Optional[list[str]],
+            append: list[bool],
+            data: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+        if not contents:
+            raise PreventUpdate
+        appending = append and data and "key" in data
+        previous_key = (data or {}).get("key")
         try:
-            df = preprocess_data(contents)
-            if not df.empty:
-                print(df.head())
-                return False
-            return True
-        except Exception as e:
-            print(e)
-            return True
+            if lazy_loading and len(contents) == 1 and not appending and not is_xlsx((filenames or [""])[0]):
+                lazy_columns = LazyCSVColumns.from_csv(decode_contents(contents[0]))
+                if lazy_columns is not None:
+                    logger.info("Uploaded %d columns, loading them lazily.", len(lazy_columns.columns))
+                    return dict(key=add_dataset(lazy_columns=lazy_columns, replaces=previous_key), version=0), False
+            df = load_uploads(contents, filenames)
+            if df.empty:
+                return dict(), True
+            logger.info("Uploaded %d columns of %d years from %d files.", len(df.columns), len(df), len(contents))
+            if appending:
+                return dict(key=append_to_dataset(data, df), version=data.get("version", 0) + 1), False
+        except Exception:
+            logger.exception("Could not load the uploaded files.")
+            if appending:
+                return data, False
+            return dict(), True
+        return dict(key=add_dataset(df, replaces=previous_key), version=0), False
 
     @app.callback(
-        Output(ids.DATA_STORAGE, "data"),
-        Input(ids.FILE_UPLOADER, "contents")
+        Output(ids.DATASET_STATUS, "children"),
+        Input(ids.DATA_STORAGE, "data"),
+        Input(ids.TABS, "value"),
+        Input(ids.STELLA_RUN_NAMES_DROPDOWN, "value"),
+        Input(dict(type=ids.MODULE_DROPDOWN, index=ALL), "value"),
+        Input(dict(type=ids.VARIABLE_DROPDOWN, index=ALL), "value"),
+        Input(dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=ALL), "value")
     )
-    def update_data_storage(contents: bytes) -> dict[Any]:
-        try:
-            if not contents:
-                return dict()
-            df = preprocess_data(contents)
-            df.reset_index(inplace=True)
-
-        except Exception as e:
-            print(e)
-            return dict()
-        return df.to_dict("records")
+    def update_dataset_status(data: dict[str, Any], *_: Any) -> str:
+        """Tells the user to upload again when the dataset of the session has been evicted from the server."""
+        return EXPIRED_MESSAGE if is_expired(data) else ""
 
     return html.Div([
         dcc.Upload(
             id=ids.FILE_UPLOADER,
             children=html.Div([
-                "Drag and drop a LIBRA output CSV file (of size < 2 MB) or ",
-                html.A("Select CSV file")
+                "Drag and drop LIBRA output CSV or XLSX files (of size < 2 MB) or ",
+                html.A("Select files")
             ]),
+            multiple=True,
             style=dict(
                 width="100%",
                 height="60px",
@@ -60,8 +93,16 @@ def render(app: Dash) -> html.Div:
                 color="rgb(0,0,0)"
             )
         ),
+        dcc.Checklist(
+            id=ids.APPEND_UPLOAD_CHECKLIST,
+            options=[dict(label=" Append the runs of the CSV files to the uploaded data", value=True)],
+            value=[]
+        ),
+        html.P(id=ids.DATASET_STATUS, style=dict(color="#b7121f", textAlign="center")),
         dcc.Store(
-            id=ids.DATA_STORAGE, data=dict(), storage_type="memory"),  
+            id=ids.DATA_STORAGE,
+            data=dict(key=dataset_key, version=0) if dataset_key else dict(),
+            storage_type="memory"),
         html.Button(
             id=ids.FILE_UPLOAD_BUTTON,
             className="file-upload-button",
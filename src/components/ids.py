@@ -1,5 +1,10 @@
+# Components which are repeated in every comparison panel (dropdowns, title and y-label inputs, selection
+# storage, plots and data tables) use pattern-matching ids: dict(type=<id below>, index=<panel index>).
 STELLA_RUN_NAMES_DROPDOWN = "stella-run-names-dropdown"
+DELTA_BASELINE_DROPDOWN = "delta-baseline-dropdown"
+DELTA_MODE_RADIOITEMS = "delta-mode-radioitems"
 
+VARIABLE_SEARCH_DROPDOWN = "variable-search-dropdown"
 MODULE_DROPDOWN = "module-dropdown"
 VARIABLE_DROPDOWN = "variable-dropdown"
 ARRAYVAL_DROPDOWN_1 = "arrayval-dropdown-1"
@@ -7,50 +12,43 @@ ARRAYVAL_DROPDOWN_2 = "arrayval-dropdown-2"
 ARRAYVAL_DROPDOWN_3 = "arrayval-dropdown-3"
 ARRAYVAL_DROPDOWN_4 = "arrayval-dropdown-4"
 
-MODULE_DROPDOWN_TWO = "module-dropdown-two"
-VARIABLE_DROPDOWN_TWO = "variable-dropdown-two"
-ARRAYVAL_DROPDOWN_TWO_1 = "arrayval-dropdown-two-1"
-ARRAYVAL_DROPDOWN_TWO_2 = "arrayval-dropdown-two-2"
-ARRAYVAL_DROPDOWN_TWO_3 = "arrayval-dropdown-two-3"
-ARRAYVAL_DROPDOWN_TWO_4 = "arrayval-dropdown-two-4"
-
 SELECT_ALL_RUN_NAMES_BUTTON = "select-all-run-names-button"
-SELECT_ALL_RUN_NAMES_BUTTON_TWO = "select-all-run-names-button-two"
 
 LINE_PLOT = "line-plot"
 COMPARATIVE_LINE_PLOT = "comparative-line-plot"
 STACK_PLOT = "stack-plot"
 
-LINE_PLOT_TWO = "line-plot-two"
-COMPARATIVE_LINE_PLOT_TWO = "comparative-line-plot-two"
-STACK_PLOT_TWO = "stack-plot-two"
+STACK_PLOT_RUN_NAME_DROPDOWN = "stack-plot-run-name-dropdown"
 
 FILE_UPLOADER = "file-uploader"
 FILE_UPLOAD_BUTTON = "file-upload-button"
+APPEND_UPLOAD_CHECKLIST = "append-upload-checklist"
 DATA_STORAGE = "data-storage"
-VARIABLE_DICT_STORAGE = "variable-dict-storage"
-ARRAYVAL_DICT_STORAGE = "arrayval-dict-storage"
+DATASET_STATUS = "dataset-status"
+SELECTION_STORAGE = "selection-storage"
+RENDER_STATE_STORAGE = "render-state-storage"
 
 TITLE_INPUT = "title-input"
 YLABEL_INPUT = "ylabel-input"
 MAX_YVAL_INPUT = "max-yval-input"
 DECIMAL_POINT_RADIOITEMS = "decimal-point-radioitems"
 EXOGENOUS_INPUT_RADIOITEMS = "exogenous-input-radioitems"
-
-TITLE_INPUT_TWO = "title-input-two"
-YLABEL_INPUT_TWO = "ylabel-input-two"
-MAX_YVAL_INPUT_TWO = "max-yval-input-two"
-DECIMAL_POINT_RADIOITEMS_TWO = "decimal-point-radioitems-two"
-EXOGENOUS_INPUT_RADIOITEMS_TWO = "exogenous-input-radioitems-two"
+AGGREGATE_RADIOITEMS = "aggregate-radioitems"
 
 DATATABLE = "datatable"
-DATATABLE_TWO = "datatable-two"
+DATATABLE_STORAGE = "datatable-storage"
 
 SCENARIO_NAME_INPUT = "scenario-name-input"
 GITHUB_COMMIT_INPUT = "github-commit-input"
 TAG_INPUT_SUBMIT_BUTTON = "tag-input-submit-button"
 
+TABS = "tabs"
 PLOTTED_DATA_TAB = "plotted-data-tab"
 COMPARATIVE_LINEPLOT_TAB = "comparative-lineplot-tab"
+STACKPLOT_TAB = "stackplot-tab"
 PLOT_SETTINGS_TAB = "plot-settings-tab"
 INSTRUCTIONS_TAB = "instructions-tab"
+ADMIN_TAB = "admin-tab"
+
+CALLBACK_METRICS_TABLE = "callback-metrics-table"
+CALLBACK_METRICS_REFRESH_BUTTON = "callback-metrics-refresh-button"
@@ -14,6 +14,7 @@ def render(app: Dash) -> dcc.Tab:
     )
     return dcc.Tab(
         id=ids.INSTRUCTIONS_TAB,
+        value=ids.INSTRUCTIONS_TAB,
         label="Instructions",
         children=[
             html.H4("Instructions.", style=dict(
@@ -23,7 +24,7 @@ def render(app: Dash) -> dcc.Tab:
                 children=[
                     dcc.Markdown(
                         """
-                        Currently, the dashboard requires the user to upload a CSV file containing outputs from LIBRA simulations in the vertical layout format. An example of the vertical layout format is given below:\n\n
+                        The dashboard reads CSV files containing outputs from LIBRA simulations, in the vertical layout format (shown below) or in the horizontal layout format (one row per variable and one column per year), as well as XLSX workbooks in either layout. Outputs split over several files can be uploaded together. An example of the vertical layout format is given below:\n\n
                         """),
                     dash_table.DataTable(example_df.to_dict("records"), [
                                          {"name": i, "id": i} for i in example_df.columns]),
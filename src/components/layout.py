@@ -1,27 +1,48 @@
+from typing import Optional
 from dash import Dash, html, dcc
+from src.components import ids
+from src.plotting_functions.plotting_functions_plotly import WEBGL_POINT_THRESHOLD
 from src.components import (
     comparative_line_plot_tab,
     file_uploader,
     plot_settings_tab,
     plotted_data_tab,
-    instructions_tab
+    stack_plot_tab,
+    instructions_tab,
+    admin_tab
 )
 
 
-def create_layout(app: Dash) -> html.Div:
+def create_layout(
+        app: Dash,
+        num_panels: int = 2,
+        admin: bool = False,
+        lazy_loading: bool = False,
+        dataset_key: Optional[str] = None,
+        webgl_point_threshold: Optional[int] = WEBGL_POINT_THRESHOLD) -> html.Div:
+    """
+    Creates the dashboard layout with `num_panels` side-by-side comparison panels. With `admin`, an
+    extra tab shows the callback metrics. With `lazy_loading`, uploaded columns are loaded on demand.
+    `dataset_key` selects a dataset stored at startup until a file is uploaded. Line plots with more
+    than `webgl_point_threshold` points are drawn with WebGL (None: never).
+    """
     return html.Div(
         className="app-div",
         children=[
             html.H1(app.title, style=dict(textAlign="center",
                     fontWeight="bold", color="#047cc4")),
             html.Hr(),
-            file_uploader.render(app),
+            file_uploader.render(app, lazy_loading, dataset_key),
             dcc.Tabs(
-                [
-                    plotted_data_tab.render(app),
-                    comparative_line_plot_tab.render(app),
-                    plot_settings_tab.render(app),
-                    instructions_tab.render(app)
+                id=ids.TABS,
+                value=ids.PLOTTED_DATA_TAB,
+                children=[
+                    plotted_data_tab.render(app, num_panels, webgl_point_threshold),
+                    comparative_line_plot_tab.render(app, num_panels, webgl_point_threshold),
+                    stack_plot_tab.render(app, num_panels),
+                    plot_settings_tab.render(app, num_panels),
+                    instructions_tab.render(app),
+                    *([admin_tab.render(app)] if admin else [])
                 ]
             )
         ]
@@ -0,0 +1,27 @@
+"""
+Gating of the plot callbacks on the active tab. A plot callback takes the value of `ids.TABS` as an
+input, and only rebuilds its figure when the tab holding the plot is visible. While the tab is hidden,
+the plot is left stale; it is dirty when its inputs differ from the ones it was last rendered with,
+which are kept as a signature in a render-state store next to the plot.
+"""
+from dash import dcc
+from hashlib import sha1
+from typing import Any, Optional
+import json
+
+from . import ids
+
+def render_state_store(plot_id: str, index: int) -> dcc.Store:
+    """Store holding the signature of the inputs the plot of a panel was last rendered with."""
+    return dcc.Store(id=dict(type=ids.RENDER_STATE_STORAGE, plot=plot_id, index=index), storage_type="memory")
+
+def render_state_id(plot_id: str, index: Any) -> dict[str, Any]:
+    return dict(type=ids.RENDER_STATE_STORAGE, plot=plot_id, index=index)
+
+def input_signature(*args: Any) -> str:
+    """Signature of the inputs of a plot callback."""
+    return sha1(json.dumps(args, sort_keys=True, default=str).encode()).hexdigest()
+
+def needs_render(active_tab: str, plot_tab: str, signature: str, rendered_signature: Optional[str]) -> bool:
+    """Whether a plot has to be rendered: its tab is visible and it is dirty."""
+    return active_tab == plot_tab and signature != rendered_signature
@@ -1,62 +1,84 @@
-from dash import Dash, dcc, html, dash_table
-from dash.dependencies import Input, Output, State
+from dash import Dash, dcc, html, ctx
+from dash.dependencies import Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
 from datetime import date
-from typing import Any
-from src.plotting_functions.plotting_functions_plotly import make_lineplot
+from typing import Any, Optional
+from src.plotting_functions.plotting_functions_plotly import make_lineplot, make_aggregate_lineplot
 from src.plotting_functions.plot_parameters import LinePlotParameters, StyleParameters
-from . import ids
-import pandas as pd
+from src.data.dataset_store import get_dataset
+from src.monitoring.callback_metrics import record_handled_exception
+from . import ids, series_table
+from .render_stats import record_plot_rebuild
+from .lazy_render import input_signature, needs_render, render_state_id, render_state_store
+import logging
 import re
 
-def render(app: Dash) -> html.Div:
-    def make_selected_data(
-        df: pd.DataFrame, 
-        plot_params: LinePlotParameters, 
-        style_params:StyleParameters) -> pd.DataFrame:
+logger = logging.getLogger(__name__)
 
-        selected_data = pd.DataFrame([])
-        cols = [f"{run_name}: {plot_params._full_variable_name}" for run_name in style_params.stella_run_names]
-        selected_data = df.loc[2020:2050, cols].transpose()
-        selected_data.reset_index(inplace=True)
-        return selected_data
+def render(app: Dash, num_panels: int, webgl_point_threshold: Optional[int]) -> list[html.Div]:
+    series_table.register_callbacks(app)
 
     @app.callback(
-        Output(ids.LINE_PLOT, "children"),
+        Output(dict(type=ids.LINE_PLOT, index=MATCH), "children"),
+        Output(render_state_id(ids.LINE_PLOT, MATCH), "data"),
         Input(ids.STELLA_RUN_NAMES_DROPDOWN, "value"),
-        Input(ids.MODULE_DROPDOWN, "value"),
-        Input(ids.VARIABLE_DROPDOWN, "value"),
-        Input(ids.ARRAYVAL_DROPDOWN_1, "value"),
-        Input(ids.ARRAYVAL_DROPDOWN_2, "value"),
-        Input(ids.ARRAYVAL_DROPDOWN_3, "value"),
-        Input(ids.TITLE_INPUT, "value"),
-        Input(ids.YLABEL_INPUT, "value"),
-        Input(ids.MAX_YVAL_INPUT, "value"),
-        Input(ids.DECIMAL_POINT_RADIOITEMS, "value"),
-        Input(ids.EXOGENOUS_INPUT_RADIOITEMS, "value"),
+        Input(dict(type=ids.SELECTION_STORAGE, index=MATCH), "data"),
+        Input(dict(type=ids.TITLE_INPUT, index=MATCH), "value"),
+        Input(dict(type=ids.YLABEL_INPUT, index=MATCH), "value"),
+        Input(dict(type=ids.MAX_YVAL_INPUT, index=MATCH), "value"),
+        Input(dict(type=ids.DECIMAL_POINT_RADIOITEMS, index=MATCH), "value"),
+        Input(dict(type=ids.EXOGENOUS_INPUT_RADIOITEMS, index=MATCH), "value"),
+        Input(dict(type=ids.AGGREGATE_RADIOITEMS, index=MATCH), "value"),
         Input(ids.SCENARIO_NAME_INPUT, "value"),
         Input(ids.GITHUB_COMMIT_INPUT, "value"),
         Input(ids.TAG_INPUT_SUBMIT_BUTTON, "n_clicks"),
-        State(ids.DATA_STORAGE, "data")
+        Input(ids.TABS, "value"),
+        State(ids.DATA_STORAGE, "data"),
+        State(render_state_id(ids.LINE_PLOT, MATCH), "data")
     )
     def update_line_plot(
         stella_run_names: list[str],
-        module: str,
-        variable: str,
-        array_val_1: str,
-        array_val_2: str,
-        array_val_3: str,
+        selection: dict[str, Any],
         title: str,
         y_label: str,
         max_yval: float,
         decimal: bool,
         is_exogenous_input: bool,
+        aggregate: bool,
+        scenario_name: str,
+        github_commit: str,
+        n_clicks: int,
+        active_tab: str,
+        data: dict[Any],
+        rendered_signature: str,
+    ) -> tuple[html.Div, str]:
+        plot_inputs = (
+            stella_run_names, selection, title, y_label, max_yval, decimal, is_exogenous_input,
+            aggregate, scenario_name, github_commit, n_clicks, data)
+        signature = input_signature(*plot_inputs)
+        if not needs_render(active_tab, ids.PLOTTED_DATA_TAB, signature, rendered_signature):
+            raise PreventUpdate
+        return create_line_plot(*plot_inputs), signature
+
+    def create_line_plot(
+        stella_run_names: list[str],
+        selection: dict[str, Any],
+        title: str,
+        y_label: str,
+        max_yval: float,
+        decimal: bool,
+        is_exogenous_input: bool,
+        aggregate: bool,
         scenario_name: str,
         github_commit: str,
         n_clicks: int,
         data: dict[Any],
     ) -> html.Div:
+        panel_index = ctx.outputs_list[0]["id"]["index"]
+        module, variable = selection.get("module", "None"), selection.get("variable", "None")
+        array_vals = selection.get("array_vals", [])
         placeholder_title = f"{module}.{variable}"+"["+ \
-            ", ".join([val for val in [array_val_1, array_val_2, array_val_3] if val != "None"]) + "]"
+            ", ".join(array_vals) + "]"
         placeholder_ylabel = f"{module}.{variable}"
 
         tag = None
@@ -67,7 +89,7 @@ def render(app: Dash) -> html.Div:
             plot_params = LinePlotParameters(
                 module=module,
                 variable=variable,
-                array_vals=[val for val in [array_val_1, array_val_2, array_val_3] if val != "None"],
+                array_vals=array_vals,
                 title=placeholder_title if title != placeholder_title else title,
                 y_label=placeholder_ylabel if y_label != placeholder_ylabel else y_label,
                 max_yval=max_yval if max_yval != 0 else None,
@@ -75,23 +97,25 @@ def render(app: Dash) -> html.Div:
                 is_exogenous_input=is_exogenous_input,
                 tag=tag if tag else None
             )
-            df = pd.DataFrame.from_records(data, index="Years")
-            style_params = StyleParameters(stella_run_names=stella_run_names, compare=False)
+            col_names = [f"{run_name}: {plot_params._full_variable_name}" for run_name in stella_run_names]
+            dataset = get_dataset(data)
 
-            selected_data = make_selected_data(df, plot_params, style_params)
+            record_plot_rebuild(ids.LINE_PLOT, panel_index)
 
-            fig = make_lineplot(df, plot_params, style_params)
+            if aggregate:
+                fig = make_aggregate_lineplot(
+                    dataset.get_run_aggregates(col_names), plot_params, num_runs=len(col_names))
+            else:
+                style_params = StyleParameters(stella_run_names=stella_run_names, compare=False)
+                fig = make_lineplot(
+                    dataset.get_columns(col_names), plot_params, style_params,
+                    webgl_point_threshold=webgl_point_threshold)
             return html.Div(
                 className="line-plot-and-datatable-container",
                 children=[
-                    html.Div(className="data-table-div", children=[
-                        dash_table.DataTable(
-                            id=ids.DATATABLE,
-                            data=selected_data.to_dict('records'), 
-                            columns=[dict(name=str(i), id=str(i)) for i in selected_data.columns],              
-                            style_table=dict(height="300px", overflowX='auto', overflowY='auto'),
-                            export_format="csv")
-                    ]),
+                    html.Div(
+                        className="data-table-div",
+                        children=series_table.render(panel_index, data, col_names)),
                     html.Div(children=[
                         dcc.Graph(
                             className="line-plot", 
@@ -100,12 +124,20 @@ def render(app: Dash) -> html.Div:
                                 toImageButtonOptions=dict(
                                     format="png", width=800, height=700, scale=3.0)
                             ))]),
-                ],
-                id=ids.LINE_PLOT)
+                ])
         except Exception as e:
+            record_handled_exception(e)
+            if isinstance(e, (KeyError, AssertionError)):
+                logger.info("Could not build the line plot for the selection: %r", e)
+            else:
+                logger.exception("Could not build the line plot.")
             return html.Div([
                 html.Div(className="data-table-div", children=[html.P("Invalid data selection")]),
                 html.Div(className="line-plot", children=[html.P(f"{placeholder_title} is not present in the uploaded data")])
             ])
         
-    return html.Div(id=ids.LINE_PLOT)
\ No newline at end of file
+    return [
+        html.Div([
+            html.Div(id=dict(type=ids.LINE_PLOT, index=index)),
+            render_state_store(ids.LINE_PLOT, index)])
+        for index in range(num_panels)]
\ No newline at end of file
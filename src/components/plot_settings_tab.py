@@ -3,21 +3,21 @@ from . import ids
 
 from . import (
     stella_run_names_dropdown,
+    variable_search,
     module_dropdown,
     variable_dropdown,
     arrayval_dropdowns,
     title_and_ylabel_input,
-    module_dropdown_2,
-    variable_dropdown_2,
-    arrayval_dropdowns_2,
-    title_and_ylabel_input_2,
+    selection_state,
     tag_input
 )
 
 
-def render(app: Dash) -> dcc.Tab:
+def render(app: Dash, num_panels: int) -> dcc.Tab:
+    selection_storages = selection_state.render(app, num_panels)
     return dcc.Tab(
         id=ids.PLOT_SETTINGS_TAB,
+        value=ids.PLOT_SETTINGS_TAB,
         label="Plot settings",
         children=[
             stella_run_names_dropdown.render(app),
@@ -35,22 +35,15 @@ def render(app: Dash) -> dcc.Tab:
                     html.Div(
                         className="dropdown-container",
                         children=[
-                            module_dropdown.render(app),
-                            variable_dropdown.render(app),
-                            arrayval_dropdowns.render(app),
-                            title_and_ylabel_input.render(app)
+                            variable_search.render(app, index),
+                            module_dropdown.render(app, index),
+                            variable_dropdown.render(app, index),
+                            arrayval_dropdowns.render(app, index),
+                            title_and_ylabel_input.render(app, index),
+                            selection_storages[index]
                         ]
-                    ),
-                    html.Div(
-                        className="dropdown-container",
-                        children=[
-                            module_dropdown_2.render(app),
-                            variable_dropdown_2.render(app),
-                            arrayval_dropdowns_2.render(app),
-                            title_and_ylabel_input_2.render(
-                                app)
-                        ]
-                    ),
+                    )
+                    for index in range(num_panels)
                 ]
             ),
             tag_input.render(app)
@@ -0,0 +1,15 @@
+"""
+Counts of plot rebuilds, used to check how often the plot callbacks fire per user action.
+"""
+from collections import Counter
+import logging
+
+logger = logging.getLogger(__name__)
+
+plot_rebuilds: Counter = Counter()
+
+def record_plot_rebuild(plot_id: str, panel_index: int) -> None:
+    """Record that the figure of a plot component of a panel is being rebuilt."""
+    plot_rebuilds[(plot_id, panel_index)] += 1
+    logger.debug("Rebuilding %s of panel %d (%d rebuilds so far).", 
+                 plot_id, panel_index, plot_rebuilds[(plot_id, panel_index)])
@@ -0,0 +1,134 @@
+from dash import Dash, dcc, ctx, no_update
+from dash.dependencies import Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
+from typing import Any
+from src.data.dataset_store import get_dataset
+from src.data.dimension_aggregates import ALL_MEMBERS
+
+from . import ids
+
+NONE_OPTIONS = [dict(value="None", label="None")]
+
+def create_options_and_value(
+                        module: str, 
+                        variable: str,
+                        array_members_dict: dict[str, list[list[str]]],
+                        i: int) -> tuple[list[dict[str, str]], str]:
+    """
+    Create options and default value of the i-th array value dropdown from the members observed in the data.
+    Dimensions with several members can also be reduced over all members.
+    """
+    if module == "None" or variable == "None":
+        return NONE_OPTIONS, "None"
+    array_members = array_members_dict.get(f"{module}.{variable}", []) if array_members_dict else []
+    if i >= len(array_members) or not array_members[i]:
+        return NONE_OPTIONS, "None"
+    options = [dict(label=val, value=val) for val in array_members[i]]
+    if len(array_members[i]) > 1:
+        options += [dict(label=val, value=val) for val in ALL_MEMBERS]
+    return options, array_members[i][0]
+
+def parse_full_variable_name(full_variable_name: str) -> tuple[str, str, list[str]]:
+    """Split a full variable name, e.g. "Battery Market.demand[US, LFP]", into module, variable and array values."""
+    name, _, array_vals = full_variable_name.partition("[")
+    module, _, variable = name.partition(".")
+    return module, variable, [val.strip() for val in array_vals.rstrip("]").split(",") if val.strip()]
+
+def create_title(module: str, variable: str, array_vals: list[str]) -> str:
+    """Default plot title for a selection."""
+    title = f"{module}.{variable}"
+    if array_vals:
+        title = title+"["+", ".join(array_vals) + "]"
+    return title
+
+def render(app: Dash, num_panels: int) -> list[dcc.Store]:
+    """
+    Registers a single pattern-matching callback which resolves the module, variable and array value
+    dropdowns of a panel, and returns the stores holding the settled selection of each panel. Plots
+    take the store as input, so they are rebuilt once per user action instead of once per step of
+    the dropdown chain.
+    """
+    arrayval_dropdown_ids = [ids.ARRAYVAL_DROPDOWN_1, ids.ARRAYVAL_DROPDOWN_2, ids.ARRAYVAL_DROPDOWN_3]
+    num_arrayvals = len(arrayval_dropdown_ids)
+
+    @app.callback(
+        Output(dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=MATCH), "options"),
+        Input(dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=MATCH), "search_value"),
+        State(dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=MATCH), "value"),
+        State(ids.DATA_STORAGE, "data")
+    )
+    def update_search_options(search_value: str, value: str, data: dict[str, Any]) -> list[dict[str, str]]:
+        if not search_value:
+            raise PreventUpdate
+        try:
+            dataset = get_dataset(data)
+        except KeyError:
+            raise PreventUpdate
+        matches = dataset.search_index.search(search_value)
+        if value and value not in matches:
+            matches.append(value)
+        # The dropdown filters the options again by the typed text. Giving every option that text as its
+        # search value keeps the fuzzy matches (typos, partial words) of the index, in ranked order.
+        return [dict(label=name, value=name, search=search_value) for name in matches]
+
+    @app.callback(
+        Output(dict(type=ids.MODULE_DROPDOWN, index=MATCH), "options"),
+        Output(dict(type=ids.MODULE_DROPDOWN, index=MATCH), "value"),
+        Output(dict(type=ids.VARIABLE_DROPDOWN, index=MATCH), "options"),
+        Output(dict(type=ids.VARIABLE_DROPDOWN, index=MATCH), "value"),
+        *[Output(dict(type=arrayval_dropdown_id, index=MATCH), prop) 
+            for arrayval_dropdown_id in arrayval_dropdown_ids for prop in ["options", "value"]],
+        Output(dict(type=ids.TITLE_INPUT, index=MATCH), "value"),
+        Output(dict(type=ids.YLABEL_INPUT, index=MATCH), "value"),
+        Output(dict(type=ids.SELECTION_STORAGE, index=MATCH), "data"),
+        Input(ids.FILE_UPLOAD_BUTTON, "n_clicks"),
+        Input(dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=MATCH), "value"),
+        Input(dict(type=ids.MODULE_DROPDOWN, index=MATCH), "value"),
+        Input(dict(type=ids.VARIABLE_DROPDOWN, index=MATCH), "value"),
+        *[Input(dict(type=arrayval_dropdown_id, index=MATCH), "value") 
+            for arrayval_dropdown_id in arrayval_dropdown_ids],
+        State(ids.DATA_STORAGE, "data")
+    )
+    def update_selection(_: int, search_value: str, module: str, variable: str, *args: Any) -> tuple:
+        array_vals, data = list(args[:num_arrayvals]), args[num_arrayvals]
+        try:
+            dataset = get_dataset(data)
+        except KeyError:
+            raise PreventUpdate
+        variable_dict = dataset.names_parser.variable_dict
+        array_members_dict = dataset.names_parser.array_members_dict
+        triggered_type = ctx.triggered_id["type"] if isinstance(ctx.triggered_id, dict) else None
+
+        module_options, variable_options = no_update, no_update
+        arrayval_options = [no_update]*num_arrayvals
+        searched_array_vals = None
+        if triggered_type == ids.VARIABLE_SEARCH_DROPDOWN:
+            if not search_value:
+                raise PreventUpdate
+            module, variable, searched_array_vals = parse_full_variable_name(search_value)
+        if triggered_type is None:
+            module_options = [dict(value=module, label=module) for module in variable_dict.keys()]
+            module = list(variable_dict.keys())[0] if variable_dict else "None"
+        if module_options is not no_update or triggered_type in [ids.MODULE_DROPDOWN, ids.VARIABLE_SEARCH_DROPDOWN]:
+            variable_list = sorted(variable_dict.get(module, ["None"]))
+            variable_options = [dict(label=variable, value=variable) for variable in variable_list]
+            variable = variable if searched_array_vals is not None else variable_list[0]
+        if variable_options is not no_update or triggered_type == ids.VARIABLE_DROPDOWN:
+            for i in range(num_arrayvals):
+                arrayval_options[i], array_vals[i] = create_options_and_value(
+                    module, variable, array_members_dict, i)
+            if searched_array_vals is not None:
+                array_vals = (searched_array_vals + ["None"]*num_arrayvals)[:num_arrayvals]
+
+        selected_array_vals = [val for val in array_vals if val and val != "None"]
+        selection = dict(module=module, variable=variable, array_vals=selected_array_vals)
+        return (
+            module_options, module, variable_options, variable,
+            *[output for i in range(num_arrayvals) for output in [arrayval_options[i], array_vals[i]]],
+            create_title(module, variable, selected_array_vals),
+            f"{module}.{variable}",
+            selection
+        )
+
+    return [dcc.Store(id=dict(type=ids.SELECTION_STORAGE, index=index), data=dict(), storage_type="memory") 
+            for index in range(num_panels)]
@@ -0,0 +1,73 @@
+from dash import Dash, dcc, html, dash_table
+from dash.dependencies import Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
+from typing import Any
+from urllib.parse import urlencode
+from src.data.dataset_store import get_dataset
+from src.data.export import SERIES_EXPORT_ROUTE, TABLE_YEARS, make_series_table
+from . import ids
+
+PAGE_SIZE = 10
+
+
+def register_callbacks(app: Dash) -> None:
+    """
+    Registers the callback serving the pages of the series tables. Tables are paged and sorted on the
+    server, so only the rows of the current page are sent to the browser.
+    """
+    @app.callback(
+        Output(dict(type=ids.DATATABLE, index=MATCH), "data"),
+        Output(dict(type=ids.DATATABLE, index=MATCH), "page_count"),
+        Input(dict(type=ids.DATATABLE, index=MATCH), "page_current"),
+        Input(dict(type=ids.DATATABLE, index=MATCH), "page_size"),
+        Input(dict(type=ids.DATATABLE, index=MATCH), "sort_by"),
+        State(dict(type=ids.DATATABLE_STORAGE, index=MATCH), "data")
+    )
+    def update_series_table_page(
+        page_current: int,
+        page_size: int,
+        sort_by: list[dict[str, str]],
+        table_data: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], int]:
+        try:
+            dataset = get_dataset(table_data)
+        except KeyError:
+            raise PreventUpdate
+        col_names = table_data["columns"]
+        table = make_series_table(dataset.get_columns(col_names), col_names)
+        if sort_by:
+            table = table.sort_values(
+                [col["column_id"] for col in sort_by],
+                ascending=[col["direction"] == "asc" for col in sort_by],
+                kind="stable")
+        page_current, page_size = page_current or 0, page_size or PAGE_SIZE
+        page = table.iloc[page_current * page_size:(page_current + 1) * page_size]
+        return page.to_dict("records"), max(1, -(-len(table) // page_size))
+
+
+def render(panel_index: int, data: dict[str, Any], col_names: list[str]) -> list:
+    """
+    Creates the table of the given columns of the stored dataset, with a link to the streamed CSV export.
+    The rows are filled in by the callback registered in `register_callbacks`.
+    """
+    export_query = urlencode(dict(key=data["key"], column=col_names), doseq=True)
+    years = [str(year) for year in range(TABLE_YEARS.start, TABLE_YEARS.stop + 1)]
+    return [
+        dcc.Store(
+            id=dict(type=ids.DATATABLE_STORAGE, index=panel_index),
+            data=dict(key=data["key"], columns=col_names)),
+        dash_table.DataTable(
+            id=dict(type=ids.DATATABLE, index=panel_index),
+            columns=[dict(name=col, id=col) for col in ["index", *years]],
+            page_current=0,
+            page_size=PAGE_SIZE,
+            page_action="custom",
+            sort_action="custom",
+            sort_mode="multi",
+            sort_by=[],
+            style_table=dict(height="270px", overflowX='auto', overflowY='auto')),
+        html.A(
+            "Export CSV",
+            href=f"{SERIES_EXPORT_ROUTE}?{export_query}",
+            download="plotted_data.csv"),
+    ]
@@ -0,0 +1,128 @@
+from dash import Dash, dcc, html, ctx
+from dash.dependencies import Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
+from datetime import date
+from typing import Any
+from src.plotting_functions.plotting_functions_plotly import make_stackplot
+from src.plotting_functions.plot_parameters import StackPlotParameters
+from src.data.dataset_store import get_dataset
+from src.monitoring.callback_metrics import record_handled_exception
+from . import ids
+from .render_stats import record_plot_rebuild
+from .lazy_render import input_signature, needs_render, render_state_id, render_state_store
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+def render(app: Dash, num_panels: int) -> list[html.Div]:
+
+    @app.callback(
+        Output(dict(type=ids.STACK_PLOT, index=MATCH), "children"),
+        Output(render_state_id(ids.STACK_PLOT, MATCH), "data"),
+        Input(ids.STACK_PLOT_RUN_NAME_DROPDOWN, "value"),
+        Input(dict(type=ids.SELECTION_STORAGE, index=MATCH), "data"),
+        Input(dict(type=ids.YLABEL_INPUT, index=MATCH), "value"),
+        Input(dict(type=ids.MAX_YVAL_INPUT, index=MATCH), "value"),
+        Input(dict(type=ids.DECIMAL_POINT_RADIOITEMS, index=MATCH), "value"),
+        Input(dict(type=ids.EXOGENOUS_INPUT_RADIOITEMS, index=MATCH), "value"),
+        Input(ids.SCENARIO_NAME_INPUT, "value"),
+        Input(ids.GITHUB_COMMIT_INPUT, "value"),
+        Input(ids.TAG_INPUT_SUBMIT_BUTTON, "n_clicks"),
+        Input(ids.TABS, "value"),
+        State(ids.DATA_STORAGE, "data"),
+        State(render_state_id(ids.STACK_PLOT, MATCH), "data")
+    )
+    def update_stack_plot(
+        run_name: str,
+        selection: dict[str, Any],
+        y_label: str,
+        max_yval: float,
+        decimal: bool,
+        is_exogenous_input: bool,
+        scenario_name: str,
+        github_commit: str,
+        n_clicks: int,
+        active_tab: str,
+        data: dict[Any],
+        rendered_signature: str,
+    ) -> tuple[html.Div, str]:
+        plot_inputs = (
+            run_name, selection, y_label, max_yval, decimal, is_exogenous_input, scenario_name,
+            github_commit, n_clicks, data)
+        signature = input_signature(*plot_inputs)
+        if not needs_render(active_tab, ids.STACKPLOT_TAB, signature, rendered_signature):
+            raise PreventUpdate
+        return create_stack_plot(*plot_inputs), signature
+
+    def create_stack_plot(
+        run_name: str,
+        selection: dict[str, Any],
+        y_label: str,
+        max_yval: float,
+        decimal: bool,
+        is_exogenous_input: bool,
+        scenario_name: str,
+        github_commit: str,
+        n_clicks: int,
+        data: dict[Any],
+    ) -> html.Div:
+        panel_index = ctx.outputs_list[0]["id"]["index"]
+        module, variable = selection.get("module", "None"), selection.get("variable", "None")
+        array_vals = selection.get("array_vals", [])
+        placeholder_title = f"{module}.{variable}"+"["+ ", ".join(array_vals[:-1] + ["*"]) + "]"
+        placeholder_ylabel = f"{module}.{variable}"
+
+        tag = None
+        if n_clicks:
+            tag = f"{scenario_name}_{github_commit}_"+re.sub("-", "", str(date.today()))
+
+        try:
+            dataset = get_dataset(data)
+            array_members = dataset.names_parser.array_members_dict.get(f"{module}.{variable}", [])
+            plot_params = StackPlotParameters(
+                module=module,
+                variable=variable,
+                array_vals=array_vals,
+                title=f"{run_name}: {placeholder_title}",
+                y_label=placeholder_ylabel if y_label != placeholder_ylabel else y_label,
+                max_yval=max_yval if max_yval != 0 else None,
+                decimal=decimal,
+                is_exogenous_input=is_exogenous_input,
+                tag=tag if tag else None,
+                stack_members=array_members[len(array_vals)-1] if array_vals else None
+            )
+            col_names = [f"{run_name}: {variable_name}" for variable_name in plot_params._stack_variable_names]
+            df = dataset.get_columns([col for col in col_names if dataset.has_column(col)])
+
+            record_plot_rebuild(ids.STACK_PLOT, panel_index)
+
+            fig = make_stackplot(df, plot_params, run_name)
+            return html.Div(
+                children=[
+                    html.Div(
+                        className="stack-plot",
+                        children=[
+                            dcc.Graph(
+                                figure=fig,
+                                config=dict(
+                                    toImageButtonOptions=dict(
+                                        format="png", width=800, height=600, scale=3.0)
+                            ))]),
+                ])
+        except Exception as e:
+            record_handled_exception(e)
+            if isinstance(e, (KeyError, AssertionError)):
+                logger.info("Could not build the stack plot for the selection: %r", e)
+            else:
+                logger.exception("Could not build the stack plot.")
+            return html.Div(
+                className="stack-plot",
+                children=[html.P(f"{placeholder_title} is not present in the uploaded data.")]
+            )
+
+    return [
+        html.Div([
+            html.Div(id=dict(type=ids.STACK_PLOT, index=index)),
+            render_state_store(ids.STACK_PLOT, index)])
+        for index in range(num_panels)]
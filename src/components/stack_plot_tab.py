@@ -0,0 +1,44 @@
+from dash import Dash, dcc, html
+from dash.dependencies import Input, Output
+from . import ids
+
+from . import stack_plot
+
+
+def render(app: Dash, num_panels: int) -> dcc.Tab:
+    @app.callback(
+        Output(ids.STACK_PLOT_RUN_NAME_DROPDOWN, "options"),
+        Output(ids.STACK_PLOT_RUN_NAME_DROPDOWN, "value"),
+        Input(ids.STELLA_RUN_NAMES_DROPDOWN, "value")
+    )
+    def update_stack_plot_run_name_dropdown(stella_run_names: list[str]) -> tuple[list[dict[str, str]], str]:
+        if not stella_run_names:
+            return [dict(label="None", value="None")], "None"
+        return [dict(label=val, value=val) for val in stella_run_names], stella_run_names[0]
+
+    return dcc.Tab(
+        id=ids.STACKPLOT_TAB,
+        value=ids.STACKPLOT_TAB,
+        label="Stack plots",
+        children=[
+            html.Div(
+                className="stack-plot-header",
+                children=[
+                    html.H4("Stack plots over the last array value.",
+                            style=dict(
+                                fontWeight="bold", color="#047cc4")
+                            ),
+                    html.H6("Select LIBRA run name."),
+                    dcc.Dropdown(
+                        id=ids.STACK_PLOT_RUN_NAME_DROPDOWN,
+                        options=[dict(label="None", value="None")],
+                        value="None"
+                    )
+                ]
+            ),
+            html.Div(
+                className="plot-and-dropdown-container",
+                children=stack_plot.render(app, num_panels)
+            ),
+        ]
+    )
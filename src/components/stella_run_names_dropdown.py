@@ -1,32 +1,59 @@
-from dash import Dash, html, dcc
+from dash import Dash, html, dcc, ctx
 from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
 from . import ids
-from src.data.preprocess_data import preprocess_data
-from typing import Any
+from src.data.dataset_store import Dataset, get_dataset
+from src.data.delta_engine import DeltaMode
+from typing import Any, Optional
 
-import pandas as pd
+NO_DELTA = "none"
 
 def render(app: Dash) -> html.Div:
-    def create_options_and_value(df: pd.DataFrame) -> tuple[list[dict[str, str]], list[str]]:
-        values = sorted(list(set([col.split(":")[0] for col in df.columns])))
-        return [dict(label=val, value=val) for val in values], values
+    def create_options_and_value(
+            dataset: Dataset,
+            baseline: Optional[str],
+            delta_mode: str) -> tuple[list[dict[str, str]], list[str]]:
+        if delta_mode == NO_DELTA or baseline not in dataset.run_names:
+            return [dict(label=val, value=val) for val in dataset.run_names], dataset.run_names
+        virtual_runs = dataset.get_virtual_run_names(baseline, DeltaMode(delta_mode))
+        values = dataset.run_names + virtual_runs
+        return [dict(label=val, value=val) for val in values], virtual_runs
+
+    @app.callback(
+        Output(ids.DELTA_BASELINE_DROPDOWN, "options"),
+        Output(ids.DELTA_BASELINE_DROPDOWN, "value"),
+        Input(ids.FILE_UPLOAD_BUTTON, "n_clicks"),
+        State(ids.DATA_STORAGE, "data")
+    )
+    def update_baseline_dropdown(n_clicks_file_upload: int, data: dict[Any]) -> tuple[list[dict[str, str]], str]:
+        try:
+            dataset = get_dataset(data)
+        except KeyError:
+            raise PreventUpdate
+        return [dict(label=val, value=val) for val in dataset.run_names], dataset.run_names[0]
 
     @app.callback(
         Output(ids.STELLA_RUN_NAMES_DROPDOWN, "options"),
         Output(ids.STELLA_RUN_NAMES_DROPDOWN, "value"),
         Input(ids.SELECT_ALL_RUN_NAMES_BUTTON, "n_clicks"),
         Input(ids.FILE_UPLOAD_BUTTON, "n_clicks"),
+        Input(ids.DELTA_BASELINE_DROPDOWN, "value"),
+        Input(ids.DELTA_MODE_RADIOITEMS, "value"),
         State(ids.DATA_STORAGE, "data")
     )
     def select_all_run_names(
-            n_clicks_select_all: int, 
-            n_clicks_file_upload: int, 
+            n_clicks_select_all: int,
+            n_clicks_file_upload: int,
+            baseline: Optional[str],
+            delta_mode: str,
             data: dict[Any]) -> tuple[list[dict[str, str]], list[str]]:
-        if not data:
+        try:
+            dataset = get_dataset(data)
+        except KeyError:
             raise PreventUpdate
-        df = pd.DataFrame.from_records(data, index="Years")
-        options, value = create_options_and_value(df)
+        options, value = create_options_and_value(dataset, baseline, delta_mode)
+        if ctx.triggered_id == ids.SELECT_ALL_RUN_NAMES_BUTTON:
+            value = [option["value"] for option in options]
         return options, value
 
     return html.Div(
@@ -43,6 +70,24 @@ def render(app: Dash) -> html.Div:
                 className="dropdown-button",
                 children=["Select all"],
                 n_clicks=0
+            ),
+            html.H6("Compare runs against a baseline run."),
+            dcc.RadioItems(
+                id=ids.DELTA_MODE_RADIOITEMS,
+                options=[
+                    dict(label="Values", value=NO_DELTA),
+                    dict(label="Difference", value=DeltaMode.DIFFERENCE.value),
+                    dict(label="Ratio", value=DeltaMode.RATIO.value),
+                    dict(label="Percent change", value=DeltaMode.PERCENT.value),
+                ],
+                value=NO_DELTA,
+                inline=True
+            ),
+            dcc.Dropdown(
+                id=ids.DELTA_BASELINE_DROPDOWN,
+                options=[dict(label="None", value="None")],
+                value="None",
+                clearable=False
             )
         ]
-    )
\ No newline at end of file
+    )
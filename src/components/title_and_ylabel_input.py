@@ -1,56 +1,29 @@
 from dash import Dash, dcc, html
-from dash.dependencies import Input, Output
 
 from . import ids
 
-def render(app: Dash) -> html.Div:
-    @app.callback(
-        Output(ids.TITLE_INPUT, 'value'),
-        Input(ids.MODULE_DROPDOWN, 'value'),
-        Input(ids.VARIABLE_DROPDOWN, 'value'),
-        Input(ids.ARRAYVAL_DROPDOWN_1, 'value'),
-        Input(ids.ARRAYVAL_DROPDOWN_2, 'value'),
-        Input(ids.ARRAYVAL_DROPDOWN_3, 'value')
-    )
-    def update_title(
-        module: str,
-        variable: str,
-        array_val_1: str,
-        array_val_2: str,
-        array_val_3: str,
-    ) -> str:
-        title = f"{module}.{variable}"
-        if array_val_1 != "None":
-            title = title+"["+", ".join([val for val in [array_val_1, array_val_2, array_val_3]\
-                 if val != "None"]) + "]"
-        return title 
-    
-    @app.callback(
-        Output(ids.YLABEL_INPUT, 'value'),
-        Input(ids.MODULE_DROPDOWN, 'value'),
-        Input(ids.VARIABLE_DROPDOWN, 'value')
-    )
-    def update_ylabel(
-        module: str,
-        variable: str
-    ) -> str:
-        return f"{module}.{variable}" 
-
+def render(app: Dash, index: int) -> html.Div:
     return html.Div(
         children=[
             html.H6("Line plot title (Press Enter to submit)."),
-            dcc.Textarea(
-                id=ids.TITLE_INPUT,
+            dcc.Input(
+                id=dict(type=ids.TITLE_INPUT, index=index),
+                type="text",
+                required=True,
+                debounce=True,
                 value='None',
                 className="title-and-ylabel-input"),
             html.H6("Y-axis label (Press Enter to submit)."),
-            dcc.Textarea(
-                id=ids.YLABEL_INPUT,
+            dcc.Input(
+                id=dict(type=ids.YLABEL_INPUT, index=index),
+                type="text",
+                required=True,
+                debounce=True,
                 value='None',
                 className="title-and-ylabel-input"),
             html.H6("Maximum value for Y-axis."),
             dcc.Input(
-                id=ids.MAX_YVAL_INPUT,
+                id=dict(type=ids.MAX_YVAL_INPUT, index=index),
                 type="number",
                 min=0,
                 max=100_000_000_000,
@@ -60,7 +33,7 @@ def render(app: Dash) -> html.Div:
                 className="max-yval-input"),
             html.H6("Decimal point for Y-axis labels?"),
             dcc.RadioItems(
-                    id=ids.DECIMAL_POINT_RADIOITEMS,
+                    id=dict(type=ids.DECIMAL_POINT_RADIOITEMS, index=index),
                     className="radio-items",
                     labelClassName="radio-items-input",
                     options=[
@@ -71,7 +44,7 @@ def render(app: Dash) -> html.Div:
                     value=False),
             html.H6("Is the variable an exogenous input?"),
             dcc.RadioItems(
-                    id=ids.EXOGENOUS_INPUT_RADIOITEMS,
+                    id=dict(type=ids.EXOGENOUS_INPUT_RADIOITEMS, index=index),
                     className="radio-items",
                     labelClassName="radio-items-input",
                     options=[
@@ -79,6 +52,17 @@ def render(app: Dash) -> html.Div:
                         dict(label="No", value=False)
                     ],
                     inline=True,
+                    value=False),
+            html.H6("Plot the runs as individual lines or as aggregate bands (min/max, p5-p95, median)?"),
+            dcc.RadioItems(
+                    id=dict(type=ids.AGGREGATE_RADIOITEMS, index=index),
+                    className="radio-items",
+                    labelClassName="radio-items-input",
+                    options=[
+                        dict(label="Individual runs", value=False),
+                        dict(label="Aggregate bands", value=True)
+                    ],
+                    inline=True,
                     value=False)
         ]
     )
\ No newline at end of file
@@ -0,0 +1,14 @@
+from dash import Dash, html, dcc
+from . import ids
+
+def render(app: Dash, index: int) -> html.Div:
+    return html.Div(
+            children=[
+                html.H6("Search LIBRA variables (module, variable or array value names)."),
+                dcc.Dropdown(
+                    id=dict(type=ids.VARIABLE_SEARCH_DROPDOWN, index=index),
+                    options=[],
+                    placeholder="Type to search...",
+                )
+            ]
+        )
@@ -2,6 +2,10 @@ from dataclasses import dataclass, field
 import pandas as pd
 import re
 
+def natural_sort_key(name: str) -> list:
+    """Sort key which orders embedded numbers numerically, e.g. "Yr2" before "Yr10"."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
 @dataclass(kw_only=True)
 class LIBRAOutputNamesParser:
     """
@@ -9,14 +13,25 @@ class LIBRAOutputNamesParser:
     """
     variable_dict: dict[str, set[str]] = field(default_factory=dict)
     array_val_dict: dict[str, list[str]] = field(default_factory=dict)
+    array_members_dict: dict[str, list[set[str]]] = field(default_factory=dict)
 
     def parse_names_from_dataframe(self, df: pd.DataFrame) -> None:
-        """Update variable and arrayvalue dictionaries based on names parsed from input dataframe."""
+        """
+        Update variable and arrayvalue dictionaries based on names parsed from input dataframe. Names
+        parsed from earlier dataframes are kept, so that appended dataframes only parse their own columns.
+        """
+        for module in self.variable_dict.keys():
+            self.variable_dict[module] = set(self.variable_dict[module])
+        for variable_name in self.array_members_dict.keys():
+            self.array_members_dict[variable_name] = [set(members) for members in self.array_members_dict[variable_name]]
         for col in df.columns:
             variable_name = self._update_variable_dict_from_single_column_name(col)
             self._update_array_val_dict_from_single_column_name(col, variable_name)
         for module in self.variable_dict.keys():
             self.variable_dict[module] = list(self.variable_dict[module])
+        for variable_name in self.array_members_dict.keys():
+            self.array_members_dict[variable_name] = [sorted(members, key=natural_sort_key) 
+                for members in self.array_members_dict[variable_name]]
 
     def _update_variable_dict_from_single_column_name(self, col: str) -> str:
         """
@@ -34,11 +49,18 @@ class LIBRAOutputNamesParser:
     def _update_array_val_dict_from_single_column_name(self, col: str, variable_name: str) -> None:
         """
         Parse variables and corresponding array values from a column name of the LIBRA output pandas dataframe.
+        Records the first array values seen for a variable, and the set of members observed at each array position.
         """
         assert variable_name in col, f"Variable name \"{variable_name}\" is not in column \"{col}\"."
 
-        arrayval_pattern = re.compile(r"\[(\w+|\w+(,\s\w+){0,3})\]")
+        arrayval_pattern = re.compile(r"\[([^\[\]]+)\]")
         for match in arrayval_pattern.findall(col):
+            array_vals = [array_val.strip() for array_val in match.split(",") if array_val.strip() != ""]
             if variable_name not in self.array_val_dict.keys():
-                self.array_val_dict[variable_name] = [array_val.strip() \
-                                for array_val in match[0].split(",") if array_val != ""]
\ No newline at end of file
+                self.array_val_dict[variable_name] = array_vals
+            members = self.array_members_dict.setdefault(variable_name, [])
+            for i, array_val in enumerate(array_vals):
+                if i < len(members):
+                    members[i].add(array_val)
+                else:
+                    members.append(set([array_val]))
@@ -0,0 +1,94 @@
+"""
+Normalization of the column names of uploaded LIBRA outputs, applied once to the whole column index
+when a file is parsed.
+
+STELLA writes some names as formulas (="baseline: Module.variable[US]"), and hand-edited files may
+have stray or doubled whitespace, e.g. around the ": " separating the run name. All names are cleaned
+at once, by string operations on the names joined into one string, and of the columns which end up
+with the same name, the first in file order is kept. The table mapping every original name to its
+normalized name is kept with the dataset, so that exports can refer back to the uploaded names.
+"""
+import logging
+import re
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COLUMN_NAME_MAPPING = "column_name_mapping"  # Key of the mapping table in `DataFrame.attrs`
+
+# The names are joined into one string, so that every substitution is a single pass over all of them.
+_SEPARATOR = "\x00"
+_IRREGULAR_WHITESPACE = ("  ", "\t", "\n", "\r", "\f", "\v", "\xa0")
+_COLON_WITHOUT_SPACE = re.compile(r":(?! )")
+# A name written as a formula, ="...", between separators: only the quotes wrapping the whole name are
+# removed. The pattern starts with a literal, which `re` searches for quickly.
+_STELLA_FORMULA = re.compile(r'\x00= ?"([^\x00]*)"(?=\x00)')
+# The run name: the text before the first colon of a name (array values may contain colons)
+_RUN_SEPARATOR = re.compile(r"(^|\x00)([^:\[\x00]*?) ?: ?")
+
+
+def _replace(text: str, old: str, new: str) -> str:
+    # Searching is faster than copying, and most files have nothing to replace.
+    return text.replace(old, new) if old in text else text
+
+
+def _strip(text: str) -> str:
+    """Strip single spaces around the names joined by `_SEPARATOR`."""
+    return _replace(_replace(text, " " + _SEPARATOR, _SEPARATOR), _SEPARATOR + " ", _SEPARATOR).strip(" ")
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize the names joined by `_SEPARATOR`, skipping the substitutions which would not change them."""
+    if any(whitespace in text for whitespace in _IRREGULAR_WHITESPACE):
+        text = re.sub(r"[^\S\x00]+", " ", text)
+    text = _strip(text)
+    if '"' in text:
+        text = _STELLA_FORMULA.sub(_SEPARATOR + r"\1", _SEPARATOR + text + _SEPARATOR)[1:-1]
+    text = _replace(text, _SEPARATOR + "=", _SEPARATOR).removeprefix("=")
+    text = _strip(text)
+    if " :" in text or _COLON_WITHOUT_SPACE.search(text):
+        text = _RUN_SEPARATOR.sub(r"\1\2: ", text)
+    return text
+
+
+def normalize_names(names: pd.Index) -> pd.DataFrame:
+    """
+    Return the mapping table of the names: one row per name with the `original` name, the `normalized`
+    name and whether the column is `kept`, i.e. is the first with its normalized name.
+    """
+    text = _SEPARATOR.join(map(str, names))
+    if text.count(_SEPARATOR) != max(len(names) - 1, 0):
+        raise ValueError("Column names must not contain NUL characters.")
+    normalized = pd.Index(_normalize_text(text).split(_SEPARATOR) if len(names) else [], dtype=object)
+    return pd.DataFrame(dict(original=names, normalized=normalized, kept=~normalized.duplicated(keep="first")))
+
+
+def identity_mapping(names: pd.Index) -> pd.DataFrame:
+    """Mapping table of names which are already normalized."""
+    return pd.DataFrame(dict(original=names, normalized=names, kept=np.ones(len(names), dtype=bool)))
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the dataframe with normalized column names and without the later columns of duplicated
+    names. The mapping table is stored in `df.attrs[COLUMN_NAME_MAPPING]`.
+    """
+    mapping = normalize_names(df.columns)
+    kept = mapping["kept"].to_numpy()
+    if not kept.all():
+        logger.warning("Dropping %d columns whose names duplicate earlier columns, e.g. \"%s\".",
+                       (~kept).sum(), mapping["original"][~kept].iloc[0])
+        df = df.iloc[:, np.flatnonzero(kept)]
+    df.columns = pd.Index(mapping["normalized"][kept].to_numpy(), dtype=object)
+    df.attrs[COLUMN_NAME_MAPPING] = mapping
+    return df
+
+
+def pop_mapping(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove and return the mapping table of a dataframe returned by `normalize_columns`, or return an
+    identity mapping. The table is removed because pandas compares the attrs of concatenated frames.
+    """
+    mapping = df.attrs.pop(COLUMN_NAME_MAPPING, None)
+    return identity_mapping(df.columns) if mapping is None else mapping
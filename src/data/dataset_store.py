@@ -0,0 +1,306 @@
+"""
+Server-side storage of uploaded LIBRA datasets.
+
+Callbacks exchange the key of a stored dataset through `ids.DATA_STORAGE` instead of shipping the
+whole dataset between the browser and the server on every interaction.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+from uuid import uuid4
+import logging
+import numpy as np
+import pandas as pd
+
+from .LIBRAOutputNamesParser import LIBRAOutputNamesParser
+from .delta_engine import DeltaMode, compute_deltas, virtual_run_name
+from .run_aggregates import compute_run_aggregates
+from .variable_search_index import VariableSearchIndex
+from .tidy_view import TidyView, build_column_index
+from .dimension_aggregates import aggregate_dimensions, grouping_key, is_aggregated
+from .lazy_columns import LazyCSVColumns
+from .column_names import pop_mapping
+
+logger = logging.getLogger(__name__)
+
+# Memory of the stored datasets (values of their dataframes) above which the least recently used
+# datasets are evicted. Every session keeps one dataset, which its next upload replaces.
+MAX_STORED_BYTES = 2 << 30
+MAX_CACHED_COLUMN_SELECTIONS = 64
+MAX_CACHED_DELTAS = 4
+MAX_CACHED_AGGREGATES = 64
+MAX_CACHED_DIMENSION_AGGREGATES = 64
+
+_datasets: OrderedDict[str, "Dataset"] = OrderedDict()
+_pinned_keys: set[str] = set()  # Datasets loaded at startup, which are never evicted
+_datasets_lock = Lock()
+
+
+class LRUCache:
+    """Thread-safe cache of computed results, which evicts the least recently used results."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._results: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for the key, or compute and cache it."""
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        result = compute()
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+        return result
+
+
+@dataclass(kw_only=True)
+class Dataset:
+    """
+    LIBRA outputs dataframe together with the run, module, variable and array-value names parsed from it.
+    Virtual runs holding deltas against a baseline run can be selected like the runs of the dataframe.
+
+    A dataset is created either from a parsed dataframe `df` or from `lazy_columns`, whose names are
+    known from the header of the uploaded file and whose values are loaded on first access. `frame()`
+    returns the whole dataframe in both cases. `column_name_mapping` maps the column names of the
+    uploaded files to the normalized names of the dataset (see `src.data.column_names`).
+    """
+    df: Optional[pd.DataFrame] = None
+    lazy_columns: Optional[LazyCSVColumns] = field(default=None, repr=False)
+    names_parser: LIBRAOutputNamesParser = field(default_factory=LIBRAOutputNamesParser)
+    column_name_mapping: pd.DataFrame = field(default=None, init=False, repr=False)
+    run_names: list[str] = field(default_factory=list, init=False)
+    search_index: VariableSearchIndex = field(default_factory=VariableSearchIndex, init=False, repr=False)
+    virtual_runs: dict[str, tuple[str, DeltaMode]] = field(default_factory=dict, init=False, repr=False)
+    _column_index: Optional[pd.DataFrame] = field(default=None, init=False, repr=False)
+    _column_cache: LRUCache = field(
+        default_factory=lambda: LRUCache(MAX_CACHED_COLUMN_SELECTIONS), init=False, repr=False)
+    _delta_cache: LRUCache = field(
+        default_factory=lambda: LRUCache(MAX_CACHED_DELTAS), init=False, repr=False)
+    _aggregate_cache: LRUCache = field(
+        default_factory=lambda: LRUCache(MAX_CACHED_AGGREGATES), init=False, repr=False)
+    _dimension_aggregate_cache: LRUCache = field(
+        default_factory=lambda: LRUCache(MAX_CACHED_DIMENSION_AGGREGATES), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if (self.df is None) == (self.lazy_columns is None):
+            raise ValueError("A dataset is created from either a dataframe or lazily loaded columns.")
+        self.column_name_mapping = (pop_mapping(self.df) if self.df is not None
+                                    else self.lazy_columns.column_name_mapping)
+        # The names parser only reads the column names, so it is given an empty frame.
+        self.names_parser.parse_names_from_dataframe(pd.DataFrame(np.empty((0, len(self.columns))), columns=self.columns))
+        self._index_names(self.columns)
+
+    def _index_names(self, columns: pd.Index) -> None:
+        self.run_names = sorted(set(self.run_names) | set([col.split(":")[0] for col in columns]))
+        self.search_index.add_names(columns.str.split(": ", n=1).str[1].unique())
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory of the values of the dataframe, or of the lazily loaded file."""
+        if self.df is None:
+            return self.lazy_columns.nbytes
+        return self.df.shape[0] * self.df.shape[1] * np.dtype(float).itemsize
+
+    @property
+    def columns(self) -> pd.Index:
+        """Names of the columns of the dataframe, available before lazily loaded values are."""
+        return self.df.columns if self.df is not None else self.lazy_columns.columns
+
+    def frame(self) -> pd.DataFrame:
+        """Return the whole dataframe, waiting for lazily loaded columns to be parsed if needed."""
+        if self.df is None:
+            self.df = self.lazy_columns.frame()
+        return self.df
+
+    def copy(self) -> "Dataset":
+        """
+        Return a dataset of the same dataframe, whose appends do not change this dataset. Virtual runs
+        are not copied; they are registered again when selected.
+        """
+        copied = Dataset(df=self.frame())
+        copied.column_name_mapping = self.column_name_mapping
+        return copied
+
+    def append(self, df: pd.DataFrame) -> None:
+        """
+        Append the columns (new runs) of another LIBRA outputs dataframe, aligned on Years. Only the new
+        columns are parsed into the name and search indices. Raises a ValueError for columns which are
+        already in the dataset.
+        """
+        duplicated = df.columns.intersection(self.columns)
+        if not duplicated.empty:
+            raise ValueError(f"Columns are already in the dataset: {', '.join(duplicated[:5])}"
+                             + (", ..." if len(duplicated) > 5 else ""))
+        self.names_parser.parse_names_from_dataframe(df)
+        self.column_name_mapping = pd.concat([self.column_name_mapping, pop_mapping(df)], ignore_index=True)
+        # The union of the years is not sorted when the runs cover different years.
+        self.df = pd.concat([self.frame(), df], axis=1, join="outer").sort_index()
+        self._index_names(df.columns)
+        self._column_index = None
+        # Cached selections may hold "All" columns, which the new columns add array members to, or
+        # years which are now padded, so every cache is cleared.
+        self._column_cache.clear()
+        self._aggregate_cache.clear()
+        self._dimension_aggregate_cache.clear()
+        self._delta_cache.clear()
+
+    def get_columns(self, col_names: list[str]) -> pd.DataFrame:
+        """
+        Return the given columns of the dataframe. Extractions are cached, so that plots and panels
+        selecting the same columns share one extraction. Raises a KeyError for missing columns.
+        """
+        return self._column_cache.get(tuple(col_names), lambda: self._select_columns(col_names))
+
+    def _select_columns(self, col_names: list[str]) -> pd.DataFrame:
+        run_names = set(col.split(": ", 1)[0] for col in col_names)
+        if run_names.isdisjoint(self.virtual_runs) and not any(is_aggregated(col) for col in col_names):
+            if self.df is None:
+                return self.lazy_columns.get_columns(col_names)
+            return self.df.loc[:, list(col_names)]
+        return pd.DataFrame({col: self._source_frame(col)[col] for col in col_names}, index=self.frame().index)
+
+    def _source_frame(self, col_name: str) -> pd.DataFrame:
+        run_name = col_name.split(": ", 1)[0]
+        if run_name in self.virtual_runs:
+            if is_aggregated(col_name):
+                return self.get_aggregate_deltas(col_name, *self.virtual_runs[run_name])
+            return self.get_deltas(*self.virtual_runs[run_name])
+        if is_aggregated(col_name):
+            return self.get_dimension_aggregates(col_name)
+        return self.frame()
+
+    def tidy(self) -> TidyView:
+        """
+        Return the long-format view (run, module, variable, dim1..3, year, value) of the dataframe. The
+        column index of the view is parsed on first use; values are only read when a result is requested.
+        """
+        if self._column_index is None:
+            self._column_index = build_column_index(self.columns)
+        return TidyView(self.frame(), self._column_index)
+
+    def has_column(self, col_name: str) -> bool:
+        """Whether the column is in the dataframe or in the virtual runs."""
+        if col_name.split(": ", 1)[0] not in self.virtual_runs and not is_aggregated(col_name):
+            return col_name in self.columns
+        return col_name in self._source_frame(col_name).columns
+
+    def get_virtual_run_names(self, baseline: str, mode: DeltaMode) -> list[str]:
+        """Registers and returns the virtual runs of the deltas of every other run against `baseline`."""
+        if baseline not in self.run_names:
+            raise KeyError(f"Baseline run \"{baseline}\" is not in the dataset.")
+        names = [virtual_run_name(run_name, baseline, mode) for run_name in self.run_names if run_name != baseline]
+        for name in names:
+            self.virtual_runs[name] = (baseline, mode)
+        return names
+
+    def get_deltas(self, baseline: str, mode: DeltaMode) -> pd.DataFrame:
+        """
+        Return the deltas of every variable of every run against `baseline`, computed once per
+        (baseline, mode) and cached, so that switching variables reuses them.
+        """
+        return self._delta_cache.get((baseline, mode), lambda: compute_deltas(self.frame(), baseline, mode))
+
+    def get_dimension_aggregates(self, col_name: str) -> pd.DataFrame:
+        """
+        Return the columns of every run for a column name selecting all members of array dimensions, e.g.
+        "baseline: Battery Market.demand[US, All (sum)]". Cached per variable and array values.
+        """
+        key = grouping_key(col_name)
+        return self._dimension_aggregate_cache.get(key, lambda: aggregate_dimensions(self.tidy(), key))
+
+    def get_aggregate_deltas(self, col_name: str, baseline: str, mode: DeltaMode) -> pd.DataFrame:
+        """
+        Return the deltas against `baseline` of the columns of every run for a column name selecting all
+        members of array dimensions. The members are aggregated before the deltas are taken, so that a
+        ratio is the ratio of the sums or means, not the sum or mean of the ratios.
+        """
+        key = (grouping_key(col_name), baseline, mode)
+        return self._dimension_aggregate_cache.get(
+            key, lambda: compute_deltas(self.get_dimension_aggregates(col_name), baseline, mode))
+
+    def get_run_aggregates(self, col_names: list[str]) -> pd.DataFrame:
+        """
+        Return the per-year min/max and quantiles across the given columns (one variable of many runs).
+        Cached per selection, so the aggregates are computed once per variable and set of runs.
+        """
+        return self._aggregate_cache.get(
+            tuple(col_names), lambda: compute_run_aggregates(self.get_columns(col_names)))
+
+
+def add_dataset(
+        df: Optional[pd.DataFrame] = None,
+        lazy_columns: Optional[LazyCSVColumns] = None,
+        pinned: bool = False,
+        replaces: Optional[str] = None) -> str:
+    """
+    Store a dataset, from a dataframe or from lazily loaded columns, and return its key. The dataset
+    `replaces` (the previous upload of the session) is removed, unless pinned. When the stored datasets
+    take more than `MAX_STORED_BYTES`, the least recently used ones are evicted, except pinned ones and
+    the new one.
+    """
+    return _store(Dataset(df=df, lazy_columns=lazy_columns), pinned, replaces)
+
+
+def _store(dataset: Dataset, pinned: bool = False, replaces: Optional[str] = None) -> str:
+    key = uuid4().hex
+    with _datasets_lock:
+        if replaces not in _pinned_keys:
+            _datasets.pop(replaces, None)
+        _datasets[key] = dataset
+        if pinned:
+            _pinned_keys.add(key)
+        stored_bytes = sum(stored.nbytes for stored in _datasets.values())
+        for stored_key in [stored_key for stored_key in _datasets if stored_key not in _pinned_keys][:-1]:
+            if stored_bytes <= MAX_STORED_BYTES:
+                break
+            stored_bytes -= _datasets.pop(stored_key).nbytes
+            logger.warning("Evicted dataset %s to stay within %d MiB.", stored_key, MAX_STORED_BYTES >> 20)
+    return key
+
+
+def append_to_dataset(data: Optional[dict[str, Any]], df: pd.DataFrame) -> str:
+    """
+    Append the columns of a dataframe to the dataset referenced by `ids.DATA_STORAGE` and return its key.
+    A pinned dataset is shared by all sessions, so it is copied under a new key, which is returned,
+    and the copy is appended to.
+    """
+    dataset = get_dataset(data)
+    with _datasets_lock:
+        pinned = data["key"] in _pinned_keys
+    if not pinned:
+        dataset.append(df)
+        return data["key"]
+    dataset = dataset.copy()
+    dataset.append(df)
+    return _store(dataset)
+
+
+def is_expired(data: Optional[dict[str, Any]]) -> bool:
+    """Whether the dataset referenced by `ids.DATA_STORAGE` has been uploaded but is no longer stored."""
+    if not data or not data.get("key"):
+        return False
+    with _datasets_lock:
+        return data["key"] not in _datasets
+
+
+def get_dataset(data: Optional[dict[str, Any]]) -> Dataset:
+    """Return the dataset referenced by the contents of `ids.DATA_STORAGE`."""
+    if not data or "key" not in data:
+        raise KeyError("No dataset has been uploaded.")
+    with _datasets_lock:
+        dataset = _datasets[data["key"]]
+        _datasets.move_to_end(data["key"])
+    return dataset
@@ -0,0 +1,61 @@
+"""
+Differences, ratios and percent changes of every variable of a LIBRA outputs dataframe against a
+baseline run. The results are exposed as virtual runs, e.g. "high demand - baseline", whose columns
+are named like the columns of real runs.
+"""
+from enum import Enum
+import numpy as np
+import pandas as pd
+
+
+class DeltaMode(Enum):
+    DIFFERENCE = "difference"
+    RATIO = "ratio"
+    PERCENT = "percent"
+
+
+def virtual_run_name(run_name: str, baseline: str, mode: DeltaMode) -> str:
+    """Name of the virtual run holding the delta of `run_name` against `baseline`."""
+    match mode:
+        case DeltaMode.DIFFERENCE:
+            return f"{run_name} - {baseline}"
+        case DeltaMode.RATIO:
+            return f"{run_name} / {baseline}"
+        case DeltaMode.PERCENT:
+            return f"{run_name} vs {baseline} (%)"
+
+
+def split_column_names(columns: pd.Index) -> tuple[pd.Index, pd.Index]:
+    """Split "<run>: <variable>" column names into run names and full variable names."""
+    split_names = columns.str.split(": ", n=1, expand=True)
+    return split_names.get_level_values(0), split_names.get_level_values(1)
+
+
+def compute_deltas(df: pd.DataFrame, baseline: str, mode: DeltaMode) -> pd.DataFrame:
+    """
+    Compute the delta of every non-baseline column against the baseline column of the same variable,
+    in one operation on the aligned 2-D arrays. Columns of variables missing from the baseline are NaN.
+    """
+    runs, variables = split_column_names(df.columns)
+    is_baseline = np.asarray(runs == baseline)
+    if not is_baseline.any():
+        raise KeyError(f"Baseline run \"{baseline}\" is not in the dataset.")
+
+    baseline_positions = pd.Index(variables[is_baseline]).get_indexer(variables[~is_baseline])
+    values = df.to_numpy(dtype=float)
+    run_values = values[:, ~is_baseline]
+    baseline_values = values[:, is_baseline][:, baseline_positions]
+    baseline_values[:, baseline_positions < 0] = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        match mode:
+            case DeltaMode.DIFFERENCE:
+                deltas = run_values - baseline_values
+            case DeltaMode.RATIO:
+                deltas = run_values / baseline_values
+            case DeltaMode.PERCENT:
+                deltas = 100.0 * (run_values / baseline_values - 1.0)
+
+    columns = [f"{virtual_run_name(run, baseline, mode)}: {variable}"
+               for run, variable in zip(runs[~is_baseline], variables[~is_baseline])]
+    return pd.DataFrame(deltas, index=df.index, columns=columns)
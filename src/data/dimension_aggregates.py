@@ -0,0 +1,48 @@
+"""
+Columns of a variable reduced over one or more of its array dimensions, e.g.
+"baseline: Battery Market.demand[US, All (sum)]" for the demand in the US summed over chemistries.
+"""
+import pandas as pd
+
+from .tidy_view import DIMENSIONS, TidyView
+
+ALL_SUM = "All (sum)"
+ALL_MEAN = "All (mean)"
+ALL_MEMBERS = {ALL_SUM: "sum", ALL_MEAN: "mean"}
+
+GroupingKey = tuple[str, str, tuple[str, ...]]
+
+
+def is_aggregated(col_name: str) -> bool:
+    """Whether a column name selects all members of an array dimension."""
+    return "[" in col_name and any(all_member in col_name for all_member in ALL_MEMBERS)
+
+
+def grouping_key(col_name: str) -> GroupingKey:
+    """Split "<run>: <module>.<variable>[<array values>]" into module, variable and array values."""
+    _, _, full_variable_name = col_name.partition(": ")
+    name, _, array_vals = full_variable_name.partition("[")
+    module, _, variable = name.partition(".")
+    return module, variable, tuple(val.strip() for val in array_vals.rstrip("]").split(",") if val.strip())
+
+
+def aggregate_dimensions(view: TidyView, key: GroupingKey) -> pd.DataFrame:
+    """
+    Reduce the columns of a variable over the dimensions set to an "All" member, for every run at once.
+    Dimensions set to `ALL_SUM` are summed before the mean is taken over dimensions set to `ALL_MEAN`.
+    Returns one column per run, named like the aggregated column of that run.
+    """
+    module, variable, array_vals = key
+    fixed = {dim: val for dim, val in zip(DIMENSIONS, array_vals) if val not in ALL_MEMBERS}
+    mean_dims = [dim for dim, val in zip(DIMENSIONS, array_vals) if ALL_MEMBERS.get(val) == "mean"]
+    sum_dims = [dim for dim, val in zip(DIMENSIONS, array_vals) if ALL_MEMBERS.get(val) == "sum"]
+
+    view = view.filter(module=module, variable=variable, **fixed)
+    if sum_dims and mean_dims:
+        sums = view.group_by(["run", *mean_dims], "sum")
+        reduced = sums.T.groupby(level="run").mean().T
+    else:
+        reduced = view.group_by("run", "sum" if sum_dims else "mean")
+    full_variable_name = f"{module}.{variable}[{', '.join(array_vals)}]"
+    reduced.columns = [f"{run}: {full_variable_name}" for run in reduced.columns]
+    return reduced
@@ -0,0 +1,172 @@
+"""
+Streaming export of stored LIBRA datasets through routes on the Dash Flask server.
+
+Exports are written in chunks of rows, so that large selections are never materialized as one
+CSV string in the browser or on the server. Parquet and Arrow IPC exports require pyarrow.
+"""
+from importlib.util import find_spec
+from io import BytesIO
+from typing import Iterable, Iterator, Optional
+from flask import Flask, Response, abort, request, stream_with_context
+import pandas as pd
+import re
+
+from .dataset_store import Dataset, get_dataset
+
+# pyarrow is optional, and only imported when a Parquet or Arrow IPC export is requested.
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+EXPORT_CHUNK_CELLS = 1 << 16
+
+SERIES_EXPORT_ROUTE = "/export/series.csv"
+BULK_EXPORT_ROUTE = "/export/bulk"
+COLUMN_NAMES_EXPORT_ROUTE = "/export/column_names.csv"
+BULK_EXPORT_FORMATS = dict(
+    csv=("text/csv", "csv"),
+    parquet=("application/vnd.apache.parquet", "parquet"),
+    arrow=("application/vnd.apache.arrow.stream", "arrows"),
+)
+TABLE_YEARS = slice(2020, 2050)
+
+
+def _iter_row_chunks(df: pd.DataFrame, columns: Optional[list[str]]) -> Iterator[pd.DataFrame]:
+    """
+    Yield the given columns of the dataframe (default: all), a chunk of about `EXPORT_CHUNK_CELLS` values
+    at a time. Only one chunk of the selection is copied at a time.
+    """
+    columns = list(df.columns) if columns is None else columns
+    chunk_rows = max(1, EXPORT_CHUNK_CELLS // max(1, len(columns)))
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].loc[:, columns]
+
+
+def iter_csv_chunks(df: pd.DataFrame, columns: Optional[list[str]] = None, index: bool = True) -> Iterator[str]:
+    """Yield the given columns of the dataframe as CSV text, in chunks of rows. The first chunk is the header."""
+    columns = list(df.columns) if columns is None else columns
+    yield df.iloc[:0].loc[:, columns].to_csv(index=index)
+    for chunk in _iter_row_chunks(df, columns):
+        yield chunk.to_csv(header=False, index=index)
+
+
+def _iter_arrow_chunks(df: pd.DataFrame, columns: list[str], file_format: str) -> Iterator[bytes]:
+    """Yield the given columns as a Parquet file (one row group per chunk) or as an Arrow IPC stream."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = BytesIO()
+    schema = pa.Schema.from_pandas(df.iloc[:0].loc[:, columns])
+    writer = pq.ParquetWriter(sink, schema) if file_format == "parquet" else pa.ipc.new_stream(sink, schema)
+
+    def flush() -> bytes:
+        chunk = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return chunk
+
+    for chunk in _iter_row_chunks(df, columns):
+        batch = pa.RecordBatch.from_pandas(chunk, schema=schema)
+        if file_format == "parquet":
+            writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            writer.write_batch(batch)
+        yield flush()
+    writer.close()
+    yield flush()
+
+
+def _compile_variable_pattern(pattern: str) -> str:
+    """
+    Translate a variable pattern, e.g. "Battery Market.demand[*, LFP]", into a regular expression.
+    `*` matches any characters within a module, variable or array-value name. A pattern without array
+    values matches every array value of the variable.
+    """
+    def glob(part: str) -> str:
+        return ".*".join(re.escape(piece) for piece in part.strip().split("*"))
+
+    name, _, array_vals = pattern.partition("[")
+    module, _, variable = name.partition(".")
+    regex = rf"{glob(module)}\.{glob(variable)}"
+    if array_vals:
+        regex += r"\[" + r",\s*".join(glob(array_val) for array_val in array_vals.rstrip("]").split(",")) + r"\]"
+    else:
+        regex += r"(\[.*\])?"
+    return regex
+
+
+def select_columns(dataset: Dataset, patterns: Iterable[str], run_names: Iterable[str]) -> list[str]:
+    """Returns the columns of the dataset matching any of the variable patterns for the given runs."""
+    regex = "|".join(f"(?:{_compile_variable_pattern(pattern)})" for pattern in patterns)
+    if not regex:
+        return []
+    split_names = dataset.columns.str.split(": ", n=1, expand=True)
+    runs, variables = split_names.get_level_values(0), split_names.get_level_values(1)
+    mask = runs.isin(list(run_names)) & pd.Series(variables).str.fullmatch(regex).fillna(False).to_numpy()
+    return dataset.columns[mask].tolist()
+
+
+def make_series_table(df: pd.DataFrame, col_names: list[str]) -> pd.DataFrame:
+    """
+    Returns the series of the given columns as table rows: one row per column (STELLA run) with the
+    column name in the `index` column, and one column per year of `TABLE_YEARS`.
+    """
+    selected_data = df.loc[TABLE_YEARS, col_names].transpose()
+    selected_data.columns = [str(col) for col in selected_data.columns]
+    return selected_data.rename_axis("index").reset_index()
+
+
+def register_export_routes(server: Flask) -> None:
+    """Registers the export routes on the Flask server of the Dash app."""
+
+    @server.route(SERIES_EXPORT_ROUTE)
+    def export_series() -> Response:
+        try:
+            dataset = get_dataset(dict(key=request.args.get("key", "")))
+            col_names = request.args.getlist("column")
+            table = make_series_table(dataset.get_columns(col_names), col_names)
+        except KeyError:
+            abort(404)
+        return Response(
+            stream_with_context(iter_csv_chunks(table, index=False)),
+            mimetype="text/csv",
+            headers={"Content-Disposition": "attachment; filename=plotted_data.csv"})
+
+    @server.route(BULK_EXPORT_ROUTE)
+    def export_bulk() -> Response:
+        """
+        Streams the columns matching the `pattern` arguments for the `run` arguments (default: all runs)
+        of the stored dataset `key`, as `format` csv (default), parquet or arrow.
+        """
+        file_format = request.args.get("format", "csv")
+        if file_format not in BULK_EXPORT_FORMATS:
+            abort(400, f"Unknown export format \"{file_format}\".")
+        if file_format != "csv" and not HAS_PYARROW:
+            abort(501, f"Exporting {file_format} requires pyarrow.")
+        try:
+            dataset = get_dataset(dict(key=request.args.get("key", "")))
+        except KeyError:
+            abort(404)
+        run_names = request.args.getlist("run") or dataset.run_names
+        col_names = select_columns(dataset, request.args.getlist("pattern"), run_names)
+        if not col_names:
+            abort(404, "No columns match the requested patterns and runs.")
+        if file_format == "csv":
+            chunks = iter_csv_chunks(dataset.frame(), col_names)
+        else:
+            chunks = _iter_arrow_chunks(dataset.frame(), col_names, file_format)
+        mimetype, extension = BULK_EXPORT_FORMATS[file_format]
+        return Response(
+            stream_with_context(chunks),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename=libra_export.{extension}"})
+
+    @server.route(COLUMN_NAMES_EXPORT_ROUTE)
+    def export_column_names() -> Response:
+        """Streams the mapping of the original to the normalized column names of the stored dataset `key`."""
+        try:
+            dataset = get_dataset(dict(key=request.args.get("key", "")))
+        except KeyError:
+            abort(404)
+        return Response(
+            stream_with_context(iter_csv_chunks(dataset.column_name_mapping, index=False)),
+            mimetype="text/csv",
+            headers={"Content-Disposition": "attachment; filename=column_names.csv"})
@@ -0,0 +1,107 @@
+"""
+Lazily loaded columns of an uploaded LIBRA output CSV file.
+
+Only the header is parsed up front, which is enough to build the name and search indices and fill the
+dropdowns. Meanwhile, the whole file is parsed into a dataframe in a background thread. Columns
+requested before that parse finishes are read on their own (pandas `usecols`), which skips the
+conversion of all other columns, and are kept until the whole dataframe is available.
+"""
+from threading import Event, Lock, Thread
+from typing import Optional
+import io
+import logging
+import numpy as np
+import pandas as pd
+
+from .column_names import normalize_columns, normalize_names, pop_mapping
+from .preprocess_data import PANDAS_FLOAT_PRECISION, read_csv, read_header
+from .stella_formats import is_horizontal_layout
+
+logger = logging.getLogger(__name__)
+
+
+class LazyCSVColumns:
+    """Columns of a LIBRA output CSV file, named from its header and loaded on first access."""
+
+    def __init__(self, decoded: bytes, column_name_mapping: pd.DataFrame, engine: str = "auto") -> None:
+        kept = column_name_mapping["kept"].to_numpy()
+        self.column_name_mapping = column_name_mapping
+        self.columns = pd.Index(column_name_mapping["normalized"][kept].to_numpy(), dtype=object)
+        self._decoded = decoded
+        # Positions in the file of the kept columns, after the Years column
+        self._positions = dict(zip(self.columns, np.flatnonzero(kept) + 1))
+        self._loaded: dict[str, pd.Series] = {}
+        self._loaded_lock = Lock()
+        self._frame: Optional[pd.DataFrame] = None
+        self._parsed = Event()
+        Thread(target=self._parse, args=(engine,), daemon=True).start()
+
+    @classmethod
+    def from_csv(cls, decoded: bytes, engine: str = "auto") -> Optional["LazyCSVColumns"]:
+        """
+        Read the column names from the header of the CSV file and start parsing it in the background.
+        Returns None for headers which pandas would rename (duplicate or blank names) and for files in
+        the horizontal layout, which must be parsed eagerly.
+        """
+        header = read_header(decoded)
+        names = header[1:]
+        if not names or "" in names or len(set(names)) != len(names) or is_horizontal_layout(header):
+            return None
+        return cls(decoded, normalize_names(pd.Index(names, dtype=object)), engine)
+
+    def _parse(self, engine: str) -> None:
+        try:
+            frame = normalize_columns(read_csv(self._decoded, engine))
+            pop_mapping(frame)
+            if not frame.columns.equals(self.columns):
+                raise ValueError("The parsed columns differ from the header.")
+            with self._loaded_lock:
+                self._frame = frame
+                self._loaded.clear()
+                self._decoded = b""
+        except Exception:
+            logger.exception("Could not parse the uploaded file in the background.")
+        self._parsed.set()
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the whole file has been parsed into a dataframe."""
+        return self._frame is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory of the parsed dataframe, or of the file and the loaded columns until it is parsed."""
+        with self._loaded_lock:
+            if self._frame is not None:
+                return self._frame.shape[0] * self._frame.shape[1] * np.dtype(float).itemsize
+            return len(self._decoded) + sum(series.nbytes for series in self._loaded.values())
+
+    def frame(self) -> pd.DataFrame:
+        """Return the dataframe of the whole file, waiting for the background parse if needed."""
+        self._parsed.wait()
+        if self._frame is None:
+            raise ValueError("The uploaded file could not be parsed.")
+        return self._frame
+
+    def get_columns(self, col_names: list[str]) -> pd.DataFrame:
+        """Return the given columns, reading those not loaded yet from the file. Raises a KeyError for missing columns."""
+        with self._loaded_lock:
+            if self._frame is not None:
+                return self._frame.loc[:, list(col_names)]
+            missing = [col for col in dict.fromkeys(col_names) if col not in self._loaded]
+            decoded = self._decoded
+        if missing:
+            # The file is parsed without the lock, which `nbytes` takes while the dataset store is locked.
+            positions = [self._positions[col] for col in missing]
+            df = pd.read_csv(io.BytesIO(decoded), usecols=[0, *positions], index_col=0,
+                             float_precision=PANDAS_FLOAT_PRECISION)
+            # usecols returns the columns in file order, with the names before normalization.
+            names_by_position = dict(zip(positions, missing))
+            df.columns = [names_by_position[position] for position in sorted(positions)]
+        with self._loaded_lock:
+            if self._frame is not None:
+                return self._frame.loc[:, list(col_names)]
+            if missing:
+                for col, series in df.items():
+                    self._loaded.setdefault(col, series)
+            return pd.DataFrame({col: self._loaded[col] for col in col_names})
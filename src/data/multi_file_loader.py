@@ -0,0 +1,89 @@
+"""
+Loading of LIBRA outputs split over several files, e.g. one file per run or per module. CSV files in
+the vertical or horizontal layout and XLSX workbooks are read (see `src.data.stella_formats`).
+
+The files are decoded and parsed in parallel on a thread pool (the pandas and Arrow parsers release the
+GIL while tokenizing), then merged on Years. A column found in more than one file is a conflict,
+reported with the names of the files, rather than silently taking the values of one of them.
+"""
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+import os
+import pandas as pd
+
+from .column_names import COLUMN_NAME_MAPPING, normalize_columns, pop_mapping
+from .preprocess_data import decode_contents
+from .stella_formats import is_xlsx, read_csv_file, read_xlsx
+
+MAX_CONFLICTS_REPORTED = 5
+
+
+def _parse(filename: str, decoded: bytes, engine: str) -> pd.DataFrame:
+    """Parse a CSV file (vertical or horizontal layout) or an XLSX workbook, whose sheets are merged."""
+    if is_xlsx(filename):
+        return merge_frames({f"{filename} [{sheet}]": normalize_columns(sheet_df)
+                             for sheet, sheet_df in read_xlsx(decoded).items()})
+    return normalize_columns(read_csv_file(decoded, engine))
+
+
+def parse_files(
+        files: dict[str, bytes],
+        engine: str = "auto",
+        max_workers: Optional[int] = None) -> dict[str, pd.DataFrame]:
+    """Parse the files (file name to bytes) in parallel, by default on one thread per core."""
+    max_workers = max_workers or min(len(files), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return {name: _parse(name, decoded, engine) for name, decoded in files.items()}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(_parse, name, decoded, engine) for name, decoded in files.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def merge_frames(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Merge the frames parsed from several files on their sorted Years index. Raises a ValueError naming the
+    conflicting columns and files when a column is in more than one file. The column name mappings of
+    the frames are concatenated, with the name of the file of every column.
+    """
+    frames = {name: df for name, df in frames.items() if not df.empty}
+    if not frames:
+        return pd.DataFrame()
+    files_by_column: defaultdict[str, list[str]] = defaultdict(list)
+    for name, df in frames.items():
+        for col in df.columns:
+            files_by_column[col].append(name)
+    conflicts = [f"{col} ({', '.join(files)})" for col, files in files_by_column.items() if len(files) > 1]
+    if conflicts:
+        raise ValueError(f"Columns are in more than one file: {'; '.join(conflicts[:MAX_CONFLICTS_REPORTED])}"
+                         + ("; ..." if len(conflicts) > MAX_CONFLICTS_REPORTED else ""))
+    mappings = [pop_mapping(df) for df in frames.values()]
+    # The union of the years is not sorted when the files cover different years, e.g. 2015-2050 and 2010-2050.
+    merged = pd.concat(list(frames.values()), axis=1, join="outer").sort_index()
+    # The sheets of a workbook are merged first, and keep the sheet names as file names.
+    merged.attrs[COLUMN_NAME_MAPPING] = pd.concat(
+        [mapping if "file" in mapping else mapping.assign(file=name) for name, mapping in zip(frames, mappings)],
+        ignore_index=True)
+    return merged
+
+
+def _unique_names(filenames: list[str]) -> list[str]:
+    """Prefix the names shared by several files (e.g. from different folders) with their position, e.g. "2: a.csv"."""
+    counts = Counter(filenames)
+    return [f"{i + 1}: {name}" if counts[name] > 1 else name for i, name in enumerate(filenames)]
+
+
+def load_uploads(contents: list[str], filenames: Optional[list[str]] = None, engine: str = "auto") -> pd.DataFrame:
+    """Decode, parse and merge the files of a dcc.Upload component with `multiple=True`."""
+    filenames = _unique_names(filenames or [f"file {i + 1}" for i in range(len(contents))])
+    return merge_frames(parse_files(
+        {name: decode_contents(file_contents) for name, file_contents in zip(filenames, contents)}, engine))
+
+
+def load_directory(directory: Path, patterns: tuple[str, ...] = ("*.csv", "*.xlsx"), engine: str = "auto") -> pd.DataFrame:
+    """Parse and merge the CSV and XLSX files of a directory. Raises a FileNotFoundError if none match the patterns."""
+    paths = sorted(path for pattern in patterns for path in Path(directory).glob(pattern))
+    if not paths:
+        raise FileNotFoundError(f"No files matching {', '.join(patterns)} in {directory}.")
+    return merge_frames(parse_files({path.name: path.read_bytes() for path in paths}, engine))
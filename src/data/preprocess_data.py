@@ -1,10 +1,88 @@
+"""
+Parsing of uploaded LIBRA output CSV files into dataframes indexed by Years.
+
+Two parse engines are available. "pandas" is the single-threaded C parser of `pd.read_csv`. "arrow"
+is the multithreaded CSV reader of pyarrow, which parses the blocks of wide files on all cores and
+requires pyarrow to be installed. "auto" (the default) uses the Arrow reader when pyarrow is installed,
+and falls back to pandas when it is not or when the Arrow reader cannot produce the same frame.
+"""
 import io
 import base64
+import csv
+import logging
+from importlib.util import find_spec
 import pandas as pd
-from src.plotting_functions.plotting_functions_plotly import fix_col_names
+from .column_names import normalize_columns
+
+logger = logging.getLogger(__name__)
+
+# pyarrow is optional, and only imported when the Arrow parse engine is used.
+HAS_PYARROW = find_spec("pyarrow") is not None
+
+PARSE_ENGINES = ["auto", "arrow", "pandas"]
+ARROW_BLOCK_SIZE = 1 << 22  # Bytes parsed per thread at a time
+# The default float parser of pandas may be off by one unit in the last place, whereas Arrow (and the
+# Python float parser of the horizontal layout) round correctly, so pandas must parse floats exactly.
+PANDAS_FLOAT_PRECISION = "round_trip"
+
+
+def _read_csv_pandas(decoded: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.StringIO(decoded.decode("utf-8")), index_col=0, float_precision=PANDAS_FLOAT_PRECISION)
+
+
+def _read_csv_arrow(decoded: bytes) -> pd.DataFrame:
+    """
+    Parse the CSV with the multithreaded Arrow reader into the same frame as `_read_csv_pandas`.
+    Raises ValueError for files whose frame would differ, i.e. with duplicate or blank column names,
+    which pandas renames.
+    """
+    import pyarrow as pa
+    from pyarrow import csv
+
+    try:
+        table = csv.read_csv(
+            pa.BufferReader(decoded),
+            read_options=csv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE))
+    except pa.ArrowInvalid as e:
+        raise ValueError(str(e)) from e
+    if len(set(table.column_names)) != len(table.column_names) or "" in table.column_names[1:]:
+        raise ValueError("The CSV file has duplicate or blank column names.")
+    # Columns without any value are read as nulls by Arrow and as NaN floats by pandas.
+    schema = pa.schema([field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+                        for field in table.schema])
+    df = table.cast(schema).to_pandas(use_threads=True)
+    index_name = df.columns[0]
+    df = df.set_index(index_name)
+    df.index.name = index_name or None
+    return df
+
+
+def read_csv(decoded: bytes, engine: str = "auto") -> pd.DataFrame:
+    """Parse the bytes of a LIBRA output CSV file with the given engine (see `PARSE_ENGINES`)."""
+    if engine not in PARSE_ENGINES:
+        raise ValueError(f"Unknown parse engine \"{engine}\", expected one of {', '.join(PARSE_ENGINES)}.")
+    if engine == "arrow" or (engine == "auto" and HAS_PYARROW):
+        try:
+            return _read_csv_arrow(decoded)
+        except (ImportError, ValueError) as e:
+            if engine == "arrow":
+                raise
+            logger.debug("Falling back to the pandas parser: %s", e)
+    return _read_csv_pandas(decoded)
+
+
+def read_header(decoded: bytes) -> list[str]:
+    """Cells of the first row of a CSV file, without parsing the rest of the file."""
+    end_of_header = decoded.find(b"\n")
+    header = decoded[:end_of_header if end_of_header >= 0 else len(decoded)].decode("utf-8-sig")
+    return next(csv.reader([header.rstrip("\r")]), [])
+
+
+def decode_contents(contents: str) -> bytes:
+    """Decode the base64 `contents` of a dcc.Upload component into the bytes of the uploaded file."""
+    return base64.b64decode(contents.split(',')[1])
+
 
-def preprocess_data(contents: bytes) -> pd.DataFrame:
-    decoded = base64.b64decode(contents.split(',')[1])
-    df = pd.read_csv(io.StringIO(decoded.decode("utf-8")), index_col=0)
-    fix_col_names(df)
-    return df
\ No newline at end of file
+def preprocess_data(contents: bytes, engine: str = "auto") -> pd.DataFrame:
+    decoded = decode_contents(contents)
+    return normalize_columns(read_csv(decoded, engine))
@@ -0,0 +1,56 @@
+"""
+Query API over the long-format view of stored LIBRA datasets (see `src.data.tidy_view`), served by a
+route on the Dash Flask server.
+"""
+from flask import Flask, Response, abort, request, stream_with_context
+import numpy as np
+import pandas as pd
+
+from .dataset_store import get_dataset
+from .export import iter_csv_chunks
+from .tidy_view import AGGREGATIONS, NAME_FIELDS
+
+QUERY_ROUTE = "/api/query"
+
+
+def _to_long_format(grouped: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """
+    Stack the groups of a group-by result into rows of (keys, year, value). The rows are built from the
+    values, since `DataFrame.stack` does not keep the groups whose key is NaN.
+    """
+    columns = grouped.columns
+    labels = pd.DataFrame(columns.tolist() if isinstance(columns, pd.MultiIndex) else {keys[0]: columns}, columns=keys)
+    rows = labels.iloc[np.tile(np.arange(len(labels)), len(grouped.index))].reset_index(drop=True)
+    rows["year"] = np.repeat(grouped.index.to_numpy(), len(labels))
+    rows["value"] = grouped.to_numpy(dtype=float).reshape(-1)
+    return rows
+
+
+def register_query_routes(server: Flask) -> None:
+    """Registers the query route on the Flask server of the Dash app."""
+
+    @server.route(QUERY_ROUTE)
+    def query() -> Response:
+        """
+        Filters the stored dataset `key` by the name fields run, module, variable and dim1..3 (each
+        repeatable) and by `start_year`/`end_year`. With `group_by` (comma separated name fields), the
+        values are reduced per year with `agg` (sum, mean, min or max). Returns rows of the name fields,
+        year and value as `format` json (default) or csv.
+        """
+        try:
+            dataset = get_dataset(dict(key=request.args.get("key", "")))
+        except KeyError:
+            abort(404)
+        criteria = {name_field: request.args.getlist(name_field)
+                    for name_field in NAME_FIELDS if name_field in request.args}
+        years = slice(request.args.get("start_year", type=int), request.args.get("end_year", type=int))
+        group_by = [key.strip() for key in request.args.get("group_by", "").split(",") if key.strip()]
+        agg = request.args.get("agg", "sum")
+        if any(key not in NAME_FIELDS for key in group_by) or agg not in AGGREGATIONS:
+            abort(400, f"group_by must be among {', '.join(NAME_FIELDS)}, agg among {', '.join(AGGREGATIONS)}.")
+
+        view = dataset.tidy().filter(years=years, **criteria)
+        result = _to_long_format(view.group_by(group_by, agg), group_by) if group_by else view.to_frame()
+        if request.args.get("format", "json") == "csv":
+            return Response(stream_with_context(iter_csv_chunks(result, index=False)), mimetype="text/csv")
+        return Response(result.to_json(orient="records"), mimetype="application/json")
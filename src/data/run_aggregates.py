@@ -0,0 +1,20 @@
+"""
+Per-year aggregates of a variable across runs: the envelope (min/max) and quantiles of the runs.
+"""
+import warnings
+import numpy as np
+import pandas as pd
+
+AGGREGATE_QUANTILES = dict(min=0.0, p5=0.05, p50=0.5, p95=0.95, max=1.0)
+
+
+def compute_run_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute the quantiles in `AGGREGATE_QUANTILES` of every row (year) across the columns (runs) of the
+    dataframe, in one reduction. Missing values are ignored.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        quantiles = np.nanquantile(
+            df.to_numpy(dtype=float), list(AGGREGATE_QUANTILES.values()), axis=1)
+    return pd.DataFrame(quantiles.T, index=df.index, columns=list(AGGREGATE_QUANTILES))
@@ -0,0 +1,131 @@
+"""
+Readers of the STELLA export formats other than the vertical-layout CSV: horizontal-layout CSV files
+(one row per variable, one column per year) and XLSX workbooks in either layout. All readers return
+the vertical-layout dataframe indexed by Years, so every format feeds the same dataset and name index.
+
+Horizontal files are transposed a block of rows at a time, so the whole file is never held as one
+row-major table. XLSX workbooks are streamed with the read-only reader of openpyxl, which is optional
+and only imported when a workbook is uploaded.
+"""
+from importlib.util import find_spec
+from typing import Iterable, Iterator, Sequence
+import csv
+import io
+import numpy as np
+import pandas as pd
+
+from .preprocess_data import read_csv, read_header
+
+HAS_OPENPYXL = find_spec("openpyxl") is not None
+
+XLSX_EXTENSIONS = (".xlsx", ".xlsm")
+HORIZONTAL_BLOCK_ROWS = 1024  # Variables transposed at a time
+
+
+def is_xlsx(filename: str) -> bool:
+    return filename.lower().endswith(XLSX_EXTENSIONS)
+
+
+def _is_number(value) -> bool:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def is_horizontal_layout(header: Sequence) -> bool:
+    """Whether the cells after the first of a header row are all years, as in the horizontal layout."""
+    return len(header) > 1 and all(_is_number(cell) for cell in header[1:])
+
+
+def _years_index(header: Sequence) -> pd.Index:
+    """Index of the years of a horizontal header, named like the Years column of the vertical layout."""
+    return pd.Index(pd.to_numeric(pd.Index([str(cell) for cell in header[1:]])), name="Years")
+
+
+def _row_values(row: Sequence, width: int) -> list:
+    """Values of a row cut or padded to `width` cells, with empty cells as NaN."""
+    values = [np.nan if cell in (None, "") else cell for cell in row[:width]]
+    return values + [np.nan] * (width - len(values))
+
+
+def _transpose_blocks(header: Sequence, rows: Iterable[Sequence]) -> pd.DataFrame:
+    """Transpose horizontal rows (variable name followed by its values) into a dataframe, a block at a time."""
+    years = _years_index(header)
+    blocks, names, values = [], [], []
+
+    def flush() -> None:
+        if names:
+            blocks.append(pd.DataFrame(np.array(values, dtype=float).T, index=years, columns=names))
+            names.clear()
+            values.clear()
+
+    for row in rows:
+        if not row or row[0] in (None, ""):
+            continue
+        names.append(str(row[0]))
+        values.append(_row_values(row[1:], len(header) - 1))
+        if len(names) >= HORIZONTAL_BLOCK_ROWS:
+            flush()
+    flush()
+    if not blocks:
+        return pd.DataFrame(index=years)
+    return pd.concat(blocks, axis=1)
+
+
+def read_horizontal_csv(decoded: bytes) -> pd.DataFrame:
+    """Parse a horizontal-layout CSV file into the vertical-layout dataframe."""
+    reader = csv.reader(io.StringIO(decoded.decode("utf-8-sig")))
+    header = next(reader, [])
+    return _transpose_blocks(header, reader)
+
+
+def _iter_sheet_rows(sheet) -> Iterator[tuple]:
+    for row in sheet.iter_rows(values_only=True):
+        # Trailing empty cells of read-only sheets are returned as None.
+        while row and row[-1] is None:
+            row = row[:-1]
+        if row:
+            yield row
+
+
+def _read_vertical_rows(header: Sequence, rows: Iterable[Sequence]) -> pd.DataFrame:
+    values = np.array([_row_values(row, len(header)) for row in rows], dtype=float).reshape(-1, len(header))
+    years = pd.Index(values[:, 0], name=str(header[0]) if header[0] not in (None, "") else None)
+    if np.all(years == np.round(years)):
+        years = years.astype(int)
+    return pd.DataFrame(values[:, 1:], index=years, columns=[str(name) for name in header[1:]])
+
+
+def read_xlsx(decoded: bytes) -> dict[str, pd.DataFrame]:
+    """
+    Stream the sheets of an XLSX workbook (vertical or horizontal layout) into vertical-layout
+    dataframes, by sheet name. Empty sheets are skipped. Requires openpyxl.
+    """
+    if not HAS_OPENPYXL:
+        raise ImportError("Reading XLSX workbooks requires openpyxl.")
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(io.BytesIO(decoded), read_only=True, data_only=True)
+    try:
+        frames = {}
+        for sheet in workbook.worksheets:
+            rows = _iter_sheet_rows(sheet)
+            header = next(rows, None)
+            if not header or len(header) < 2:
+                continue
+            if is_horizontal_layout(header):
+                frames[sheet.title] = _transpose_blocks(header, rows)
+            else:
+                frames[sheet.title] = _read_vertical_rows(header, rows)
+        return frames
+    finally:
+        workbook.close()
+
+
+def read_csv_file(decoded: bytes, engine: str = "auto") -> pd.DataFrame:
+    """Parse a CSV file in the vertical layout (with the given parse engine) or in the horizontal layout."""
+    if is_horizontal_layout(read_header(decoded)):
+        return read_horizontal_csv(decoded)
+    return read_csv(decoded, engine)
@@ -0,0 +1,124 @@
+"""
+Lazy long-format ("tidy") view of a wide LIBRA outputs dataframe, with one row per
+(run, module, variable, dim1, dim2, dim3, year, value).
+
+The view only holds the positions of the selected columns and years of the wide dataframe. Filters
+and group-by keys are resolved on the column index, which has one row per column of the wide
+dataframe, and values are read from the wide dataframe when a result is requested.
+"""
+from typing import Iterable, Optional, Union
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ["dim1", "dim2", "dim3"]
+NAME_FIELDS = ["run", "module", "variable", *DIMENSIONS]
+AGGREGATIONS = ["sum", "mean", "min", "max"]
+
+_COLUMN_NAME_PATTERN = (
+    r"^(?P<run>[^:]+):\s(?P<module>[^.\[]+)\.(?P<variable>[^\[]+?)"
+    r"(?:\[(?P<dim1>[^,\]]+)(?:,\s*(?P<dim2>[^,\]]+))?(?:,\s*(?P<dim3>[^,\]]+))?\])?$"
+)
+
+
+def build_column_index(columns: pd.Index) -> pd.DataFrame:
+    """
+    Parse the names of the columns of a wide LIBRA outputs dataframe into a frame with the fields in
+    `NAME_FIELDS`, indexed by column position. Columns of variables without array values have no
+    dimensions, and columns which cannot be parsed have no fields.
+    """
+    column_index = columns.to_series(index=np.arange(len(columns))).str.extract(_COLUMN_NAME_PATTERN)
+    return column_index.astype("category")
+
+
+class TidyView:
+    """Filtered long-format view of the wide dataframe `df`, whose columns are described by `column_index`."""
+
+    def __init__(
+            self,
+            df: pd.DataFrame,
+            column_index: pd.DataFrame,
+            positions: Optional[np.ndarray] = None,
+            years: slice = slice(None)) -> None:
+        self.df = df
+        self.column_index = column_index
+        self.positions = np.arange(len(column_index)) if positions is None else positions
+        self.years = years
+
+    def __len__(self) -> int:
+        return len(self.positions) * len(self._year_index())
+
+    def _year_index(self) -> pd.Index:
+        return self.df.loc[self.years].index
+
+    def names(self) -> pd.DataFrame:
+        """Name fields of the columns in the view."""
+        return self.column_index.iloc[self.positions]
+
+    def filter(self, years: Optional[slice] = None, **criteria: Union[str, Iterable[str]]) -> "TidyView":
+        """
+        Return the view restricted to the given years and to the columns whose name fields (see
+        `NAME_FIELDS`) equal the given value, or one of the given values.
+        """
+        mask = np.ones(len(self.positions), dtype=bool)
+        names = self.names()
+        for name_field, values in criteria.items():
+            if name_field not in NAME_FIELDS:
+                raise KeyError(f"Unknown field \"{name_field}\", expected one of {', '.join(NAME_FIELDS)}.")
+            values = [values] if isinstance(values, str) else list(values)
+            mask &= names[name_field].isin(values).to_numpy()
+        return TidyView(self.df, self.column_index, self.positions[mask], self.years if years is None else years)
+
+    def _values(self) -> np.ndarray:
+        year_positions = self.df.index.get_indexer(self._year_index())
+        return self.df.iloc[year_positions, self.positions].to_numpy(dtype=float)
+
+    def group_by(self, keys: Union[str, list[str]], agg: str = "sum") -> pd.DataFrame:
+        """
+        Reduce the values of the view over the columns sharing the given name fields, per year. Returns
+        a wide dataframe indexed by year with one column per group. Missing values are ignored. Columns
+        without a value for a field, e.g. variables without array values grouped on dim1, are kept in
+        groups whose value of that field is NaN, sorted after the others.
+        """
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        if agg not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation \"{agg}\", expected one of {', '.join(AGGREGATIONS)}.")
+        names = self.names()[keys]
+        # Categorical keys drop their missing values even with dropna=False in older pandas.
+        names = names.astype({key: object for key in keys if names[key].isna().any()})
+        grouped = names.groupby(keys, observed=True, sort=True, dropna=False)
+        groups = grouped.ngroup().to_numpy()
+        valid = groups >= 0
+        group_labels = grouped.size().index
+        values = self._values()[:, valid]
+        groups = groups[valid]
+
+        order = np.argsort(groups, kind="stable")
+        values, groups = values[:, order], groups[order]
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.array([], dtype=int)
+        if not len(starts):
+            return pd.DataFrame(index=self._year_index(), columns=group_labels, dtype=float)
+        missing = np.isnan(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            match agg:
+                case "sum":
+                    reduced = np.add.reduceat(np.where(missing, 0.0, values), starts, axis=1)
+                case "mean":
+                    reduced = np.add.reduceat(np.where(missing, 0.0, values), starts, axis=1) \
+                        / np.add.reduceat((~missing).astype(float), starts, axis=1)
+                case "min":
+                    reduced = np.minimum.reduceat(np.where(missing, np.inf, values), starts, axis=1)
+                    reduced[np.isinf(reduced)] = np.nan
+                case "max":
+                    reduced = np.maximum.reduceat(np.where(missing, -np.inf, values), starts, axis=1)
+                    reduced[np.isinf(reduced)] = np.nan
+        return pd.DataFrame(reduced, index=self._year_index(), columns=group_labels)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the view as a long-format dataframe with the fields in `NAME_FIELDS`, year and value."""
+        year_index = self._year_index()
+        values = self._values()
+        names = self.names().reset_index(drop=True)
+        tidy = names.iloc[np.tile(np.arange(len(names)), len(year_index))].reset_index(drop=True)
+        tidy["year"] = np.repeat(year_index.to_numpy(), len(names))
+        tidy["value"] = values.reshape(-1)
+        return tidy
@@ -0,0 +1,83 @@
+"""
+In-memory search index over the full variable names (module, variable and array values) of a LIBRA
+outputs dataset, used by the variable search box.
+"""
+from collections import defaultdict
+from typing import Iterable
+import re
+import numpy as np
+
+NGRAM_SIZE = 3
+MAX_SEARCH_RESULTS = 50
+# Separators of the words of a name, e.g. the ".", "[", ", " and "]" around modules and array values
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _ngrams(text: str) -> set[str]:
+    """
+    Character n-grams of the lower-cased words of the text, padded so that short words and word starts
+    match. Punctuation separates words, so that every array value is indexed as a word of its own.
+    """
+    padded = f"  {_NON_WORD.sub(' ', text.lower())} "
+    return set(padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1))
+
+
+class VariableSearchIndex:
+    """
+    Inverted index from character trigrams to the full variable names containing them. A query is
+    ranked by the fraction of its trigrams found in a name, so typos and partial words still match,
+    and only the posting lists of the query trigrams are read, whatever the number of names.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self._postings: defaultdict[str, list[int]] = defaultdict(list)
+        self._posting_arrays: dict[str, np.ndarray] = {}
+        self.add_names(names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add_names(self, names: Iterable[str]) -> None:
+        """Add names which are not in the index yet."""
+        for name in names:
+            if name in self._name_ids:
+                continue
+            name_id = len(self.names)
+            self._name_ids[name] = name_id
+            self.names.append(name)
+            for ngram in _ngrams(name):
+                self._postings[ngram].append(name_id)
+                self._posting_arrays.pop(ngram, None)
+
+    def _posting_array(self, ngram: str) -> np.ndarray:
+        if ngram not in self._posting_arrays:
+            self._posting_arrays[ngram] = np.array(self._postings.get(ngram, []), dtype=np.int64)
+        return self._posting_arrays[ngram]
+
+    def search(self, query: str, limit: int = MAX_SEARCH_RESULTS) -> list[str]:
+        """
+        Return up to `limit` names ranked by the share of query trigrams they contain. Names containing
+        the query as a substring rank first, and shorter names rank before longer ones on ties.
+        """
+        query = query.strip()
+        if not query or not self.names:
+            return []
+        query_ngrams = _ngrams(query)
+        postings = [self._posting_array(ngram) for ngram in query_ngrams]
+        postings = [posting for posting in postings if len(posting)]
+        if not postings:
+            return []
+        counts = np.bincount(np.concatenate(postings), minlength=len(self.names))
+        candidates = np.flatnonzero(counts >= max(1, counts.max() // 2))
+        if len(candidates) > 4 * limit:
+            candidates = candidates[np.argpartition(-counts[candidates], 4 * limit)[:4 * limit]]
+        lower_query = query.lower()
+        ranked = sorted(
+            candidates,
+            key=lambda name_id: (
+                lower_query not in self.names[name_id].lower(),
+                -counts[name_id],
+                len(self.names[name_id])))
+        return [self.names[name_id] for name_id in ranked[:limit]]
@@ -0,0 +1,221 @@
+"""
+Latency, payload size, trigger and exception metrics of the Dash callbacks, served in the Prometheus
+text format by a route on the Dash Flask server.
+
+`instrument_callbacks` wraps `app.callback`, so it must be called before the layout is created: every
+callback registered afterwards is timed when it runs. The request and response sizes of the
+`_dash-update-component` requests are attributed to the callback which handled them.
+"""
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from typing import Callable, Optional
+import logging
+import time
+
+from dash import Dash, ctx
+from dash.exceptions import PreventUpdate
+from flask import Flask, Response, g, has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+METRICS_ROUTE = "/metrics"
+UPDATE_COMPONENT_ROUTE = "_dash-update-component"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # Seconds
+SIZE_BUCKETS = (1e2, 1e3, 1e4, 1e5, 1e6, 1e7)  # Bytes
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds, as in the Prometheus text format."""
+    buckets: tuple[float, ...]
+    counts: list[int] = field(init=False)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile, or None without observations."""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass
+class CallbackStats:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    request_bytes: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    response_bytes: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    triggers: Counter = field(default_factory=Counter)
+    prevented: int = 0
+    exceptions: Counter = field(default_factory=Counter)
+
+
+_lock = Lock()
+callback_stats: defaultdict[str, CallbackStats] = defaultdict(CallbackStats)
+
+
+def callback_name(func: Callable) -> str:
+    """Name of a callback in the metrics: its module and function name, e.g. "line_plot.update_line_plot"."""
+    return f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+
+def _trigger_label() -> str:
+    """Id of the component which triggered the running callback. Pattern-matching ids are reduced to their type."""
+    triggered_id = ctx.triggered_id
+    if isinstance(triggered_id, dict):
+        return str(triggered_id.get("type"))
+    return "none" if triggered_id is None else str(triggered_id)
+
+
+def instrument(func: Callable) -> Callable:
+    """Wrap a callback function to record its wall time, trigger and exceptions."""
+    name = callback_name(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if has_request_context():
+            g.callback_name = name
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except PreventUpdate:
+            with _lock:
+                callback_stats[name].prevented += 1
+            raise
+        except Exception as e:
+            with _lock:
+                callback_stats[name].exceptions[type(e).__name__] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            trigger = _trigger_label()
+            with _lock:
+                stats = callback_stats[name]
+                stats.latency.observe(elapsed)
+                stats.triggers[trigger] += 1
+            logger.debug("%s triggered by %s took %.1f ms.", name, trigger, elapsed * 1e3)
+
+    return wrapper
+
+
+def record_handled_exception(exception: Exception) -> None:
+    """
+    Count an exception which a callback catches and turns into a placeholder, under the running callback.
+    Instrumented callbacks only count the exceptions they raise.
+    """
+    name = g.get("callback_name", "unknown") if has_request_context() else "unknown"
+    with _lock:
+        callback_stats[name].exceptions[type(exception).__name__] += 1
+
+
+def instrument_callbacks(app: Dash) -> None:
+    """Instrument every callback registered on the app from now on, and record the payload sizes."""
+    register_callback = app.callback
+
+    @wraps(register_callback)
+    def callback(*args, **kwargs):
+        decorator = register_callback(*args, **kwargs)
+        return lambda func: decorator(instrument(func))
+
+    app.callback = callback
+
+    @app.server.after_request
+    def record_payload_sizes(response: Response) -> Response:
+        name = g.get("callback_name")
+        if name and request.path.endswith(UPDATE_COMPONENT_ROUTE):
+            with _lock:
+                stats = callback_stats[name]
+                stats.request_bytes.observe(request.content_length or 0)
+                stats.response_bytes.observe(response.calculate_content_length() or 0)
+        return response
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _histogram_lines(metric: str, labels: str, histogram: Histogram) -> list[str]:
+    lines, cumulative = [], 0
+    for bound, count in zip([*histogram.buckets, "+Inf"], histogram.counts):
+        cumulative += count
+        lines.append(f"{metric}_bucket{{{labels},le=\"{bound}\"}} {cumulative}")
+    lines.append(f"{metric}_sum{{{labels}}} {histogram.total}")
+    lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def format_metrics() -> str:
+    """The callback metrics in the Prometheus text exposition format."""
+    histograms = dict(
+        libra_callback_duration_seconds=("latency", "Wall time of the callback function."),
+        libra_callback_request_bytes=("request_bytes", "Size of the callback request body."),
+        libra_callback_response_bytes=("response_bytes", "Size of the callback response body."),
+    )
+    with _lock:
+        stats = dict(callback_stats)
+        lines = []
+        for metric, (attribute, description) in histograms.items():
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} histogram"]
+            for name, callback in sorted(stats.items()):
+                lines += _histogram_lines(metric, f"callback=\"{_escape(name)}\"", getattr(callback, attribute))
+        lines += ["# HELP libra_callback_triggers_total Callback runs per triggering component.",
+                  "# TYPE libra_callback_triggers_total counter"]
+        for name, callback in sorted(stats.items()):
+            for trigger, count in sorted(callback.triggers.items()):
+                lines.append(f"libra_callback_triggers_total{{callback=\"{_escape(name)}\","
+                             f"trigger=\"{_escape(trigger)}\"}} {count}")
+        lines += ["# HELP libra_callback_prevented_total Callback runs which raised PreventUpdate.",
+                  "# TYPE libra_callback_prevented_total counter"]
+        for name, callback in sorted(stats.items()):
+            lines.append(f"libra_callback_prevented_total{{callback=\"{_escape(name)}\"}} {callback.prevented}")
+        lines += ["# HELP libra_callback_exceptions_total Exceptions raised by callbacks, per exception type.",
+                  "# TYPE libra_callback_exceptions_total counter"]
+        for name, callback in sorted(stats.items()):
+            for exception, count in sorted(callback.exceptions.items()):
+                lines.append(f"libra_callback_exceptions_total{{callback=\"{_escape(name)}\","
+                             f"exception=\"{_escape(exception)}\"}} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def summarize_metrics() -> list[dict]:
+    """One row per callback with its run count, latency quantiles, mean payload sizes and exception count."""
+    with _lock:
+        rows = []
+        for name, stats in sorted(callback_stats.items()):
+            p50, p95 = stats.latency.quantile(0.5), stats.latency.quantile(0.95)
+            rows.append(dict(
+                callback=name,
+                runs=stats.latency.count,
+                mean_ms=round(1e3 * stats.latency.total / max(1, stats.latency.count), 1),
+                p50_ms=None if p50 is None else 1e3 * p50,
+                p95_ms=None if p95 is None else 1e3 * p95,
+                mean_request_kb=round(stats.request_bytes.total / max(1, stats.request_bytes.count) / 1e3, 1),
+                mean_response_kb=round(stats.response_bytes.total / max(1, stats.response_bytes.count) / 1e3, 1),
+                prevented=stats.prevented,
+                exceptions=sum(stats.exceptions.values()),
+            ))
+    return rows
+
+
+def register_metrics_routes(server: Flask) -> None:
+    """Registers the metrics route on the Flask server of the Dash app."""
+
+    @server.route(METRICS_ROUTE)
+    def metrics() -> Response:
+        return Response(format_metrics(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,105 @@
+"""
+Opt-in cProfile profiling of the Dash callbacks, for finding where the time of a slow interaction goes.
+
+`profile_callbacks` wraps `app.callback`, like `instrument_callbacks`, so it must be called before the
+layout is created. Only the selected callbacks are wrapped, and nothing is wrapped when profiling is
+not enabled. The profile of every run is written to the profile directory as a `.prof` file (for
+`python -m pstats` or snakeviz) with a text summary, and only the slowest runs are kept.
+"""
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Optional
+import cProfile
+import heapq
+import io
+import logging
+import pstats
+import re
+import time
+
+from dash import Dash
+
+from .callback_metrics import callback_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEEP = 20
+SUMMARY_LINES = 40
+
+
+@dataclass
+class CallbackProfiler:
+    """Profiles callback runs and keeps the profiles of the `keep` slowest runs in `directory`."""
+    directory: Path
+    callbacks: Optional[set[str]] = None  # Names as in the callback metrics, e.g. "line_plot.update_line_plot"
+    keep: int = DEFAULT_KEEP
+    _slowest: list[tuple[float, str]] = field(default_factory=list, init=False)  # Min-heap of (seconds, stem)
+    _profile_lock: Lock = field(default_factory=Lock, init=False)
+    _files_lock: Lock = field(default_factory=Lock, init=False)
+
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def selects(self, name: str) -> bool:
+        return self.callbacks is None or name in self.callbacks
+
+    def wrap(self, func: Callable) -> Callable:
+        """Wrap a callback function to profile its runs. Concurrent runs are not profiled."""
+        name = callback_name(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._profile_lock.acquire(blocking=False):
+                return func(*args, **kwargs)
+            profile = cProfile.Profile()
+            start = time.perf_counter()
+            try:
+                return profile.runcall(func, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._profile_lock.release()
+                self._save(name, profile, elapsed)
+
+        return wrapper
+
+    def _save(self, name: str, profile: cProfile.Profile, elapsed: float) -> None:
+        with self._files_lock:
+            if len(self._slowest) >= self.keep and elapsed <= self._slowest[0][0]:
+                return
+            stem = f"{name}_{time.strftime('%Y%m%d-%H%M%S')}_{1e3 * elapsed:.0f}ms_{time.perf_counter_ns()}"
+            stem = re.sub(r"[^\w.-]", "_", stem)
+            profile.dump_stats(self.directory / f"{stem}.prof")
+            summary = io.StringIO()
+            pstats.Stats(profile, stream=summary).sort_stats("cumulative").print_stats(SUMMARY_LINES)
+            (self.directory / f"{stem}.txt").write_text(f"{name} took {1e3 * elapsed:.1f} ms.\n{summary.getvalue()}")
+            heapq.heappush(self._slowest, (elapsed, stem))
+            if len(self._slowest) > self.keep:
+                _, fastest = heapq.heappop(self._slowest)
+                for suffix in (".prof", ".txt"):
+                    (self.directory / f"{fastest}{suffix}").unlink(missing_ok=True)
+        logger.debug("Profiled %s (%.1f ms).", name, 1e3 * elapsed)
+
+
+def profile_callbacks(
+        app: Dash,
+        directory: Path,
+        callbacks: Optional[set[str]] = None,
+        keep: int = DEFAULT_KEEP) -> CallbackProfiler:
+    """Profile the given callbacks (default: all) registered on the app from now on."""
+    profiler = CallbackProfiler(Path(directory), callbacks, keep)
+    register_callback = app.callback
+
+    @wraps(register_callback)
+    def callback(*args, **kwargs):
+        decorator = register_callback(*args, **kwargs)
+
+        def register(func: Callable):
+            return decorator(profiler.wrap(func) if profiler.selects(callback_name(func)) else func)
+        return register
+
+    app.callback = callback
+    logger.info("Profiling %s callbacks into %s, keeping the %d slowest runs.",
+                "all" if callbacks is None else ", ".join(sorted(callbacks)), directory, keep)
+    return profiler
@@ -0,0 +1,45 @@
+"""
+Recording of the `_dash-update-component` requests of a session, for replaying them with the load
+tester (`python -m benchmarks.load_test`).
+
+Every callback request is appended to a JSON lines file with its time since the first request and
+its response status, which the replay expects again (204 for callbacks which prevented the update). The
+stored dataset keys returned by the uploads are recorded too, so that the replay can substitute the
+keys of its own uploads in the requests which follow.
+"""
+from pathlib import Path
+from threading import Lock
+import json
+import logging
+import time
+
+from flask import Flask, Response, request
+
+from src.components import ids
+from .callback_metrics import UPDATE_COMPONENT_ROUTE
+
+logger = logging.getLogger(__name__)
+
+
+def record_requests(server: Flask, path: Path) -> None:
+    """Append the callback requests served by the Flask server of the Dash app to the JSON lines file."""
+    path = Path(path)
+    lock = Lock()
+    start: list[float] = []
+
+    @server.after_request
+    def record_request(response: Response) -> Response:
+        if not request.path.endswith(UPDATE_COMPONENT_ROUTE) or request.method != "POST":
+            return response
+        data_storage = None
+        if response.status_code == 200 and ids.DATA_STORAGE in request.get_json()["output"]:
+            data_storage = json.loads(response.get_data())["response"].get(ids.DATA_STORAGE, {}).get("data")
+        with lock:
+            start[:] = start or [time.perf_counter()]
+            record = dict(time=time.perf_counter() - start[0], body=request.get_json(), data_storage=data_storage,
+                          status=response.status_code)
+            with path.open("a") as f:
+                f.write(json.dumps(record) + "\n")
+        return response
+
+    logger.info("Recording callback requests to %s.", path)
@@ -2,7 +2,8 @@
 LIBRA variable base data types
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
+from typing import Optional
 from enum import Enum, unique
 
 
@@ -56,68 +57,73 @@ class ArrayType(Enum):
     PROJECT_YEAR = "ProjectYear"
 
     @staticmethod
-    def enumerate_array_type(input) -> list[str]:
-        """Returns a list of possible values for a LIBRA array type."""
-        input_arraytype = ArrayType(input)
-        match ArrayType(input):
-            case ArrayType.REGION:
-                return ["US", "ROW"]
-            case ArrayType.V_BATT_TYPE:
-                return ["BEV", "PHEV"]
-            case ArrayType.BATTERY_CHEMISTRY:
-                return ["LCO", "LFP", "LMO", "NCA", "NMC111", "NMC442", "NMC532", "NMC622", "NMC811", "NMC955"]
-            case ArrayType.MINERAL:
-                return ["Ni", "Co", "Li"]
-            case ArrayType.PROCESS:
-                return ["Hydro", "Pyro"]
-            case ArrayType.STORAGE_BATT_TYPE:
-                return ["Grid"]
-            case ArrayType.CONVERSION_POLICY:
-                return ["Price", "Feedstock", "FCI", "Loan"]
-            case ArrayType.TECH_ATTRIBUTE:
-                return ["ProcessYield", "PSuccess", "InputCap", "CapitalCost", "Risk", "DebtFrac"]
-            case ArrayType.TRANSPORT:
-                return ["TrainRail", "Road"]
-            case ArrayType.PROJECT_YEAR:
-                return [f"D&C{i+1}" for i in range(3)]+[f"Yr{j+1}" for j in range(30+1)]
-        return []
-
-
-@dataclass(slots=True)
+    def enumerate_array_type(input) -> tuple[str, ...]:
+        """Returns the possible values for a LIBRA array type."""
+        return _ARRAY_TYPE_MEMBERS[ArrayType(input)]
+
+    @staticmethod
+    def enumerate_sorted_array_type(input) -> tuple[str, ...]:
+        """Returns the possible values for a LIBRA array type, sorted alphabetically."""
+        return _SORTED_ARRAY_TYPE_MEMBERS[ArrayType(input)]
+
+
+# Lookup tables are built once at import so that classifying array values and enumerating
+# array types are dictionary lookups instead of pattern matches and list rebuilds.
+_ARRAY_TYPE_MEMBERS: dict[ArrayType, tuple[str, ...]] = {
+    ArrayType.REGION: ("US", "ROW"),
+    ArrayType.V_BATT_TYPE: ("BEV", "PHEV"),
+    ArrayType.BATTERY_CHEMISTRY: ("LCO", "LFP", "LMO", "NCA", "NMC111", "NMC442", "NMC532", "NMC622", "NMC811", "NMC955"),
+    ArrayType.MINERAL: ("Ni", "Co", "Li"),
+    ArrayType.PROCESS: ("Hydro", "Pyro"),
+    ArrayType.STORAGE_BATT_TYPE: ("Grid",),
+    ArrayType.CONVERSION_POLICY: ("Price", "Feedstock", "FCI", "Loan"),
+    ArrayType.TECH_ATTRIBUTE: ("ProcessYield", "PSuccess", "InputCap", "CapitalCost", "Risk", "DebtFrac"),
+    ArrayType.TRANSPORT: ("TrainRail", "Road"),
+    ArrayType.PROJECT_YEAR: tuple([f"D&C{i+1}" for i in range(3)]+[f"Yr{j+1}" for j in range(30+1)]),
+}
+
+_SORTED_ARRAY_TYPE_MEMBERS: dict[ArrayType, tuple[str, ...]] = {
+    array_type: tuple(sorted(members)) for array_type, members in _ARRAY_TYPE_MEMBERS.items()}
+
+# Maps array values, and the array type names themselves, to their array type.
+_ARRAY_VALUE_TYPES: dict[str, ArrayType] = {
+    **{array_type.value: array_type for array_type in ArrayType},
+    **{member: array_type for array_type, members in _ARRAY_TYPE_MEMBERS.items() for member in members}
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ArrayValue:
-    """Base data type for all array values."""
+    """
+    Base data type for all array values. Non-strict array values accept values that are not
+    defined here (e.g. members added in newer LIBRA versions) and have no data type.
+    """
     value: str
-    data_type: ArrayType = field(init=False, repr=False)
+    data_type: Optional[ArrayType] = field(init=False, repr=False, compare=False)
+    strict: InitVar[bool] = True
 
-    def __post_init__(self) -> None:
-        self.data_type = self._assign_data_type()
+    def __post_init__(self, strict: bool) -> None:
+        object.__setattr__(self, "data_type", self._assign_data_type(strict))
 
-    def _assign_data_type(self) -> ArrayType:
+    def _assign_data_type(self, strict: bool = True) -> Optional[ArrayType]:
         """Set the array data type based on array value."""
-        match self.value:
-            case "US" | "ROW" | "region":
-                return ArrayType.REGION
-            case "BEV" | "PHEV" | "VBattType":
-                return ArrayType.V_BATT_TYPE
-            case "Co" | "Li" | "Ni" | "mineral":
-                return ArrayType.MINERAL
-            case "Hydro" | "Pyro" | "process":
-                return ArrayType.PROCESS
-            case "LFP" | "LCO" | "NCA" | "LMO" | "NMC111" | "NMC442" | "NMC532" | "NMC622" | "NMC811" | "NMC955" | "chemistry":
-                return ArrayType.BATTERY_CHEMISTRY
-            case "Grid" | "storage_batt_type":
-                return ArrayType.STORAGE_BATT_TYPE
-            case "Price" | "Feedstock" | "FCI" | "Loan" | "ConversionPolicy":
-                return ArrayType.CONVERSION_POLICY
-            case "ProcessYield" | "PSuccess" | "InputCap" | "CapitalCost" | "Risk" | "DebtFrac" | "techattribute":
-                return ArrayType.TECH_ATTRIBUTE
-            case "TrainRail" | "Road" | "transport":
-                return ArrayType.TRANSPORT
-            case 'D&C1' | 'D&C2' | 'D&C3' | 'Yr1' | 'Yr2' | 'Yr3' | 'Yr4' | 'Yr5' | 'Yr6' | 'Yr7' | 'Yr8' | 'Yr9' | 'Yr10' | 'Yr11' | 'Yr12' | 'Yr13' | 'Yr14' | 'Yr15' | 'Yr16' | 'Yr17' | 'Yr18' | 'Yr19' | 'Yr20' | 'Yr21' | 'Yr22' | 'Yr23' | 'Yr24' | 'Yr25' | 'Yr26' | 'Yr27' | 'Yr28' | 'Yr29' | 'Yr30' | "ProjectYear":
-                return ArrayType.PROJECT_YEAR
-            case _:
-                raise InvalidArrayTypeError(
-                    f"{self.value} is not a valid LIBRA array variable.")
+        data_type = _ARRAY_VALUE_TYPES.get(self.value)
+        if data_type is None and strict:
+            raise InvalidArrayTypeError(
+                f"{self.value} is not a valid LIBRA array variable.")
+        return data_type
+
+    @staticmethod
+    def intern(value: str, strict: bool = True) -> "ArrayValue":
+        """Returns the shared ArrayValue instance for a known array value."""
+        try:
+            return _INTERNED_ARRAY_VALUES[value]
+        except KeyError:
+            return ArrayValue(value, strict)
+
+
+_INTERNED_ARRAY_VALUES: dict[str, ArrayValue] = {
+    value: ArrayValue(value) for value in _ARRAY_VALUE_TYPES}
 
 
 @dataclass(kw_only=True, slots=True)
@@ -169,5 +175,5 @@ class Variable:
     def _initialize_array_vals(self) -> list[ArrayValue]:
         """Initialize array value from input."""
         if isinstance(self.array_vals, str):
-            return [ArrayValue(array_val.strip()) for array_val in self.array_vals.split(",") if array_val != ""]
-        return [ArrayValue(str(array_val).strip()) for array_val in self.array_vals if array_val != ""]
+            return [ArrayValue.intern(array_val.strip()) for array_val in self.array_vals.split(",") if array_val != ""]
+        return [ArrayValue.intern(str(array_val).strip()) for array_val in self.array_vals if array_val != ""]
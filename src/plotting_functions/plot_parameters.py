@@ -35,15 +35,8 @@ class PlotParameters(ABC):
         """Construct full variable name from its parts."""
         full_variable_name = f"{self.module.value}.{self.variable}"
         if self.array_vals:
-            full_variable_name += f"[{self.array_vals[0].value}"
-            for val in self.array_vals[1:-1]:
-                full_variable_name += f", {val.value}"
-            if len(self.array_vals) > 1:
-                if isinstance(end_array_val, str):
-                    full_variable_name += f", {end_array_val}"
-                else:
-                    full_variable_name += f", {end_array_val.value}"
-            full_variable_name += "]"
+            end_val = end_array_val if isinstance(end_array_val, str) else end_array_val.value
+            full_variable_name += "[" + ", ".join([val.value for val in self.array_vals[:-1]] + [end_val]) + "]"
         return full_variable_name
 
     def _validate_plot_params(self) -> None:
@@ -65,8 +58,8 @@ class PlotParameters(ABC):
     def _initialize_array_vals(self) -> list[ArrayValue]:
         """Initialize array value from input."""
         if isinstance(self.array_vals, str):
-            return [ArrayValue(array_val.strip()) for array_val in self.array_vals.split(",") if array_val != ""]
-        return [ArrayValue(str(array_val).strip()) for array_val in self.array_vals if array_val != ""]
+            return [ArrayValue.intern(array_val.strip(), strict=False) for array_val in self.array_vals.split(",") if array_val != ""]
+        return [ArrayValue.intern(str(array_val).strip(), strict=False) for array_val in self.array_vals if array_val != ""]
 
     def __repr__(self) -> str:
         return f"\n{self.__class__.__name__}:\n\tmodule : {self.module}, \n\tvariable : {self.variable}, \
@@ -126,6 +119,7 @@ class StackPlotParameters(PlotParameters):
     """
     Class for stack plot parameters.
     """
+    stack_members: Optional[list[str]] = None  # Members of the last array dimension to stack
     _stack_variable_names: list[str] = field(init=False)
     _stack_list: list[str] = field(init=False)
     __all: ClassVar[list] = []
@@ -139,13 +133,18 @@ class StackPlotParameters(PlotParameters):
         StackPlotParameters.__all.append(self)
 
     def _construct_stack_list(self) -> list[str]:
-        """Creates a list of array values to be plotted from the last array value supplied."""
-        return ArrayType.enumerate_array_type(
-            self.array_vals[-1].data_type)
+        """
+        Creates a list of array values to be plotted from the last array value supplied, unless the
+        members to stack are given explicitly.
+        """
+        if self.stack_members:
+            return list(self.stack_members)
+        return list(ArrayType.enumerate_array_type(
+            self.array_vals[-1].data_type))
 
     def _construct_stack_variable_names(self) -> list[str]:
         """Creates a list of variable names for stack plots."""
-        return [self._construct_full_variable_name(ArrayValue(stack)) for stack in self._stack_list]
+        return [self._construct_full_variable_name(stack) for stack in self._stack_list]
 
     @classmethod
     def instantiate_from_csv(cls):
@@ -231,8 +230,8 @@ class StyleParameters:
                 self.stella_run_names), "Number of lines to highlight should match the number of Stella run names."
 
     def _set_colors(self) -> None:
-        """Set the colors variable."""
-        self.colors = self._CB_color_cycle[:len(self.stella_run_names)]
+        """Set the colors variable. Colors repeat when there are more runs than colors in the cycle."""
+        self.colors = [self._CB_color_cycle[i % len(self._CB_color_cycle)] for i in range(len(self.stella_run_names))]
         if self.compare:
             num_style_elems = int(len(self.stella_run_names)/2)
             self.colors = 2*self._CB_color_cycle[:num_style_elems]
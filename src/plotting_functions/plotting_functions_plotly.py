@@ -6,27 +6,49 @@ import pandas as pd
 import os
 import numpy as np
 import textwrap
+from typing import Optional
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from plotly.colors import hex_to_rgb, sample_colorscale, unlabel_rgb
 
 from .plot_parameters import LinePlotParameters, StackPlotParameters, StyleParameters
 
+# Color-blind friendly color cycle: https://gist.github.com/thriveth/8560036
+CB_COLOR_CYCLE_HEX = ['#377eb8', '#ff7f00', '#4daf4a',
+                      '#f781bf', '#a65628', '#984ea3',
+                      '#999999', '#b7121f', '#dede00', '#600FFF']
+
+# Line plots with more points than this in total are drawn with WebGL (go.Scattergl) instead of SVG,
+# which stays responsive for many runs, e.g. "Select all" on a sweep of 100+ runs.
+WEBGL_POINT_THRESHOLD = 2000
+
+def _y_range(values: np.ndarray) -> list[float]:
+    """Y axis range from 0 to the extreme of the values, extended below 0 for negative values (e.g. deltas)."""
+    return [min(0.0, np.nanmin(values)), max(0.0, np.nanmax(values))]
+
+def _scatter_trace_type(num_points: int, webgl_point_threshold: Optional[int]) -> type:
+    """Returns go.Scattergl for plots with more than `webgl_point_threshold` points (None: never), else go.Scatter."""
+    if webgl_point_threshold is not None and num_points > webgl_point_threshold:
+        return go.Scattergl
+    return go.Scatter
+
 def make_lineplot(
     df: pd.DataFrame,
     plot_parameters: LinePlotParameters,
     style_parameters: StyleParameters,
     start_year: int = 2020,
-    end_year: int = 2050) -> go.Figure:
+    end_year: int = 2050,
+    webgl_point_threshold: Optional[int] = WEBGL_POINT_THRESHOLD) -> go.Figure:
     """
-    Helper function to make line plots.
+    Helper function to make line plots. Above `webgl_point_threshold` points, the lines are drawn with WebGL.
     """
     col_names = [f"{run_name}: {plot_parameters._full_variable_name}" \
         for run_name in style_parameters.stella_run_names]
+    scatter = _scatter_trace_type(len(df.loc[start_year:end_year+1]) * len(col_names), webgl_point_threshold)
 
     fig = go.Figure()
     for i, col in enumerate(col_names):
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=np.arange(start_year, end_year+1),
                 y=df.loc[start_year:end_year+1, col],
                 mode="lines",
@@ -37,6 +59,46 @@ def make_lineplot(
                 name=style_parameters.stella_run_names[i]
             )
         )
+    _update_lineplot_layout(fig, plot_parameters, _y_range(df.loc[start_year:end_year+1, col_names].values))
+    return fig
+
+def make_aggregate_lineplot(
+    aggregates: pd.DataFrame,
+    plot_parameters: LinePlotParameters,
+    num_runs: int,
+    start_year: int = 2020,
+    end_year: int = 2050) -> go.Figure:
+    """
+    Helper function to make line plots of the aggregates across runs (see `src.data.run_aggregates`):
+    the min/max envelope and the p5-p95 band as filled areas, and the median as a line.
+    """
+    aggregates = aggregates.loc[start_year:end_year]
+    years = aggregates.index.to_numpy()
+    band_color = CB_COLOR_CYCLE_HEX[0]
+
+    fig = go.Figure()
+    for lower, upper, name, alpha in [("min", "max", "min-max", 0.15), ("p5", "p95", "p5-p95", 0.35)]:
+        fill_color = f"rgba{(*hex_to_rgb(band_color), alpha)}"
+        fig.add_trace(
+            go.Scatter(
+                x=years, y=aggregates[lower], mode="lines", line=dict(width=0),
+                legendgroup=name, showlegend=False, hoverinfo="skip"))
+        fig.add_trace(
+            go.Scatter(
+                x=years, y=aggregates[upper], mode="lines", line=dict(width=0),
+                fill="tonexty", fillcolor=fill_color, legendgroup=name, name=name))
+    fig.add_trace(
+        go.Scatter(
+            x=years, y=aggregates["p50"], mode="lines",
+            line=dict(color=band_color, width=3), name=f"median of {num_runs} runs"))
+    fig.update_layout(hovermode="x unified")
+
+    _update_lineplot_layout(
+        fig, plot_parameters, _y_range(aggregates[["min", "max"]].to_numpy()))
+    return fig
+
+def _update_lineplot_layout(fig: go.Figure, plot_parameters: LinePlotParameters, y_range: list[float]) -> None:
+    """Applies the layout, tag and y axis range shared by the line plots."""
     fig.update_layout(
         template="simple_white",
         width=700,
@@ -61,7 +123,7 @@ def make_lineplot(
             showgrid=True,
             tickformat=".2f" if plot_parameters.decimal else "",
             title=dict(standoff=5),
-            range=[0.0, np.max(df.loc[start_year:end_year+1, col_names].values)]
+            range=y_range
         ),
         legend_title_text=None,
         legend=dict(
@@ -77,19 +139,21 @@ def make_lineplot(
                     text=plot_parameters.tag, showarrow=False, align="center")
 
     if plot_parameters.max_yval:
-        fig.update_layout(yaxis=dict(range=[0.0, plot_parameters.max_yval]))
-
-    return fig
+        fig.update_layout(yaxis=dict(range=[y_range[0], plot_parameters.max_yval]))
 
 def make_comparative_lineplots(
         df: pd.DataFrame,
         plot_parameters: LinePlotParameters,
         style_parameters: StyleParameters,
         start_year:int = 2020,
-        end_year:int = 2050) -> go.Figure:
+        end_year:int = 2050,
+        webgl_point_threshold: Optional[int] = WEBGL_POINT_THRESHOLD) -> go.Figure:
     """
-    Helper function to make comparative subplots.
+    Helper function to make comparative subplots. Above `webgl_point_threshold` points in total, the
+    lines are drawn with WebGL.
     """
+    # plotly.subplots is imported on first use, as it is not needed to start the app.
+    from plotly.subplots import make_subplots
 
     fig = make_subplots(
         rows=1, 
@@ -101,13 +165,15 @@ def make_comparative_lineplots(
 
     col_names = [f"{stella_run}: {plot_parameters._full_variable_name}" \
         for stella_run in style_parameters.stella_run_names]
+    scatter = _scatter_trace_type(len(df.loc[start_year:end_year+1]) * len(col_names), webgl_point_threshold)
+    y_range = _y_range(df.loc[start_year:end_year+1, col_names].values)
     for i, col in enumerate(col_names):
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=np.arange(start_year, end_year+1),
                 y=df.loc[start_year:end_year+1, col],
                 mode="lines",
-                line=go.scatter.Line(color="black", width=3),
+                line=dict(color="black", width=3),
                 name=style_parameters.stella_run_names[i]
             ),
             row=1, col=i+1
@@ -115,10 +181,10 @@ def make_comparative_lineplots(
         fig.update_xaxes(showgrid=False, row=1, col=i+1)
         fig.update_yaxes(
             showgrid=False, 
-            range=[0.0, np.max(df.loc[start_year:end_year+1, col_names].values)],
+            range=y_range,
             row=1, col=i+1)
         if plot_parameters.max_yval:
-            fig.update_yaxes(range=[0.0, plot_parameters.max_yval])
+            fig.update_yaxes(range=[y_range[0], plot_parameters.max_yval])
     
     fig.update_layout(
         template="simple_white",
@@ -151,6 +217,17 @@ def make_comparative_lineplots(
                     text=plot_parameters.tag, showarrow=False, align="center")
     return fig
 
+def _stack_fill_colors(num_colors: int, alpha: float) -> list[str]:
+    """
+    Returns rgba fill colors for a stack plot. Uses the color-blind friendly cycle where it is long
+    enough and samples a continuous colorscale for dimensions with many members (e.g. ProjectYear).
+    """
+    if num_colors <= len(CB_COLOR_CYCLE_HEX):
+        rgb_colors = [hex_to_rgb(color) for color in CB_COLOR_CYCLE_HEX[:num_colors]]
+    else:
+        rgb_colors = [unlabel_rgb(color) for color in sample_colorscale("Turbo", np.linspace(0.0, 1.0, num_colors))]
+    return [f"rgba({int(r)}, {int(g)}, {int(b)}, {alpha})" for r, g, b in rgb_colors]
+
 def make_stackplot(df: pd.DataFrame,
                    plot_parameters: StackPlotParameters,
                    run_name: str,
@@ -159,27 +236,43 @@ def make_stackplot(df: pd.DataFrame,
                    alpha: float = 0.8) -> go.Figure:
     """
     Makes a stack plot of given variables.
+
+    The series of all members of the last array dimension are extracted in a single 2-D slice and
+    stacked on the server with one cumulative sum, so the figure does not rely on Plotly's
+    client-side stacking. Members missing from the dataframe are skipped.
     """
-    CB_color_cycle_hex = ['#377eb8', '#ff7f00', '#4daf4a',
-                      '#f781bf', '#a65628', '#984ea3',
-                      '#999999', '#b7121f', '#dede00', '#600FFF']
-    CB_color_cycle_rgb = [(55, 126, 184), (255, 127, 0), (77, 175, 74),
-                        (247, 129, 191), (166, 86, 40), (152, 78, 163),
-                        (153, 153, 153), (183, 18, 31), (222, 222, 0), (96, 15, 255)]
+    col_names = pd.Index(
+        [f"{run_name}: {variable_name}" for variable_name in plot_parameters._stack_variable_names])
+    is_present = col_names.isin(df.columns)
+    if not is_present.any():
+        raise KeyError(f"None of the stack plot columns for {run_name} are present in the data.")
+    stack_names = [name for name, present in zip(plot_parameters._stack_list, is_present) if present]
 
-    col_names = [
-        f"{run_name}: {variable_name}" for variable_name in plot_parameters._stack_variable_names]
+    selected_data = df.loc[start_year:end_year, col_names[is_present]]
+    years = selected_data.index.to_numpy()
+    values = np.nan_to_num(selected_data.to_numpy(dtype=float))
+    stacked_values = np.cumsum(values, axis=1)
 
+    # Annual data only needs the first year and a step instead of a copy of the years per trace.
+    if len(years) > 1 and np.all(np.diff(years) == 1):
+        x_kwargs = dict(x0=int(years[0]), dx=1)
+    else:
+        x_kwargs = dict(x=years)
+
+    fill_colors = _stack_fill_colors(len(stack_names), alpha)
     fig = go.Figure()
-    for i, col in enumerate(col_names):
+    for i, stack_name in enumerate(stack_names):
         fig.add_trace(
             go.Scatter(
-                x=np.arange(start_year, end_year+1),
-                y=df.loc[start_year:end_year+1, col],
-                line=dict(width=0, color=CB_color_cycle_hex[i]),
-                fillcolor=f"rgba({CB_color_cycle_rgb[i][0]}, {CB_color_cycle_rgb[i][1]}, {CB_color_cycle_rgb[i][2]}, {alpha})" ,
-                stackgroup="one",
-                name=plot_parameters._stack_list[i]
+                **x_kwargs,
+                y=stacked_values[:, i],
+                customdata=values[:, i],
+                mode="lines",
+                line=dict(width=0),
+                fill="tozeroy" if i == 0 else "tonexty",
+                fillcolor=fill_colors[i],
+                hovertemplate="%{customdata}",
+                name=stack_name
             )
         )
     
@@ -208,6 +301,7 @@ def make_stackplot(df: pd.DataFrame,
             tickformat=".2f" if plot_parameters.decimal else "",
             title=dict(standoff=5)
         ),
+        hovermode="x unified",
         legend_title_text=None,
         legend=dict(
             orientation="h",
@@ -221,6 +315,9 @@ def make_stackplot(df: pd.DataFrame,
         fig.add_annotation(
                     x=1.0, y=-0.45, xref="paper", yref="paper", 
                     text=plot_parameters.tag, showarrow=False, align="center")
+
+    if plot_parameters.max_yval:
+        fig.update_layout(yaxis=dict(range=[0.0, plot_parameters.max_yval]))
     
     return fig
 
@@ -237,12 +334,3 @@ def make_stackplots_from_list(df: pd.DataFrame,
                 plot_parameters=plot_params,
                 run_name=stella_run
             )
-
-def fix_col_names(df:pd.DataFrame) -> None:
-    """
-    Removes "=" and " that are inserted into the names of some LIBRA variables.
-    """
-    col_names_to_change = df.columns[df.columns.str.startswith("=")].tolist()
-    changed_col_names = [col.replace("=", "") for col in col_names_to_change]
-    changed_col_names = [col.replace("\"", "") for col in changed_col_names]
-    df.rename(columns=dict(zip(col_names_to_change, changed_col_names)), inplace=True)
\ No newline at end of file
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from src.data.dataset_store import Dataset
+from src.data.delta_engine import DeltaMode
+
+
+def _outputs(columns: list[str], years: range) -> pd.DataFrame:
+    return pd.DataFrame({col: np.ones(len(years)) for col in columns}, index=pd.Index(years, name="Years"))
+
+
+def test_appended_runs_covering_other_years_are_sorted_by_year():
+    dataset = Dataset(df=_outputs(["baseline: Minerals Market.price[Li]"], range(2015, 2051)))
+
+    dataset.append(_outputs(["high demand: Minerals Market.price[Li]"], range(2010, 2051)))
+
+    assert dataset.frame().index.tolist() == list(range(2010, 2051))
+    assert dataset.get_columns(["baseline: Minerals Market.price[Li]"]).loc[2015:2051].notna().all().all()
+
+
+def test_append_updates_cached_dimension_aggregates():
+    dataset = Dataset(df=_outputs(["baseline: Battery Market.demand[US, LFP]"], range(2015, 2051)))
+    aggregated = ["baseline: Battery Market.demand[US, All (sum)]"]
+    assert (dataset.get_columns(aggregated) == 1).all().all()
+
+    dataset.append(_outputs(["baseline: Battery Market.demand[US, NMC811]"], range(2015, 2051)))
+
+    assert (dataset.get_columns(aggregated) == 2).all().all()
+
+
+def test_dimension_aggregates_of_delta_runs():
+    years = pd.Index(range(2015, 2051), name="Years")
+    dataset = Dataset(df=pd.DataFrame({
+        "baseline: Battery Market.demand[US, LFP]": np.full(len(years), 1.0),
+        "baseline: Battery Market.demand[US, NMC811]": np.full(len(years), 3.0),
+        "high demand: Battery Market.demand[US, LFP]": np.full(len(years), 2.0),
+        "high demand: Battery Market.demand[US, NMC811]": np.full(len(years), 6.0),
+    }, index=years))
+    difference, = dataset.get_virtual_run_names("baseline", DeltaMode.DIFFERENCE)
+    ratio, = dataset.get_virtual_run_names("baseline", DeltaMode.RATIO)
+
+    df = dataset.get_columns([f"{difference}: Battery Market.demand[US, All (sum)]",
+                              f"{ratio}: Battery Market.demand[US, All (mean)]"])
+
+    assert df.iloc[:, 0].tolist() == [4.0] * len(years)
+    assert df.iloc[:, 1].tolist() == [2.0] * len(years)
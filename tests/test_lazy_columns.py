@@ -0,0 +1,57 @@
+from threading import Event, Thread
+
+import numpy as np
+import pandas as pd
+
+from src.data import lazy_columns
+from src.data.lazy_columns import LazyCSVColumns
+
+
+class UnparsedCSVColumns(LazyCSVColumns):
+    """Lazy columns whose background parse never finishes, so that columns are read on their own."""
+
+    def _parse(self, engine: str) -> None:
+        pass
+
+
+def _decoded_csv() -> bytes:
+    years = pd.Index(range(2015, 2051), name="Years")
+    df = pd.DataFrame({f"baseline: Minerals Market.price[{mineral}]": np.arange(len(years), dtype=float)
+                       for mineral in ["Li", "Co", "Ni"]}, index=years)
+    return df.to_csv().encode()
+
+
+def test_columns_are_read_before_the_file_is_parsed():
+    columns = UnparsedCSVColumns.from_csv(_decoded_csv())
+
+    df = columns.get_columns(["baseline: Minerals Market.price[Co]", "baseline: Minerals Market.price[Li]"])
+
+    assert list(df.columns) == ["baseline: Minerals Market.price[Co]", "baseline: Minerals Market.price[Li]"]
+    assert df.index.tolist() == list(range(2015, 2051))
+    assert df["baseline: Minerals Market.price[Co]"].tolist() == list(range(36))
+    assert not columns.parsed
+
+
+def test_nbytes_does_not_wait_for_columns_being_read(monkeypatch):
+    columns = UnparsedCSVColumns.from_csv(_decoded_csv())
+    reading, release = Event(), Event()
+    read_csv = pd.read_csv
+
+    def slow_read_csv(*args, **kwargs):
+        reading.set()
+        release.wait(5)
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(lazy_columns.pd, "read_csv", slow_read_csv)
+    reader = Thread(target=columns.get_columns, args=(["baseline: Minerals Market.price[Li]"],))
+    reader.start()
+    assert reading.wait(5)
+    try:
+        nbytes = []
+        measure = Thread(target=lambda: nbytes.append(columns.nbytes))
+        measure.start()
+        measure.join(1)
+        assert nbytes and nbytes[0] > 0
+    finally:
+        release.set()
+        reader.join()
@@ -0,0 +1,36 @@
+import base64
+
+import numpy as np
+import pandas as pd
+
+from src.data.multi_file_loader import load_uploads
+
+
+def _upload_contents(df: pd.DataFrame) -> str:
+    return "data:text/csv;base64," + base64.b64encode(df.to_csv().encode()).decode()
+
+
+def _outputs(run_name: str, years: range) -> pd.DataFrame:
+    return pd.DataFrame({f"{run_name}: Minerals Market.price[Li]": np.arange(len(years), dtype=float)},
+                        index=pd.Index(years, name="Years"))
+
+
+def test_files_covering_different_years_are_merged_on_sorted_years():
+    contents = [_upload_contents(_outputs("baseline", range(2015, 2051))),
+                _upload_contents(_outputs("high demand", range(2010, 2051)))]
+
+    df = load_uploads(contents, ["baseline.csv", "high demand.csv"])
+
+    assert df.index.is_monotonic_increasing
+    assert df.index.tolist() == list(range(2010, 2051))
+    assert df.loc[2010:2014, "baseline: Minerals Market.price[Li]"].isna().all()
+    assert df.loc[2015:2051, "baseline: Minerals Market.price[Li]"].tolist() == list(range(36))
+
+
+def test_files_sharing_a_name_are_all_kept():
+    contents = [_upload_contents(_outputs("baseline", range(2015, 2051))),
+                _upload_contents(_outputs("high demand", range(2015, 2051)))]
+
+    df = load_uploads(contents, ["outputs.csv", "outputs.csv"])
+
+    assert list(df.columns) == ["baseline: Minerals Market.price[Li]", "high demand: Minerals Market.price[Li]"]
@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_data import SyntheticLIBRAOutputs
+from src.data.preprocess_data import read_csv
+
+
+@pytest.mark.parametrize("stella_quoting", [False, True])
+def test_arrow_engine_parses_the_frame_of_the_pandas_engine(stella_quoting):
+    pytest.importorskip("pyarrow")
+    outputs = SyntheticLIBRAOutputs(num_runs=2, variables_per_module=4, stella_quoting=stella_quoting)
+    decoded = outputs.to_csv().encode()
+
+    pd.testing.assert_frame_equal(
+        read_csv(decoded, "arrow"), read_csv(decoded, "pandas"), check_exact=True, check_column_type=True)
+
+
+def test_arrow_engine_parses_empty_cells_like_the_pandas_engine():
+    pytest.importorskip("pyarrow")
+    decoded = b"Years,baseline: Minerals Market.price[Li],baseline: LDV.sales[BEV]\n2015,1.5,\n2016,,2\n2017,0.1,3\n"
+
+    pd.testing.assert_frame_equal(
+        read_csv(decoded, "arrow"), read_csv(decoded, "pandas"), check_exact=True, check_column_type=True)
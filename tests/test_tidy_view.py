@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from src.data.tidy_view import TidyView, build_column_index
+
+
+def _view() -> TidyView:
+    df = pd.DataFrame({
+        "baseline: LDV.sales": [1.0, 2.0],
+        "baseline: LDV.sales[BEV]": [1.0, 1.0],
+        "baseline: LDV.stock[BEV]": [2.0, 2.0],
+        "baseline: Minerals Market.price[Li]": [7.0, 7.0],
+        "high demand: LDV.sales": [5.0, 5.0],
+    }, index=pd.Index([2015, 2016], name="Years"))
+    return TidyView(df, build_column_index(df.columns))
+
+
+def test_group_by_keeps_variables_without_array_values():
+    grouped = _view().filter(module="LDV").group_by(["run", "dim1"])
+
+    assert grouped.columns.tolist()[0] == ("baseline", "BEV")
+    assert grouped[("baseline", "BEV")].tolist() == [3.0, 3.0]
+    assert [run for run, dim1 in grouped.columns if pd.isna(dim1)] == ["baseline", "high demand"]
+    assert grouped.iloc[:, 1].tolist() == [1.0, 2.0]
+    assert grouped.iloc[:, 2].tolist() == [5.0, 5.0]
+
+
+def test_group_by_run_sums_every_variable():
+    grouped = _view().group_by("run")
+
+    assert grouped.to_dict("list") == {"baseline": [11.0, 12.0], "high demand": [5.0, 5.0]}
+
+
+def test_group_by_mean_ignores_missing_values():
+    view = _view()
+    view.df.iloc[0, 1] = np.nan
+
+    grouped = view.filter(module="LDV", dim1="BEV").group_by("variable", "mean")
+
+    assert grouped["sales"].isna().tolist() == [True, False]
+    assert grouped.loc[2016, "sales"] == 1.0
+    assert grouped["stock"].tolist() == [2.0, 2.0]
@@ -0,0 +1,24 @@
+from src.data.variable_search_index import VariableSearchIndex
+
+NAMES = [
+    "Battery Market.demand[US, LFP]",
+    "Battery Market.demand[ROW, NCA]",
+    "Minerals Market.price[Li]",
+    "Minerals Market.price[Co]",
+    "LDV.sales[BEV]",
+]
+
+
+def test_array_values_are_found_by_name():
+    index = VariableSearchIndex(NAMES)
+
+    assert index.search("US")[0] == "Battery Market.demand[US, LFP]"
+    assert index.search("Co")[0] == "Minerals Market.price[Co]"
+    assert index.search("Li")[0] == "Minerals Market.price[Li]"
+    assert index.search("NCA")[0] == "Battery Market.demand[ROW, NCA]"
+
+
+def test_variables_are_found_with_typos():
+    index = VariableSearchIndex(NAMES)
+
+    assert index.search("minerl price")[0].startswith("Minerals Market.price")